@@ -2,77 +2,255 @@
 """Run Advent of Code solutions."""
 
 import argparse
-import re
-from importlib import import_module
+import os
+import sys
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-CHALLENGES_DIR = Path(__file__).parent / "src" / "challenges"
+from runner import DayResult, run_day
+from runner.core import CACHE_DIR, format_duration
+from runner.manifest import load_manifest
 
+if TYPE_CHECKING:
+    from runner.bench import BenchConfig
+    from runner.cache import ResultCache
+    from runner.scaling import ScalingConfig
 
-def get_years() -> list[int]:
-    """Get all available years."""
-    if not CHALLENGES_DIR.exists():
-        return []
-    return sorted(int(p.name) for p in CHALLENGES_DIR.iterdir() if p.is_dir() and p.name.isdigit())
 
-
-def get_days(year: int) -> list[int]:
-    """Get all available days for a year."""
-    year_path = CHALLENGES_DIR / str(year)
-    if not year_path.exists():
-        return []
-    return sorted(
-        int(re.search(r"\d+", p.name).group())
-        for p in year_path.iterdir()
-        if p.is_dir() and p.name.startswith("day")
-    )
+def print_result(result: DayResult, *, quiet: bool = False) -> None:
+    """Print the outcome of a single day's solution."""
+    if not quiet:
+        print(f"\n{'=' * 60}")
+        print(f"Day {result.day} - {result.year}{' (cached)' if result.cached else ''}")
+        print(f"{'=' * 60}")
+    if result.error:
+        print(result.error, file=sys.stderr)
+        return
+    for part, answer in sorted(result.answers.items()):
+        print(f"Part {part}: {answer}")
+    if result.timings and not quiet:
+        stages = " | ".join(
+            f"{stage} {format_duration(ns)}" for stage, ns in result.timings.items()
+        )
+        print(f"Time: {stages}")
 
 
-def run_solution(year: int, day: int, *, quiet: bool = False) -> None:
+def run_solution(
+    year: int,
+    day: int,
+    *,
+    parts: Sequence[int] = (1, 2),
+    quiet: bool = False,
+    cache: "ResultCache | None" = None,
+    refresh: bool = False,
+) -> None:
     """Run a specific day's solution by importing its module."""
-    module_path = f"challenges.{year}.day{day:02d}.solution"
-
-    try:
+    result = run_day(year, day, parts=parts, cache=cache, refresh=refresh)
+    if result.error:
         if not quiet:
-            print(f"\n{'=' * 60}")
-            print(f"Day {day} - {year}")
-            print(f"{'=' * 60}")
-        module = import_module(module_path)
-        if hasattr(module, "solve"):
-            # Get the input file path from the module
-            input_file = Path(module.__file__).parent / "input.txt"
-            part1, part2 = module.solve(input_file)
-            print(f"Part 1: {part1}")
-            print(f"Part 2: {part2}")
-    except ModuleNotFoundError as e:
-        msg = f"Solution not found: {module_path}\nError: {e}"
-        raise SystemExit(msg) from e
+            print_result(DayResult(year, day))
+        raise SystemExit(result.error)
+    print_result(result, quiet=quiet)
+
+
+def run_targets(
+    targets: list[tuple[int, int]],
+    *,
+    jobs: int | None = None,
+    parts: Sequence[int] = (1, 2),
+    quiet: bool = False,
+    cache: "ResultCache | None" = None,
+    refresh: bool = False,
+) -> None:
+    """
+    Run several (year, day) targets, printing results in order.
+
+    Without jobs every day runs in this interpreter, one after another. With jobs
+    each day runs in a worker process, so a full run takes about as long as the
+    slowest day. A failing day is reported and the remaining days still run.
+    """
+    if jobs is None:
+        results = (
+            run_day(year, day, parts=parts, cache=cache, refresh=refresh) for year, day in targets
+        )
+    else:
+        from runner.parallel import run_days_parallel  # noqa: PLC0415
+
+        results = run_days_parallel(
+            targets, jobs or None, parts=parts, cache=cache, refresh=refresh
+        )
+
+    failed: list[DayResult] = []
+    for result in results:
+        print_result(result, quiet=quiet)
+        if result.error:
+            failed.append(result)
+
+    if failed:
+        days = ", ".join(f"{result.year} day {result.day}" for result in failed)
+        raise SystemExit(f"\n{len(failed)} of {len(targets)} solutions failed: {days}")
+
+
+def run_bench(
+    targets: list[tuple[int, int]],
+    config: "BenchConfig",
+    json_path: str | None = None,
+    *,
+    parts: Sequence[int] = (1, 2),
+) -> None:
+    """Benchmark each target in this interpreter and print a statistics table."""
+    from runner.bench import bench_day, format_table, to_json  # noqa: PLC0415
+
+    results = [bench_day(year, day, config, parts) for year, day in targets]
+
+    # Keep stdout machine-readable when the JSON goes there
+    print(format_table(results), file=sys.stderr if json_path == "-" else sys.stdout)
+    if json_path == "-":
+        print(to_json(results, config))
+    elif json_path:
+        Path(json_path).write_text(to_json(results, config) + "\n", encoding="utf-8")
+
+    if any(result.error for result in results):
+        raise SystemExit(1)
+
+
+def run_profile(
+    targets: list[tuple[int, int]],
+    *,
+    parts: Sequence[int] = (1, 2),
+    top: int = 15,
+    out_dir: str | None = None,
+) -> None:
+    """Profile each target with cProfile and print its hottest functions."""
+    from runner.profiling import PROFILE_DIR, profile_day, top_functions  # noqa: PLC0415
+
+    for year, day in targets:
+        try:
+            result = profile_day(
+                year, day, parts=parts, out_dir=Path(out_dir) if out_dir else PROFILE_DIR
+            )
+        except ModuleNotFoundError as e:
+            raise SystemExit(f"Solution not found for {year} day {day}\nError: {e}") from e
+
+        print_result(DayResult(year, day, answers=result.answers))
+        print(f"\nTop {top} by cumulative time:")
+        print(top_functions(result.stats, "cumulative", top))
+        print(f"\nTop {top} by self time:")
+        print(top_functions(result.stats, "tottime", top))
+        print(f"\nSaved {result.pstats_file}")
+        print(f"Saved {result.collapsed_file} (collapsed stacks for flamegraph.pl/speedscope)")
+
+
+def run_memory(
+    targets: list[tuple[int, int]],
+    *,
+    parts: Sequence[int] = (1, 2),
+    budget_mb: float | None = None,
+) -> None:
+    """Trace each target's allocations and print per-stage memory reports."""
+    from runner.memory import format_report, measure_day  # noqa: PLC0415
+
+    budget = int(budget_mb * (1 << 20)) if budget_mb is not None else None
+    over_budget = []
+    for year, day in targets:
+        try:
+            result = measure_day(year, day, parts=parts)
+        except ModuleNotFoundError as e:
+            raise SystemExit(f"Solution not found for {year} day {day}\nError: {e}") from e
+
+        print_result(DayResult(year, day, answers=result.answers))
+        print(format_report(result, budget))
+        if budget is not None and result.peak_bytes > budget:
+            over_budget.append(f"{year} day {day}")
 
+    if over_budget:
+        raise SystemExit(f"\nOver the {budget_mb} MiB memory budget: {', '.join(over_budget)}")
 
-def run_year(year: int) -> None:
-    """Run all solutions for a given year."""
-    days = get_days(year)
 
-    if not days:
-        raise SystemExit(f"No solutions found for year {year}")
+def run_scaling(
+    targets: list[tuple[int, int]],
+    config: "ScalingConfig",
+    csv_path: str | None = None,
+    *,
+    parts: Sequence[int] = (1, 2),
+) -> None:
+    """Measure each target across generated input sizes and print its scaling curve."""
+    from runner.scaling import format_table, measure_scaling, to_csv  # noqa: PLC0415
 
-    for day in days:
-        run_solution(year, day)
+    results = []
+    for year, day in targets:
+        print(f"Scaling {year} day {day}...", file=sys.stderr)
+        results.append(measure_scaling(year, day, config, parts))
 
+    # Keep stdout machine-readable when the CSV goes there
+    print(format_table(results), file=sys.stderr if csv_path == "-" else sys.stdout)
+    if csv_path == "-":
+        print(to_csv(results), end="")
+    elif csv_path:
+        Path(csv_path).write_text(to_csv(results), encoding="utf-8")
 
-def run_all() -> None:
-    """Run all solutions for all years."""
-    years = get_years()
+    if any(result.error for result in results):
+        raise SystemExit(1)
 
+
+def run_perf_gate(
+    targets: list[tuple[int, int]], config: "BenchConfig", *, tolerance: float, bless: bool
+) -> None:
+    """Check targets against their stored timing baselines, or re-bless them."""
+    from runner import perf  # noqa: PLC0415
+
+    if bless:
+        perf.bless(targets, config=config)
+        print(f"Blessed {len(targets)} baseline(s) in {perf.BASELINE_FILE}")
+        return
+
+    baselines = perf.load_baselines()
+    failed = []
+    print(f"{'Day':<12} {'Baseline':>10} {'Median':>10} {'Ratio':>7}  Status")
+    for year, day in targets:
+        label = f"{year} {day:02d}"
+        try:
+            check = perf.check_day(year, day, baselines, tolerance=tolerance, config=config)
+        except KeyError:
+            print(f"{label:<12} {'-':>10} {'-':>10} {'-':>7}  no baseline (run --perf-bless)")
+            continue
+        status = "ok" if check.passed else f"REGRESSED (> {1 + tolerance:.2f}x)"
+        print(
+            f"{label:<12} {format_duration(check.baseline_ns):>10} "
+            f"{format_duration(check.median_ns):>10} {check.ratio:>6.2f}x  {status}"
+        )
+        if not check.passed:
+            failed.append(label)
+
+    if failed:
+        raise SystemExit(f"\nPerformance regressed: {', '.join(failed)}")
+
+
+def resolve_targets(args: argparse.Namespace) -> list[tuple[int, int]]:
+    """Turn the year/day/latest arguments into a list of (year, day) targets."""
+    manifest = load_manifest()
+    years = [args.year] if args.year else manifest.years()
     if not years:
         raise SystemExit("No solutions found")
 
-    for year in years:
-        run_year(year)
+    # --latest, or a day without a year, picks from the latest year
+    if args.latest or (args.day and not args.year):
+        years = [max(years)]
 
+    if args.day:
+        return [(years[0], args.day)]
 
-def main() -> None:
-    """Parse arguments and run solutions."""
+    targets = [(year, day) for year in years for day in manifest.days(year)]
+    if not targets:
+        raise SystemExit(f"No solutions found for year {args.year or years[0]}")
+    if args.latest:
+        return targets[-1:]
+    return targets
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Run Advent of Code solutions",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -82,6 +260,23 @@ Examples:
   %(prog)s -y 2025      Run all 2025 solutions
   %(prog)s -y 2025 -d 1 Run day 1 of 2025
   %(prog)s --latest     Run latest solution
+  %(prog)s -d 4 -p 2    Run only part 2 of day 4 of the latest year
+  %(prog)s -y 2025 -j 8 Run all 2025 solutions in 8 worker processes
+  %(prog)s --refresh    Run all solutions, ignoring cached results
+  %(prog)s -d 9 --profile
+                        Profile day 9 of the latest year
+  %(prog)s --profile-diff old.pstats new.pstats
+                        Show which functions got faster or slower
+  %(prog)s -y 2025 --mem --mem-budget 100
+                        Report memory per day and flag days over 100 MiB
+  %(prog)s -y 2025 --scaling --scaling-csv scaling.csv
+                        Fit time and memory exponents on generated inputs
+  %(prog)s -y 2025 --perf-check
+                        Compare timings with the committed baselines
+  %(prog)s -y 2025 -d 4 --perf-bless
+                        Re-bless day 4's baseline after an intentional change
+  %(prog)s -y 2025 --bench --repeat 10 --bench-json bench.json
+                        Benchmark all 2025 solutions
         """,
     )
     parser.add_argument("-y", "--year", type=int, help="Year to run")
@@ -98,35 +293,249 @@ Examples:
         action="store_true",
         help="Suppress headers",
     )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        choices=(1, 2),
+        help="Only run this part (and the parse stage it depends on)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        metavar="N",
+        help="Run each day in a pool of N worker processes (all CPUs if N is omitted)",
+    )
+
+    caching = parser.add_argument_group("caching")
+    caching.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write cached results",
+    )
+    caching.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompute every result and overwrite the cached copy",
+    )
+    caching.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Cache parsed inputs on disk, so warm runs skip parsing (or set AOC_PARSE_CACHE)",
+    )
 
+    bench = parser.add_argument_group("benchmarking")
+    bench.add_argument(
+        "--bench",
+        action="store_true",
+        help="Time repeated runs and report min/median/p95/stdev per stage",
+    )
+    bench.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Untimed runs before measuring (default: 1)",
+    )
+    bench.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Timed runs per day (default: 5)",
+    )
+    bench.add_argument(
+        "--gc",
+        action="store_true",
+        help="Keep the garbage collector enabled during timed runs",
+    )
+    bench.add_argument(
+        "--bench-json",
+        metavar="FILE",
+        help="Also write results as JSON to FILE ('-' for stdout)",
+    )
+
+    profile = parser.add_argument_group("profiling")
+    profile.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under cProfile, print the top functions and save .pstats/.folded files",
+    )
+    profile.add_argument(
+        "--profile-top",
+        type=int,
+        default=15,
+        metavar="N",
+        help="Number of functions to list per table (default: 15)",
+    )
+    profile.add_argument(
+        "--profile-dir",
+        metavar="DIR",
+        help="Where to save profiles (default: .aoc_cache/profiles)",
+    )
+    profile.add_argument(
+        "--profile-diff",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="Compare two saved .pstats files and exit",
+    )
+
+    memory = parser.add_argument_group("memory")
+    memory.add_argument(
+        "--mem",
+        action="store_true",
+        help="Trace allocations and report peak/net memory per day and stage",
+    )
+    memory.add_argument(
+        "--mem-budget",
+        type=float,
+        metavar="MB",
+        help="Flag days whose traced peak exceeds MB mebibytes, and exit non-zero",
+    )
+
+    scaling = parser.add_argument_group("scaling")
+    scaling.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Time and trace memory across growing generated inputs and fit complexity exponents",
+    )
+    scaling.add_argument(
+        "--scaling-steps",
+        type=int,
+        default=6,
+        metavar="N",
+        help="Number of input sizes per day (default: 6)",
+    )
+    scaling.add_argument(
+        "--scaling-factor",
+        type=int,
+        default=2,
+        metavar="F",
+        help="Ratio between consecutive input sizes (default: 2)",
+    )
+    scaling.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        metavar="S",
+        help="Stop growing a day once one size takes longer than this (default: 10)",
+    )
+    scaling.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    scaling.add_argument(
+        "--scaling-csv", metavar="PATH", help="Also write every point as CSV ('-' for stdout)"
+    )
+
+    gate = parser.add_argument_group("performance regression gate")
+    gate.add_argument(
+        "--perf-check",
+        action="store_true",
+        help="Fail if a day's median is slower than its committed baseline beyond tolerance",
+    )
+    gate.add_argument(
+        "--perf-bless",
+        action="store_true",
+        help="Re-measure and store the selected days' baselines after an intentional change",
+    )
+    gate.add_argument(
+        "--perf-tolerance",
+        type=float,
+        metavar="FRACTION",
+        help="Allowed slowdown before failing, e.g. 0.25 for 25%% (default: $AOC_PERF_TOLERANCE or 0.25)",
+    )
+
+    return parser
+
+
+def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject option values and combinations that cannot run together."""
+    if args.jobs is not None and args.jobs < 0:
+        parser.error("--jobs must be a positive number")
+    if args.warmup < 0 or args.repeat < 1:
+        parser.error("--warmup must be >= 0 and --repeat must be >= 1")
+    if args.scaling_steps < 1 or args.scaling_factor < 2:
+        parser.error("--scaling-steps must be >= 1 and --scaling-factor must be >= 2")
+
+    modes = [
+        flag
+        for flag in ("bench", "profile", "mem", "scaling", "perf_check", "perf_bless")
+        if getattr(args, flag)
+    ]
+    if len(modes) > 1 or (modes and args.jobs is not None):
+        parser.error(
+            "--bench, --profile, --mem, --scaling and --perf-* run in-process "
+            "and are mutually exclusive"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run solutions."""
+    parser = build_parser()
     args = parser.parse_args()
 
-    # Handle --latest flag
-    if args.latest:
-        years = get_years()
-        if not years:
-            raise SystemExit("No solutions found")
-        year = max(years)
-        days = get_days(year)
-        if not days:
-            raise SystemExit(f"No solutions found for year {year}")
-        day = max(days)
-        run_solution(year, day, quiet=args.quiet)
+    validate_args(parser, args)
+
+    if args.profile_diff:
+        from runner.profiling import diff_profiles  # noqa: PLC0415
+
+        print(diff_profiles(*map(Path, args.profile_diff), limit=args.profile_top))
         return
 
-    # Handle year and day arguments
-    if args.year and args.day:
-        run_solution(args.year, args.day, quiet=args.quiet)
-    elif args.year:
-        run_year(args.year)
-    elif args.day:
-        # Day without year: use latest year
-        years = get_years()
-        if not years:
-            raise SystemExit("No solutions found")
-        run_solution(max(years), args.day, quiet=args.quiet)
+    targets = resolve_targets(args)
+    if args.parse_cache:
+        # Set in the environment so worker processes inherit it too
+        os.environ.setdefault("AOC_PARSE_CACHE", str(CACHE_DIR / "parsed"))
+    parts = (args.part,) if args.part else (1, 2)
+
+    cache = None
+    if not args.no_cache:
+        from runner.cache import ResultCache  # noqa: PLC0415
+
+        cache = ResultCache()
+
+    if args.perf_check or args.perf_bless:
+        from runner.bench import BenchConfig  # noqa: PLC0415
+        from runner.perf import DEFAULT_TOLERANCE  # noqa: PLC0415
+
+        run_perf_gate(
+            targets,
+            BenchConfig(warmup=args.warmup, repeats=args.repeat, gc_enabled=args.gc),
+            tolerance=DEFAULT_TOLERANCE if args.perf_tolerance is None else args.perf_tolerance,
+            bless=args.perf_bless,
+        )
+    elif args.scaling:
+        from runner.scaling import ScalingConfig  # noqa: PLC0415
+
+        config = ScalingConfig(
+            factor=args.scaling_factor,
+            steps=args.scaling_steps,
+            repeats=args.repeat,
+            seed=args.seed,
+            max_seconds=args.max_seconds,
+        )
+        run_scaling(targets, config, args.scaling_csv, parts=parts)
+    elif args.mem:
+        run_memory(targets, parts=parts, budget_mb=args.mem_budget)
+    elif args.profile:
+        run_profile(targets, parts=parts, top=args.profile_top, out_dir=args.profile_dir)
+    elif args.bench:
+        from runner.bench import BenchConfig  # noqa: PLC0415
+
+        config = BenchConfig(warmup=args.warmup, repeats=args.repeat, gc_enabled=args.gc)
+        run_bench(targets, config, args.bench_json, parts=parts)
+    elif len(targets) == 1:
+        run_solution(*targets[0], parts=parts, quiet=args.quiet, cache=cache, refresh=args.refresh)
     else:
-        run_all()
+        run_targets(
+            targets,
+            jobs=args.jobs,
+            parts=parts,
+            quiet=args.quiet,
+            cache=cache,
+            refresh=args.refresh,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic Advent of Code input at an arbitrary scale.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from random import Random
+
+from runner.synthetic import load_generator, write_input
+
+
+def main() -> None:
+    """Parse arguments and write the generated input."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip(),
+        epilog="Example: python scripts/generate.py 2025 1 1000000 --seed 7 -o big.txt",
+    )
+    parser.add_argument("year", type=int, help="Puzzle year")
+    parser.add_argument("day", type=int, help="Puzzle day")
+    parser.add_argument("size", type=int, help="Scale, as defined by the day's generator")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("-o", "--output", type=Path, help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    if args.size < 1:
+        parser.error("size must be positive")
+
+    try:
+        if args.output:
+            write_input(args.year, args.day, args.size, args.output, seed=args.seed)
+        else:
+            generate = load_generator(args.year, args.day)
+            for line in generate(args.size, Random(args.seed)):
+                sys.stdout.write(line + "\n")
+    except ModuleNotFoundError:
+        print(f"Error: no generator for {args.year} day {args.day}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
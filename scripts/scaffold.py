@@ -42,27 +42,51 @@ from challenges.constants import INPUT_FILE
 from utils import read_lines
 
 
-def solve(filepath: Path) -> tuple[int, int]:
-    """Solve both parts given an input file."""
-    _lines = read_lines(filepath)
+def parse(filepath: Path) -> list[str]:
+    """Parse the input file; the result is shared by both parts."""
+    return read_lines(filepath)
+
 
-    # Part 1 solution
-    part1 = 0
+def part1(_lines: list[str]) -> int:
+    """Part 1 solution."""
+    return 0
 
-    # Part 2 solution
-    part2 = 0
 
-    return part1, part2
+def part2(_lines: list[str]) -> int:
+    """Part 2 solution."""
+    return 0
+
+
+def solve(filepath: Path) -> tuple[int, int]:
+    """Solve both parts given an input file."""
+    lines = parse(filepath)
+    return part1(lines), part2(lines)
 
 
 if __name__ == "__main__":
-    part1, part2 = solve(INPUT_FILE)
+    answer1, answer2 = solve(INPUT_FILE)
 
-    print(f"Part 1: {{part1}}")
-    print(f"Part 2: {{part2}}")
+    print(f"Part 1: {{answer1}}")
+    print(f"Part 2: {{answer2}}")
 '''
         solution_file.write_text(solution_template)
 
+    # Create generator.py with template
+    generator_file = day_dir / "generator.py"
+    if not generator_file.exists():
+        generator_template = f'''"""Synthetic inputs for Day {day}: [input format]."""
+
+from collections.abc import Iterator
+from random import Random
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Generate the lines of a valid input; document what size counts."""
+    for _ in range(size):
+        yield str(rng.randint(1, 100))
+'''
+        generator_file.write_text(generator_template)
+
     # Create test_solution.py with template
     test_file = day_dir / "test_solution.py"
     if not test_file.exists():
@@ -83,6 +107,7 @@ def test_example(example_file):
     print(f"  - {example_file.name}")
     print(f"  - {input_file.name}")
     print(f"  - {solution_file.name}")
+    print(f"  - {generator_file.name}")
     print(f"  - {test_file.name}")
     print("\nNext steps:")
     print(f"  1. Add example input to {example_file}")
@@ -0,0 +1,13 @@
+"""Synthetic inputs for Day 1: one rotation per line, like L68 or R48."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from this many rotations
+BASE_SIZE = 1000
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Generate size rotations of 1-999 clicks, so some wrap the dial several times."""
+    for _ in range(size):
+        yield f"{rng.choice('LR')}{rng.randint(1, 999)}"
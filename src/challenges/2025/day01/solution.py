@@ -3,10 +3,30 @@ Advent of Code 2025 - Day 1: Safe Dial
 Counts how many times a dial points at zero during rotations.
 """
 
+import io
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import reduce
+from itertools import accumulate, repeat
 from pathlib import Path
 
-from utils import read_lines
+from utils import MappedFile, ints, iter_lines, line_ranges, parse_records
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rotations are parsed into a direction column and a distance column
+ROTATION_SCHEMA = "{direction:c}{distance:d}"
+Rotations = dict[str, Sequence]
+POSITIONS = 100
+# Bytes of rotation log each worker summarises at a time
+PARALLEL_CHUNK_SIZE = 1 << 24
+# Smaller logs are solved in one process, as starting workers would cost more than it saves
+PARALLEL_MIN_BYTES = 2 * PARALLEL_CHUNK_SIZE
 
 
 @dataclass(frozen=True)
@@ -61,12 +81,12 @@ def parse_rotation(line: str) -> Rotation:
     return Rotation(direction, int(line[1:]))
 
 
-def count_zeros(rotations: list[Rotation], count_during_rotation: bool) -> int:
+def count_zeros(rotations: Iterable[Rotation], count_during_rotation: bool) -> int:
     """
     Count times dial points at zero.
 
     Args:
-        rotations: List of rotation instructions
+        rotations: Rotation instructions, consumed in a single pass
         count_during_rotation: If True, count zeros during movement; if False, only at end positions
     """
     dial = Dial()
@@ -81,16 +101,271 @@ def count_zeros(rotations: list[Rotation], count_during_rotation: bool) -> int:
     return count
 
 
+def iter_rotations(filepath: Path) -> Iterator[Rotation]:
+    """Stream rotations from an input file, or stdin for "-", one line at a time."""
+    return (parse_rotation(line) for line in iter_lines(filepath))
+
+
+def _checked(rotations: Rotations) -> Rotations:
+    """Reject parsed columns with a direction other than L or R."""
+    if invalid := set(rotations["direction"].tolist()) - {"L", "R"}:
+        raise ValueError(f"Invalid direction: {min(invalid)}")
+    return rotations
+
+
+def _parse_bytes(buffer: bytes | memoryview) -> Rotations | None:
+    """
+    Parse rotations from raw bytes with whole-array operations.
+
+    Only plain logs are accepted: one rotation per line, L or R straight
+    before its digits, and nothing else but spaces, tabs and line endings.
+
+    Returns:
+        The parsed columns, or None for any other input, for parse_records to
+        parse or reject with a precise error
+    """
+    data = np.frombuffer(buffer, np.uint8)
+    digit = (data - ord("0")) < 10
+    letter = (data == ord("L")) | (data == ord("R"))
+    newline = data == ord("\n")
+    carriage_return = data == ord("\r")
+    blank = (data == ord(" ")) | (data == ord("\t"))
+    if not (digit | letter | newline | carriage_return | blank).all():
+        return None
+    after_returns = np.flatnonzero(carriage_return) + 1
+    if not newline[after_returns[after_returns < len(data)]].all():
+        return None
+
+    # Pairing every letter with the digit run straight after it, and every run
+    # with a letter, leaves each letter on its own line as the only thing to check
+    letters = np.flatnonzero(letter)
+    run_starts = np.flatnonzero(np.diff(digit.view(np.int8), prepend=np.int8(0)) == 1)
+    if len(run_starts) != len(letters) or (run_starts - letters != 1).any():
+        return None
+    # Without spaces and tabs, every letter but a first one follows a line end
+    visible = data[~blank]
+    later_letters = np.flatnonzero((visible[1:] == ord("L")) | (visible[1:] == ord("R")))
+    if not (visible[later_letters] == ord("\n")).all():
+        return None
+
+    directions = data[letters].astype(np.uint32).view("<U1")
+    return {"direction": directions, "distance": ints(buffer)}
+
+
+def parse(filepath: Path) -> Rotations:
+    """
+    Parse all rotations from an input file into columns.
+
+    With NumPy, a plain log is parsed straight from the mapped file's bytes;
+    anything else, and stdin, goes through parse_records.
+
+    Raises:
+        ValueError: If a line is not a rotation or its direction is not L or R
+    """
+    if np is not None and Path(filepath).is_file():
+        with MappedFile(filepath) as mapped:
+            rotations = _parse_bytes(mapped.view)
+        if rotations is not None:
+            return rotations
+    return _checked(parse_records(filepath, ROTATION_SCHEMA))
+
+
+def rotations_of(rotations: Rotations) -> Iterator[Rotation]:
+    """Iterate over parsed columns as Rotation instructions, one at a time."""
+    return map(Rotation, rotations["direction"].tolist(), rotations["distance"].tolist())
+
+
+def dial_zeros(rotations: Rotations, start: int = 50) -> tuple[int, int]:
+    """
+    Count zeros for both parts in one pass over the parsed columns.
+
+    Positions are kept unwrapped, as start plus the running sum of signed
+    distances, so a rotation passes zero once for every multiple of 100 it
+    crosses: ends // 100 - starts // 100 turning right, and the same shifted
+    by one turning left, where the start itself is excluded instead of the
+    end. As in Dial.rotate, a rotation by a multiple of 100 that starts at
+    zero counts one zero more.
+
+    Returns:
+        Rotations ending at zero, and every time the dial points at zero
+    """
+    directions, distances = rotations["direction"], rotations["distance"]
+    if np is not None and isinstance(distances, np.ndarray):
+        # Comparing one-character strings as their code points is much faster
+        right = directions.view(np.uint32) == ord("R")
+        ends = start + np.cumsum(np.where(right, distances, -distances))
+        # Hundreds at or below, and strictly below, each end; they differ exactly at zero
+        at_or_below, below = ends // 100, (ends - 1) // 100
+        start_at_or_below = np.concatenate(([start // 100], at_or_below[:-1]))
+        start_below = np.concatenate(([(start - 1) // 100], below[:-1]))
+        passed = np.where(right, at_or_below - start_at_or_below, start_below - below).sum()
+        from_zero = np.flatnonzero(start_at_or_below != start_below)
+        repeats = np.count_nonzero(distances[from_zero] % 100 == 0)
+        return int(np.count_nonzero(at_or_below != below)), int(passed) + int(repeats)
+
+    at_zero = passed = 0
+    position = start
+    for direction, distance in zip(directions, distances, strict=True):
+        if direction == "R":
+            end = position + distance
+            passed += end // 100 - position // 100
+        else:
+            end = position - distance
+            passed += (position - 1) // 100 - (end - 1) // 100
+        if position % 100 == 0 and distance % 100 == 0:
+            passed += 1
+        at_zero += end % 100 == 0
+        position = end
+    return at_zero, passed
+
+
+@dataclass(frozen=True)
+class DialTransform:
+    """
+    What a run of rotations does, for every position the dial could start at.
+
+    The run moves the dial by net in total, so from start s it ends at
+    (s + net) % 100, and at_zero[s] and passed[s] are the zeros it counts for
+    part 1 and part 2. Transforms of consecutive runs combine with then,
+    which is associative, so a log can be summarised in independent chunks.
+    """
+
+    net: int
+    at_zero: tuple[int, ...]
+    passed: tuple[int, ...]
+
+    def then(self, other: "DialTransform") -> "DialTransform":
+        """Follow this run with another, the second starting where the first ends."""
+        shift = self.net % POSITIONS
+
+        def combine(first: tuple[int, ...], second: tuple[int, ...]) -> tuple[int, ...]:
+            return tuple(
+                count + second[(start + shift) % POSITIONS] for start, count in enumerate(first)
+            )
+
+        return DialTransform(
+            self.net + other.net,
+            combine(self.at_zero, other.at_zero),
+            combine(self.passed, other.passed),
+        )
+
+    def apply(self, start: int = 50) -> tuple[int, int]:
+        """Get the zeros counted for both parts when the run starts at start."""
+        return self.at_zero[start % POSITIONS], self.passed[start % POSITIONS]
+
+
+IDENTITY = DialTransform(0, (0,) * POSITIONS, (0,) * POSITIONS)
+
+
+def dial_transform(rotations: Rotations) -> DialTransform:
+    """
+    Summarise parsed rotations as a transform of the start position.
+
+    This is dial_zeros with the start left symbolic. Positions relative to
+    the start are offsets: a run from offset a to offset b, started at s,
+    ends at zero when (s + b) % 100 == 0, and passes zero a number of times
+    made of terms floor((s + x) / 100) for its offsets. Writing x as
+    100q + r, each term is q plus one if r >= 100 - s, so summing q and
+    counting remainders over every rotation gives the count for all 100
+    starts at once.
+    """
+    directions, distances = rotations["direction"], rotations["distance"]
+    if np is not None and isinstance(distances, np.ndarray):
+        right = directions.view(np.uint32) == ord("R")
+        ends = np.cumsum(np.where(right, distances, -distances))
+        starts = np.concatenate(([0], ends[:-1]))
+        # Passing zero is floor(high / 100) - floor(low / 100); see dial_zeros
+        high = np.where(right, ends, starts - 1)
+        low = np.where(right, starts, ends - 1)
+        hundreds = int((high // POSITIONS).sum() - (low // POSITIONS).sum())
+        remainders = np.bincount(high % POSITIONS, minlength=POSITIONS) - np.bincount(
+            low % POSITIONS, minlength=POSITIONS
+        )
+        at_zero = np.bincount(-ends % POSITIONS, minlength=POSITIONS).tolist()
+        repeats = np.bincount(-starts[distances % POSITIONS == 0] % POSITIONS, minlength=POSITIONS)
+        remainders, repeats = remainders.tolist(), repeats.tolist()
+        net = int(ends[-1]) if len(ends) else 0
+    else:
+        remainders, at_zero, repeats = [0] * POSITIONS, [0] * POSITIONS, [0] * POSITIONS
+        hundreds = net = 0
+        for direction, distance in zip(directions, distances, strict=True):
+            if direction == "R":
+                end = net + distance
+                high, low = end, net
+            else:
+                end = net - distance
+                high, low = net - 1, end - 1
+            hundreds += high // POSITIONS - low // POSITIONS
+            remainders[high % POSITIONS] += 1
+            remainders[low % POSITIONS] -= 1
+            at_zero[-end % POSITIONS] += 1
+            if distance % POSITIONS == 0:
+                repeats[-net % POSITIONS] += 1
+            net = end
+
+    # Starting at s, the s highest remainders, 100 - s and up, add one each
+    highest = list(accumulate(reversed(remainders), initial=0))
+    passed = tuple(hundreds + highest[start] + repeats[start] for start in range(POSITIONS))
+    return DialTransform(net, tuple(at_zero), passed)
+
+
+def _chunk_transform(filepath: Path, start: int, stop: int) -> DialTransform:
+    """Read and summarise the rotations in a byte range of an input file."""
+    with Path(filepath).open("rb") as file:
+        file.seek(start)
+        raw = file.read(stop - start)
+    if np is not None and (rotations := _parse_bytes(raw)) is not None:
+        return dial_transform(rotations)
+    # Decode with universal newlines, as opening the file as text would
+    with io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8") as text:
+        return dial_transform(_checked(parse_records(text, ROTATION_SCHEMA)))
+
+
+def solve_parallel(
+    filepath: Path, jobs: int | None = None, *, chunk_size: int = PARALLEL_CHUNK_SIZE
+) -> tuple[int, int]:
+    """
+    Solve both parts by summarising chunks of the input in worker processes.
+
+    Each worker reads about chunk_size bytes of whole lines and returns its
+    DialTransform; the transforms are combined in file order, so the answers
+    match dial_zeros however the file is split.
+
+    Args:
+        filepath: Input file of rotations, one per line
+        jobs: Number of worker processes; None uses every available CPU
+        chunk_size: Approximate bytes per chunk
+
+    Raises:
+        ValueError: If a line is not a rotation or its direction is not L or R
+    """
+    starts, stops = zip(*line_ranges(filepath, chunk_size), strict=True)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        transforms = executor.map(_chunk_transform, repeat(filepath), starts, stops)
+        return reduce(DialTransform.then, transforms, IDENTITY).apply()
+
+
+def solve(filepath: Path) -> tuple[int, int]:
+    """
+    Solve both parts with a single dial_zeros pass over the parsed rotations.
+
+    Logs of at least PARALLEL_MIN_BYTES are solved with solve_parallel
+    instead, when there is more than one CPU to share the work.
+    """
+    path = Path(filepath)
+    large = path.is_file() and path.stat().st_size >= PARALLEL_MIN_BYTES
+    if large and (os.process_cpu_count() or 1) > 1:
+        return solve_parallel(path)
+    return dial_zeros(parse(filepath))
+
+
 def main() -> None:
     """Entry point."""
     input_file = Path(__file__).parent / "input.txt"
-    rotations = [parse_rotation(line) for line in read_lines(input_file)]
-
-    part1 = count_zeros(rotations, count_during_rotation=False)
-    print(f"Part 1: {part1}")
+    at_zero, passed = solve(input_file)
 
-    part2 = count_zeros(rotations, count_during_rotation=True)
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {at_zero}")
+    print(f"Part 2: {passed}")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,28 @@
 """Tests for Day 1: Safe Dial"""
 
+from array import array
+from functools import reduce
+from random import Random
+
 import pytest
 
-from .solution import Dial, Rotation, count_zeros, parse_rotation
+from . import solution
+from .generator import generate
+from .solution import (
+    IDENTITY,
+    Dial,
+    DialTransform,
+    Rotation,
+    count_zeros,
+    dial_transform,
+    dial_zeros,
+    iter_rotations,
+    parse,
+    parse_rotation,
+    rotations_of,
+    solve,
+    solve_parallel,
+)
 
 
 class TestRotation:
@@ -191,3 +211,175 @@ class TestSolution:
 
         password = count_zeros(rotations, count_during_rotation=True)
         assert password == 10
+
+
+class TestStages:
+    """Test the parse and solve stages on the example file."""
+
+    def test_parse(self, example_file):
+        rotations = parse(example_file)
+        assert len(rotations["direction"]) == len(rotations["distance"]) == 10
+        assert next(rotations_of(rotations)) == Rotation("L", 68)
+
+    def test_parse_rejects_unknown_direction(self, tmp_path):
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("L68\nX30\n")
+        with pytest.raises(ValueError, match="Invalid direction: X"):
+            parse(input_file)
+
+    def test_solve(self, example_file):
+        assert solve(example_file) == (3, 6)
+
+    def test_plain_log_parsed_from_bytes(self, example_file, monkeypatch):
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(solution, "parse_records", None)
+        assert solve(example_file) == (3, 6)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "\n".join(generate(500, Random(3))) + "\n",
+            "L68\r\n\r\n  R5 \t\r\nL1",
+            "R5\nL7 R3\n",
+            "L68\nr5\n",
+            "L 5\n",
+            "5\nL6\n",
+            "L68\rR5\n",
+            "",
+        ],
+    )
+    def test_parse_matches_records(self, tmp_path, monkeypatch, text):
+        """Test the byte-level parse agrees with parse_records, or fails the same way."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(text.encode())
+
+        def parsed():
+            try:
+                rotations = parse(input_file)
+            except ValueError as e:
+                return str(e)
+            return rotations["direction"].tolist(), rotations["distance"].tolist()
+
+        fast = parsed()
+        monkeypatch.setattr(solution, "np", None)
+        assert fast == parsed()
+
+    def test_streamed_rotations(self, example_file):
+        assert count_zeros(iter_rotations(example_file), count_during_rotation=False) == 3
+        assert count_zeros(iter_rotations(example_file), count_during_rotation=True) == 6
+
+
+@pytest.fixture(params=["array", "numpy"])
+def columns(request):
+    """Turn rotations into array columns, or NumPy columns as parse gives with NumPy."""
+    if request.param == "numpy":
+        np = pytest.importorskip("numpy")
+        return lambda directions, distances: {
+            "direction": np.array(list(directions), "<U1"),
+            "distance": np.array(distances, np.int64),
+        }
+    return lambda directions, distances: {
+        "direction": array("w", directions),
+        "distance": array("q", distances),
+    }
+
+
+def random_rotations(rng, count):
+    """Make rotations, favouring zero and multiple-of-100 distances, the awkward cases."""
+    return [
+        Rotation(rng.choice("LR"), rng.choice([0, 50, 100, 200, rng.randint(1, 999)]))
+        for _ in range(count)
+    ]
+
+
+class TestDialZeros:
+    """Test the fused engine against stepping a Dial through each rotation."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_dial(self, columns, seed):
+        rotations = random_rotations(Random(seed), 500)
+        expected = (
+            count_zeros(rotations, count_during_rotation=False),
+            count_zeros(rotations, count_during_rotation=True),
+        )
+        directions = "".join(rotation.direction for rotation in rotations)
+        distances = [rotation.distance for rotation in rotations]
+        assert dial_zeros(columns(directions, distances)) == expected
+
+    def test_empty(self, columns):
+        assert dial_zeros(columns("", [])) == (0, 0)
+
+
+class TestDialTransform:
+    """Test chunk transforms against counting zeros over the whole run."""
+
+    @staticmethod
+    def transform(columns, rotations):
+        directions = "".join(rotation.direction for rotation in rotations)
+        return dial_transform(columns(directions, [rotation.distance for rotation in rotations]))
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_dial_zeros_from_every_start(self, columns, seed):
+        rotations = random_rotations(Random(seed), 300)
+        directions = "".join(rotation.direction for rotation in rotations)
+        parsed = columns(directions, [rotation.distance for rotation in rotations])
+        transform = dial_transform(parsed)
+        for start in range(100):
+            assert transform.apply(start) == dial_zeros(parsed, start)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_chunks_combine_to_whole(self, columns, seed):
+        rng = Random(seed)
+        rotations = random_rotations(rng, 300)
+        cuts = sorted(rng.sample(range(1, 300), 5))
+        chunks = [rotations[a:b] for a, b in zip([0, *cuts], [*cuts, 300], strict=True)]
+        combined = reduce(
+            DialTransform.then, (self.transform(columns, chunk) for chunk in chunks), IDENTITY
+        )
+        assert combined == self.transform(columns, rotations)
+
+    def test_then_is_associative(self, columns):
+        rng = Random(4)
+        a, b, c = (self.transform(columns, random_rotations(rng, 50)) for _ in range(3))
+        assert a.then(b).then(c) == a.then(b.then(c))
+
+    def test_empty_is_identity(self, columns):
+        assert self.transform(columns, []) == IDENTITY
+
+
+class TestSolveParallel:
+    """Test summarising an input in worker processes."""
+
+    def test_matches_single_pass(self, tmp_path):
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("\n".join(generate(2000, Random(5))) + "\n")
+        assert solve_parallel(input_file, 2, chunk_size=1000) == dial_zeros(parse(input_file))
+
+    def test_example(self, example_file):
+        # Chunks of a few bytes cut the example into ranges of one or two lines
+        assert solve_parallel(example_file, 1, chunk_size=7) == (3, 6)
+
+    def test_crlf_line_endings(self, example_file, tmp_path):
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(example_file.read_bytes().replace(b"\n", b"\r\n"))
+        assert solve_parallel(input_file, 1, chunk_size=7) == (3, 6)
+
+    def test_solve_chooses_workers_for_large_logs(self, example_file, monkeypatch):
+        monkeypatch.setattr(solution, "PARALLEL_MIN_BYTES", 1)
+        monkeypatch.setattr(solution.os, "process_cpu_count", lambda: 2)
+        calls = []
+        monkeypatch.setattr(solution, "solve_parallel", lambda path: calls.append(path) or (3, 6))
+        assert solution.solve(example_file) == (3, 6)
+        assert calls == [example_file]
+
+
+class TestGenerator:
+    """Test synthetic input generation."""
+
+    def test_same_seed_same_input(self):
+        assert list(generate(100, Random(1))) == list(generate(100, Random(1)))
+
+    def test_lines_parse_as_rotations(self):
+        rotations = [parse_rotation(line) for line in generate(1000, Random(2))]
+        assert len(rotations) == 1000
+        assert all(1 <= rotation.distance <= 999 for rotation in rotations)
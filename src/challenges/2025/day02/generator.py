@@ -0,0 +1,24 @@
+"""Synthetic inputs for Day 2: one line of comma-separated ID ranges."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from this many ranges; each can hold a million IDs
+BASE_SIZE = 4
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """
+    Generate size disjoint ranges, in shuffled order.
+
+    Range widths and the gaps between them are log-uniform, so IDs climb
+    through many digit lengths and some ranges span a million IDs.
+    """
+    ranges = []
+    position = rng.randint(1, 100)
+    for _ in range(size):
+        start = position + int(10 ** rng.uniform(0, 7))
+        position = start + int(10 ** rng.uniform(0, 6))
+        ranges.append(f"{start}-{position}")
+    rng.shuffle(ranges)
+    yield ",".join(ranges)
@@ -3,6 +3,7 @@ Advent of Code 2025 - Day 2: Gift Shop
 Finds invalid product IDs (repeated digit patterns).
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
 from utils import read_input
@@ -10,6 +11,7 @@ from utils import read_input
 
 def parse_ranges(filepath: Path) -> list[tuple[int, int]]:
     """Read and parse ranges from input file."""
+    # int() rather than utils.ints, since IDs may not fit in 64 bits
     content = read_input(filepath)
     return [tuple(map(int, spec.strip().split("-"))) for spec in content.split(",") if spec.strip()]
 
@@ -51,16 +53,104 @@ def sum_invalid_ids(ranges: list[tuple[int, int]], is_invalid: callable) -> int:
     return total
 
 
+def mobius(n: int) -> int:
+    """Get the Möbius function of n: 0 if a square divides n, else -1 to its number of primes."""
+    sign, factor = 1, 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            sign = -sign
+        factor += 1
+    return -sign if n > 1 else sign
+
+
+def twice_weights(digits: int) -> list[tuple[int, int]]:
+    """Repeat counts of part 1 IDs with this many digits: exactly two, if the count is even."""
+    return [(2, 1)] if digits % 2 == 0 else []
+
+
+def repeat_weights(digits: int) -> list[tuple[int, int]]:
+    """
+    Weigh the repeat counts of part 2 IDs with this many digits by inclusion-exclusion.
+
+    An ID repeating a block r times also repeats a block every multiple of r
+    dividing digits times (1111 repeats 11 twice and 1 four times), so each
+    repeat count r > 1 is weighted -mobius(r). An ID whose shortest block
+    repeats m times is then counted -sum(mobius(r) for r > 1 dividing m) = 1 time.
+    """
+    weights = ((repeats, -mobius(repeats)) for repeats in range(2, digits + 1))
+    return [(repeats, weight) for repeats, weight in weights if digits % repeats == 0 and weight]
+
+
+def repeated_block_sum(low: int, high: int, digits: int, repeats: int) -> int:
+    """
+    Sum the IDs from low to high that are a block of digits // repeats digits repeated.
+
+    Such an ID is a k-digit block times (10**digits - 1) // (10**k - 1), a
+    repunit in base 10**k such as 10101 for two-digit blocks repeated three
+    times, so the IDs in range are the multiplier times a run of consecutive
+    blocks, summed in closed form.
+    """
+    size = digits // repeats
+    multiplier = (10**digits - 1) // (10**size - 1)
+    first = max(10 ** (size - 1), -(-low // multiplier))
+    last = min(10**size - 1, high // multiplier)
+    if first > last:
+        return 0
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def sum_repeated_ids(
+    ranges: list[tuple[int, int]], weights: Callable[[int], list[tuple[int, int]]]
+) -> int:
+    """
+    Sum repeated-pattern IDs across ranges without visiting each ID.
+
+    Each range is split by number of digits, and IDs of each length are
+    summed by repeat count in closed form, so the cost grows with the number
+    of digits rather than the width of the range.
+
+    Args:
+        ranges: Inclusive (start, end) ranges of IDs
+        weights: Gives (repeats, weight) pairs for a number of digits, as
+            twice_weights for part 1 or repeat_weights for part 2
+    """
+    total = 0
+    for start, end in ranges:
+        for digits in range(len(str(start)), len(str(end)) + 1):
+            low = max(start, 10 ** (digits - 1))
+            high = min(end, 10**digits - 1)
+            total += sum(
+                weight * repeated_block_sum(low, high, digits, repeats)
+                for repeats, weight in weights(digits)
+            )
+    return total
+
+
+def parse(filepath: Path) -> list[tuple[int, int]]:
+    """Parse the product ID ranges from an input file."""
+    return parse_ranges(filepath)
+
+
+def part1(ranges: list[tuple[int, int]]) -> int:
+    """Sum IDs made of a pattern repeated exactly twice."""
+    return sum_repeated_ids(ranges, twice_weights)
+
+
+def part2(ranges: list[tuple[int, int]]) -> int:
+    """Sum IDs made of a pattern repeated at least twice."""
+    return sum_repeated_ids(ranges, repeat_weights)
+
+
 def main() -> None:
     """Entry point."""
     input_file = Path(__file__).parent / "input.txt"
-    ranges = parse_ranges(input_file)
-
-    part1 = sum_invalid_ids(ranges, is_invalid_part1)
-    print(f"Part 1: {part1}")
+    ranges = parse(input_file)
 
-    part2 = sum_invalid_ids(ranges, is_invalid_part2)
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {part1(ranges)}")
+    print(f"Part 2: {part2(ranges)}")
 
 
 if __name__ == "__main__":
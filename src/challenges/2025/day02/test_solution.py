@@ -1,9 +1,21 @@
 """Tests for Day 2: Gift Shop"""
 
+from random import Random
+
+import pytest
+
 from .solution import (
     is_invalid_part1,
     is_invalid_part2,
+    mobius,
+    parse,
+    part1,
+    part2,
+    repeat_weights,
+    repeated_block_sum,
     sum_invalid_ids,
+    sum_repeated_ids,
+    twice_weights,
 )
 
 
@@ -169,3 +181,68 @@ class TestSolverPart2:
         ]
 
         assert sum_invalid_ids(ranges, is_invalid_part2) == 4174379265
+
+
+class TestRepeatedIds:
+    """Test the closed-form engine against checking every ID."""
+
+    def test_mobius(self):
+        assert [mobius(n) for n in range(1, 13)] == [1, -1, -1, 0, -1, 1, -1, 0, 0, 1, -1, 0]
+
+    def test_repeat_weights(self):
+        # 1 repeated 6 times is also 11 three times and 111 twice
+        assert repeat_weights(6) == [(2, 1), (3, 1), (6, -1)]
+        assert repeat_weights(7) == [(7, 1)]
+        assert twice_weights(5) == []
+
+    def test_block_sum(self):
+        # 121212 and 131313, blocks of 12 and 13 repeated three times
+        assert repeated_block_sum(121000, 139999, 6, 3) == 121212 + 131313
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_brute_force(self, seed):
+        rng = Random(seed)
+        ranges = []
+        for _ in range(20):
+            start = rng.randint(1, 10 ** rng.randint(1, 7))
+            ranges.append((start, start + rng.randint(0, 5000)))
+        for weights, is_invalid in (
+            (twice_weights, is_invalid_part1),
+            (repeat_weights, is_invalid_part2),
+        ):
+            assert sum_repeated_ids(ranges, weights) == sum_invalid_ids(ranges, is_invalid)
+
+    def test_every_id_up_to_a_hundred_thousand(self):
+        ranges = [(1, 10**5)]
+        assert sum_repeated_ids(ranges, repeat_weights) == sum_invalid_ids(ranges, is_invalid_part2)
+
+    def test_wide_ranges_split_anywhere(self):
+        start, middle, end = 7, 123_456_789_012, 10**18
+        for weights in (twice_weights, repeat_weights):
+            whole = sum_repeated_ids([(start, end)], weights)
+            halves = sum_repeated_ids([(start, middle), (middle + 1, end)], weights)
+            assert whole == halves
+
+
+class TestStages:
+    """Test the parse/part1/part2 stages on the example file."""
+
+    def test_parse(self, example_file):
+        ranges = parse(example_file)
+        assert len(ranges) == 11
+        assert ranges[0] == (11, 22)
+        assert ranges[-1] == (2121212118, 2121212124)
+
+    def test_parts(self, example_file):
+        ranges = parse(example_file)
+        assert part1(ranges) == 1227775554
+        assert part2(ranges) == 4174379265
+
+    def test_ids_beyond_64_bits(self, tmp_path):
+        input_file = tmp_path / "input.txt"
+        start = 10**29
+        input_file.write_text(f"11-22,{start}-{start + 10**15}\n")
+        ranges = parse(input_file)
+        assert ranges == [(11, 22), (start, start + 10**15)]
+        # One ID repeats a 15-digit block twice: 100000000000000 100000000000000
+        assert part1(ranges) == 33 + 10**14 * (10**15 + 1)
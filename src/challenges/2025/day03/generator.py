@@ -0,0 +1,14 @@
+"""Synthetic inputs for Day 3: one bank of battery joltage digits per line."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from this many banks
+BASE_SIZE = 50
+BANK_WIDTH = 100
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Generate size banks of 100 digits from 1 to 9, the shape of the real input."""
+    for _ in range(size):
+        yield "".join(rng.choices("123456789", k=BANK_WIDTH))
@@ -3,9 +3,10 @@ Advent of Code 2025 - Day 3: Lobby
 Find maximum joltage from battery banks.
 """
 
+from collections.abc import Iterable
 from pathlib import Path
 
-from utils import read_lines
+from utils import iter_lines
 
 
 def find_max_joltage_part1(bank: str) -> int:
@@ -46,26 +47,38 @@ def find_max_joltage_part2(bank: str, num_batteries: int = 12) -> int:
     return int(result)
 
 
-def solve_part1(banks: list[str]) -> int:
+def solve_part1(banks: Iterable[str]) -> int:
     """Calculate total output joltage from all battery banks (2 batteries each)."""
     return sum(find_max_joltage_part1(bank) for bank in banks)
 
 
-def solve_part2(banks: list[str]) -> int:
+def solve_part2(banks: Iterable[str]) -> int:
     """Calculate total output joltage from all battery banks (12 batteries each)."""
     return sum(find_max_joltage_part2(bank) for bank in banks)
 
 
+def parse(filepath: Path) -> list[str]:
+    """Read one battery bank per line from an input file."""
+    return list(iter_lines(filepath))
+
+
+def part1(banks: list[str]) -> int:
+    """Total joltage turning on two batteries per bank."""
+    return solve_part1(banks)
+
+
+def part2(banks: list[str]) -> int:
+    """Total joltage turning on twelve batteries per bank."""
+    return solve_part2(banks)
+
+
 def main() -> None:
     """Entry point."""
     input_file = Path(__file__).parent / "input.txt"
-    banks = read_lines(input_file)
-
-    part1 = solve_part1(banks)
-    print(f"Part 1: {part1}")
+    banks = parse(input_file)
 
-    part2 = solve_part2(banks)
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {part1(banks)}")
+    print(f"Part 2: {part2(banks)}")
 
 
 if __name__ == "__main__":
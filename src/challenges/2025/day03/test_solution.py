@@ -3,6 +3,9 @@
 from .solution import (
     find_max_joltage_part1,
     find_max_joltage_part2,
+    parse,
+    part1,
+    part2,
     solve_part1,
     solve_part2,
 )
@@ -88,3 +91,13 @@ class TestSolverPart2:
         expected = 987654321111 + 811111111119 + 434234234278 + 888911112111
         assert solve_part2(banks) == expected
         assert solve_part2(banks) == 3121910778619
+
+
+class TestStages:
+    """Test the parse/part1/part2 stages on the example file."""
+
+    def test_parts(self, example_file):
+        banks = parse(example_file)
+        assert len(banks) == 4
+        assert part1(banks) == 357
+        assert part2(banks) == 3121910778619
@@ -0,0 +1,14 @@
+"""Synthetic inputs for Day 4: a square grid of paper rolls (@) and floor (.)."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from a grid this many cells across
+BASE_SIZE = 32
+ROLL_DENSITY = 0.65
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """Generate a size x size grid about as densely packed as the real input."""
+    for _ in range(size):
+        yield "".join("@" if rng.random() < ROLL_DENSITY else "." for _ in range(size))
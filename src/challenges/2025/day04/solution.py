@@ -6,12 +6,28 @@ Count accessible paper rolls based on neighbour count.
 from pathlib import Path
 
 from challenges.constants import INPUT_FILE
-from utils import Coordinate, iterate_over_grid, read_lines
+from utils import BitGrid, Coordinate, Grid, equals, iterate_over_grid, read_lines
+from utils.cache import cached_parser
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rolls with this many neighbouring rolls cannot be reached by a forklift
+CROWDED = 4
+# Translation table marking rolls with 1 and everything else with 0
+ROLL_MARKS = bytes(byte == ord("@") for byte in range(256))
+# Floors with at least this many cells are solved with NumPy, when it is installed
+NUMPY_MIN_CELLS = 400
+# Rounds the NumPy engine removes before handing a deep pile over to peel_layers;
+# a round costs a pass over every cell, peeling the rest well over a hundred
+NUMPY_MAX_ROUNDS = 128
 
 
 def parse_rolls(grid: list[str]) -> set[Coordinate]:
     """Parse grid into set of roll coordinates."""
-    return set(iterate_over_grid(grid, condition=lambda x: x == "@"))
+    return set(iterate_over_grid(grid, condition=equals("@")))
 
 
 def count_neighbours(rolls: set[Coordinate], coordinate: Coordinate) -> int:
@@ -32,9 +48,9 @@ def count_neighbours(rolls: set[Coordinate], coordinate: Coordinate) -> int:
 def get_accessible_rolls(rolls: set[Coordinate]) -> set[Coordinate]:
     """
     Get all rolls that can be accessed by a forklift.
-    A roll is accessible if it has fewer than 4 neighbouring rolls.
+    A roll is accessible if it has fewer than CROWDED neighbouring rolls.
     """
-    return {coordinate for coordinate in rolls if count_neighbours(rolls, coordinate) < 4}
+    return {coordinate for coordinate in rolls if count_neighbours(rolls, coordinate) < CROWDED}
 
 
 def iteratively_get_accessible_rolls(rolls: set[Coordinate]) -> int:
@@ -51,20 +67,157 @@ def iteratively_get_accessible_rolls(rolls: set[Coordinate]) -> int:
     return total_removed
 
 
-def solve(filepath: Path) -> tuple[int, int]:
-    """Solve both parts given an input file."""
-    grid = read_lines(filepath)
-    rolls = parse_rolls(grid)
+def get_accessible_bits(rolls: BitGrid) -> BitGrid:
+    """Get all accessible rolls at once, counting every cell's neighbours in bit planes."""
+    return rolls - rolls.neighbours_at_least(CROWDED)
+
+
+def iteratively_remove_bits(rolls: BitGrid) -> int:
+    """
+    Iteratively remove accessible rolls from a bit grid until no more can be removed.
+    Returns the total count of removed rolls.
+    """
+    total_removed = 0
+
+    while accessible_rolls := get_accessible_bits(rolls):
+        rolls -= accessible_rolls
+        total_removed += accessible_rolls.popcount()
+
+    return total_removed
+
+
+def bits_to_array(rolls: BitGrid) -> "np.ndarray":
+    """Unpack a bit grid into a dense boolean array."""
+    row_bytes = (rolls.width + 7) // 8
+    packed = b"".join(row.to_bytes(row_bytes, "little") for row in rolls.rows)
+    packed_rows = np.frombuffer(packed, np.uint8).reshape(rolls.height, row_bytes)
+    return np.unpackbits(packed_rows, axis=1, bitorder="little")[:, : rolls.width].view(bool)
+
+
+def count_neighbours_array(rolls: "np.ndarray") -> "np.ndarray":
+    """Count every cell's neighbouring rolls at once, as a sum of the 8 shifted grids."""
+    height, width = rolls.shape
+    padded = np.pad(rolls.view(np.uint8), 1)
+    counts = np.zeros((height, width), np.uint8)
+    for row_offset in range(3):
+        for col_offset in range(3):
+            if row_offset != 1 or col_offset != 1:
+                counts += padded[row_offset : row_offset + height, col_offset : col_offset + width]
+    return counts
+
+
+def get_accessible_array(rolls: "np.ndarray") -> "np.ndarray":
+    """Get a mask of all accessible rolls in a dense boolean array."""
+    return rolls & (count_neighbours_array(rolls) < CROWDED)
+
 
-    part1 = len(get_accessible_rolls(rolls))
-    # Make a copy for part2 since it modifies the set
-    part2 = iteratively_get_accessible_rolls(rolls.copy())
+def array_to_grid(rolls: "np.ndarray") -> Grid:
+    """Pack a dense boolean array into a grid of rolls (@) and floor (.)."""
+    marks = np.where(rolls, ord("@"), ord(".")).astype(np.uint8)
+    return Grid.from_lines(row.tobytes() for row in marks)
 
-    return part1, part2
+
+def iteratively_remove_array(rolls: "np.ndarray") -> int:
+    """
+    Iteratively remove accessible rolls from a dense array until no more can be removed.
+    Returns the total count of removed rolls.
+    """
+    total_removed = 0
+
+    while (removed := int(np.count_nonzero(accessible := get_accessible_array(rolls)))) > 0:
+        rolls = rolls & ~accessible
+        total_removed += removed
+
+    return total_removed
+
+
+def peel_layers(grid: Grid) -> list[list[Coordinate]]:
+    """
+    Remove accessible rolls round by round, tracking neighbour counts incrementally.
+
+    Counts are computed once; each removed roll then decrements its remaining
+    neighbours, and a neighbour falling below CROWDED joins the next round.
+    Total work is linear in rolls plus neighbour pairs, however many rounds.
+
+    Returns:
+        The rolls removed in each round, in order; rolls never removed are in none
+    """
+    offsets = grid.offsets8
+    # 1 on rolls that are still standing and not yet queued for removal
+    alive = grid.cells.translate(ROLL_MARKS)
+    # Bytes are digits of one big integer, so adding it shifted by each offset
+    # counts every cell's neighbours at once; counts never carry past 8
+    standing = int.from_bytes(alive, "little")
+    total = sum(
+        standing << 8 * -offset if offset < 0 else standing >> 8 * offset for offset in offsets
+    )
+    counts = bytearray(total.to_bytes(len(alive) + 1, "little")[: len(alive)])
+
+    layer = [index for index in grid.find_all("@") if counts[index] < CROWDED]
+    for index in layer:
+        alive[index] = 0
+
+    layers = []
+    while layer:
+        layers.append(layer)
+        next_layer = []
+        for index in layer:
+            for offset in offsets:
+                neighbour = index + offset
+                if alive[neighbour]:
+                    counts[neighbour] -= 1
+                    if counts[neighbour] < CROWDED:
+                        alive[neighbour] = 0
+                        next_layer.append(neighbour)
+        layer = next_layer
+
+    return [[grid.coordinate(index) for index in layer] for layer in layers]
+
+
+def use_numpy(rolls: BitGrid) -> bool:
+    """Check whether a floor is big enough for the NumPy engine to beat the bit grid."""
+    return np is not None and rolls.height * rolls.width >= NUMPY_MIN_CELLS
+
+
+@cached_parser
+def parse(filepath: Path) -> BitGrid:
+    """Parse the roll grid from an input file."""
+    return BitGrid.from_lines(read_lines(filepath), "@")
+
+
+def part1(rolls: BitGrid) -> int:
+    """Count the rolls that are accessible straight away."""
+    if use_numpy(rolls):
+        return int(np.count_nonzero(get_accessible_array(bits_to_array(rolls))))
+    return get_accessible_bits(rolls).popcount()
+
+
+def part2(rolls: BitGrid) -> int:
+    """Count the rolls removed by repeatedly taking every accessible roll."""
+    if not use_numpy(rolls):
+        return sum(map(len, peel_layers(Grid.from_lines(rolls.to_lines("@")))))
+
+    array = bits_to_array(rolls)
+    total_removed = 0
+    for _ in range(NUMPY_MAX_ROUNDS):
+        removed = int(np.count_nonzero(accessible := get_accessible_array(array)))
+        if not removed:
+            return total_removed
+        array &= ~accessible
+        total_removed += removed
+
+    # A deep pile: peeling the rest costs the same however many rounds remain
+    return total_removed + sum(map(len, peel_layers(array_to_grid(array))))
+
+
+def solve(filepath: Path) -> tuple[int, int]:
+    """Solve both parts given an input file."""
+    rolls = parse(filepath)
+    return part1(rolls), part2(rolls)
 
 
 if __name__ == "__main__":
-    part1, part2 = solve(INPUT_FILE)
+    answer1, answer2 = solve(INPUT_FILE)
 
-    print(f"Part 1: {part1}")
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {answer1}")
+    print(f"Part 2: {answer2}")
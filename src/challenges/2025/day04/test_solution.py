@@ -1,18 +1,49 @@
 """Tests for Day 4: Printing Department"""
 
+from random import Random
+from time import perf_counter_ns
+
 import pytest
 
-from utils import read_lines
+from utils import BitGrid, Grid, cache, iterate_over_grid, one_of, read_lines
 
+from . import solution
+from .generator import generate
 from .solution import (
+    array_to_grid,
+    bits_to_array,
     count_neighbours,
+    count_neighbours_array,
+    get_accessible_array,
+    get_accessible_bits,
     get_accessible_rolls,
     iteratively_get_accessible_rolls,
+    iteratively_remove_array,
+    iteratively_remove_bits,
+    parse,
     parse_rolls,
+    part2,
+    peel_layers,
     solve,
 )
 
 
+def serpentine(size: int) -> list[str]:
+    """
+    A size x size floor holding one snake of rolls, two rows thick.
+
+    Only the snake's ends are ever accessible, so each round removes a couple of
+    rolls and the rolls take about size * size / 6 rounds to clear.
+    """
+    rows = []
+    for band in range(size // 3):
+        rows += ["@" * size] * 2
+        if band + 1 < size // 3:
+            joint = "@@" + "." * (size - 2)
+            rows.append(joint[::-1] if band % 2 == 0 else joint)
+    return rows + ["." * size] * (size - len(rows))
+
+
 @pytest.fixture
 def example_grid(example_file):
     """Grid from example.txt."""
@@ -73,6 +104,23 @@ class TestNeighborCount:
         assert count_neighbours(rolls, (1, 2)) == 1  # right edge
 
 
+class TestParseRolls:
+    """Test locating rolls without calling a condition per cell."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_lambda_condition(self, seed):
+        """Test the searched rolls are exactly those a per-cell lambda finds."""
+        grid = list(generate(20, Random(seed)))
+        expected = set(iterate_over_grid(grid, condition=lambda x: x == "@"))
+        assert parse_rolls(grid) == expected
+
+    def test_one_of_ragged_rows(self):
+        """Test searching rows of different lengths for several values."""
+        grid = ["@.#", "#@", "", ".@@#"]
+        found = list(iterate_over_grid(grid, condition=one_of("@#")))
+        assert found == [(0, 0), (0, 2), (1, 0), (1, 1), (3, 1), (3, 2), (3, 3)]
+
+
 class TestAccessibleRolls:
     """Test counting accessible paper rolls."""
 
@@ -254,3 +302,153 @@ class TestMain:
     def test_example_part2(self, example_rolls):
         """Test Part 2 with example data."""
         assert iteratively_get_accessible_rolls(example_rolls.copy()) == 43
+
+
+class TestBitGridEngine:
+    """Test the bit-sliced engine against the coordinate set engine."""
+
+    def test_example(self, example_grid):
+        """Test both parts of the example on the bit grid."""
+        rolls = BitGrid.from_lines(example_grid, "@")
+        assert get_accessible_bits(rolls).popcount() == 13
+        assert iteratively_remove_bits(rolls) == 43
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_neighbour_counts_match(self, seed):
+        """Test every cell's bit-sliced neighbour count, set or not, is the counted one."""
+        grid = list(generate(12, Random(seed)))
+        rolls = parse_rolls(grid)
+        planes = BitGrid.from_lines(grid, "@").neighbour_counts()
+        for row in range(12):
+            for col in range(12):
+                count = sum((plane.rows[row] >> col & 1) << bit for bit, plane in enumerate(planes))
+                assert count == count_neighbours(rolls, (row, col))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_engines_agree(self, seed):
+        """Test both engines find the same rolls and remove the same number."""
+        grid = list(generate(30, Random(seed)))
+        rolls = parse_rolls(grid)
+        bits = BitGrid.from_lines(grid, "@")
+        assert set(get_accessible_bits(bits).coordinates()) == get_accessible_rolls(rolls)
+        assert iteratively_remove_bits(bits) == iteratively_get_accessible_rolls(rolls)
+
+
+class TestNumpyEngine:
+    """Test the NumPy shifted-sum engine against the other engines."""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_bits_to_array(self):
+        """Test unpacking a bit grid keeps every cell in place."""
+        grid = ["@..@", ".@@.", "...@"]
+        array = bits_to_array(BitGrid.from_lines(grid, "@"))
+        assert array.tolist() == [[cell == "@" for cell in row] for row in grid]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_neighbour_counts_match(self, seed):
+        """Test every cell's shifted-sum neighbour count, set or not, is the counted one."""
+        grid = list(generate(12, Random(seed)))
+        rolls = parse_rolls(grid)
+        counts = count_neighbours_array(bits_to_array(BitGrid.from_lines(grid, "@")))
+        for row in range(12):
+            for col in range(12):
+                assert counts[row, col] == count_neighbours(rolls, (row, col))
+
+    @pytest.mark.parametrize("size", [1, 7, 30, 65])
+    def test_engines_agree(self, size):
+        """Test the array and bit grid engines give identical answers."""
+        bits = BitGrid.from_lines(generate(size, Random(size)), "@")
+        array = bits_to_array(bits)
+        assert get_accessible_array(array).sum() == get_accessible_bits(bits).popcount()
+        assert iteratively_remove_array(array) == iteratively_remove_bits(bits)
+
+    def test_array_to_grid(self):
+        """Test packing an array gives back the grid it was unpacked from."""
+        grid = ["@..@", ".@@.", "...@"]
+        packed = array_to_grid(bits_to_array(BitGrid.from_lines(grid, "@")))
+        assert [[packed[row, col] for col in range(4)] for row in range(3)] == [
+            list(row) for row in grid
+        ]
+
+    @pytest.mark.parametrize("max_rounds", [0, 1, 50, 10**9])
+    def test_deep_pile_handed_over_to_peeling(self, monkeypatch, max_rounds):
+        """Test part 2 counts the same however many rounds run before peeling takes over."""
+        monkeypatch.setattr(solution, "NUMPY_MIN_CELLS", 0)
+        monkeypatch.setattr(solution, "NUMPY_MAX_ROUNDS", max_rounds)
+        grid = serpentine(30)
+        assert part2(BitGrid.from_lines(grid, "@")) == iteratively_get_accessible_rolls(
+            parse_rolls(grid)
+        )
+
+    @pytest.mark.parametrize("min_cells", [0, 10**9])
+    def test_solve_with_either_engine(self, example_file, monkeypatch, min_cells):
+        """Test solve gives the same answers whichever engines the size threshold picks."""
+        monkeypatch.setattr(solution, "NUMPY_MIN_CELLS", min_cells)
+        assert solve(example_file) == (13, 43)
+
+
+class TestPeelLayers:
+    """Test incremental peeling against removing whole rounds at a time."""
+
+    def test_example(self, example_grid):
+        """Test the example's first layer is part 1 and all layers make part 2."""
+        layers = peel_layers(Grid.from_lines(example_grid))
+        assert len(layers[0]) == 13
+        assert sum(map(len, layers)) == 43
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_layers_are_rounds(self, seed):
+        """Test each layer holds exactly the rolls the matching round removes."""
+        grid = list(generate(25, Random(seed)))
+        rolls = parse_rolls(grid)
+        layers = peel_layers(Grid.from_lines(grid))
+        for layer in layers:
+            accessible = get_accessible_rolls(rolls)
+            assert set(layer) == accessible
+            rolls -= accessible
+        assert not get_accessible_rolls(rolls)
+
+    def test_crowded_rolls_stay(self):
+        """Test rolls that never become accessible are in no layer."""
+        grid = ["@@@@@"] * 5
+        layers = peel_layers(Grid.from_lines(grid))
+        assert layers == [[(0, 0), (0, 4), (4, 0), (4, 4)]]
+
+
+@pytest.mark.perf
+def test_deep_pile_is_peeled():
+    """Test part 2 on a pile thousands of rounds deep costs about as much as peeling it."""
+
+    def fastest(func, arg):
+        runs = []
+        for _ in range(3):
+            start = perf_counter_ns()
+            func(arg)
+            runs.append(perf_counter_ns() - start)
+        return min(runs)
+
+    grid = serpentine(300)
+    bits = BitGrid.from_lines(grid, "@")
+    peeling = fastest(lambda grid: peel_layers(Grid.from_lines(grid)), grid)
+    # An engine making a pass over the floor every round takes over 20x as long
+    assert fastest(part2, bits) < 3 * peeling
+
+
+class TestParseCache:
+    """Test the on-disk cache of parsed rolls."""
+
+    def test_disabled_by_default(self, example_file, monkeypatch):
+        monkeypatch.delenv("AOC_PARSE_CACHE", raising=False)
+        written = []
+        monkeypatch.setattr(cache, "dump", lambda *args: written.append(args))
+        assert parse(example_file) == BitGrid.from_lines(read_lines(example_file), "@")
+        assert written == []
+
+    def test_warm_parse_matches_cold(self, example_file, tmp_path, monkeypatch):
+        monkeypatch.setenv("AOC_PARSE_CACHE", str(tmp_path))
+        cold = parse(example_file)
+        assert len(list(tmp_path.glob("*.pickle"))) == 1
+        assert parse(example_file) == cold == BitGrid.from_lines(read_lines(example_file), "@")
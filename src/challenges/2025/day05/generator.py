@@ -0,0 +1,24 @@
+"""Synthetic inputs for Day 5: fresh ID ranges, a blank line, then available IDs."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from this many available IDs
+BASE_SIZE = 200
+MAX_ID = 10**15
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """
+    Generate size available IDs and one fresh range for every five of them.
+
+    Ranges are clustered around a few centres so that many overlap, as in the
+    real input, and most IDs are drawn near those centres.
+    """
+    centres = [rng.randrange(MAX_ID) for _ in range(max(1, size // 50))]
+    for _ in range(size // 5 + 1):
+        start = rng.choice(centres) + rng.randint(-(10**12), 10**12)
+        yield f"{max(1, start)}-{max(1, start) + rng.randint(0, 10**13)}"
+    yield ""
+    for _ in range(size):
+        yield str(max(1, rng.choice(centres) + rng.randint(-(10**13), 10**13)))
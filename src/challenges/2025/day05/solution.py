@@ -6,8 +6,7 @@ Count available fresh ingredient IDs and total fresh ingredients.`
 from pathlib import Path
 
 from challenges.constants import INPUT_FILE
-from utils import read_lines
-from utils.utils import map_range
+from utils import MappedFile, ints, split_sections
 
 
 def get_merged_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -23,26 +22,47 @@ def get_merged_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged_ranges
 
 
+def parse_inventory(
+    ranges: str | memoryview, ids: str | memoryview
+) -> tuple[list[tuple[int, int]], set[int]]:
+    """Parse the fresh ranges section and the available ids section, each in one call."""
+    merged_ranges = get_merged_ranges([(start, end) for start, end in ints(ranges, 2).tolist()])
+    return merged_ranges, set(ints(ids).tolist())
+
+
 def parse_input(lines: list[str]) -> tuple[list[tuple[int, int]], set[int]]:
     """Parses fresh range and available ingredient id input."""
-    split_index = lines.index("")
-    merged_ranges = get_merged_ranges([map_range(line) for line in lines[:split_index]])
-    available_ids = {int(x) for x in lines[split_index + 1 :]}
-    return merged_ranges, available_ids
+    ranges, ids = ("\n".join(section) for section in split_sections(lines))
+    return parse_inventory(ranges, ids)
+
+
+def parse(filepath: Path) -> tuple[list[tuple[int, int]], set[int]]:
+    """Parse merged fresh ranges and available ingredient ids from an input file."""
+    # Each section's numbers are read straight from the mapped file
+    with MappedFile(filepath) as mapped:
+        return parse_inventory(*mapped.sections())
+
+
+def part1(inventory: tuple[list[tuple[int, int]], set[int]]) -> int:
+    """Count the available ingredient ids that are fresh."""
+    merged_ranges, available_ids = inventory
+    return len({id for id in available_ids for start, end in merged_ranges if start <= id <= end})
+
+
+def part2(inventory: tuple[list[tuple[int, int]], set[int]]) -> int:
+    """Count every ingredient id the fresh ranges cover."""
+    merged_ranges, _ = inventory
+    return sum(end - start + 1 for start, end in merged_ranges)
 
 
 def solve(filepath: Path) -> tuple[int, int]:
     """Solve both parts given an input file."""
-    lines = read_lines(filepath, skip_empty=False)
-    merged_ranges, available_ids = parse_input(lines)
-    part1 = len({id for id in available_ids for start, end in merged_ranges if start <= id <= end})
-    part2 = sum(end - start + 1 for start, end in merged_ranges)
-
-    return part1, part2
+    inventory = parse(filepath)
+    return part1(inventory), part2(inventory)
 
 
 if __name__ == "__main__":
-    part1, part2 = solve(INPUT_FILE)
+    answer1, answer2 = solve(INPUT_FILE)
 
-    print(f"Part 1: {part1}")
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {answer1}")
+    print(f"Part 2: {answer2}")
@@ -4,7 +4,7 @@ import pytest
 
 from utils import read_lines
 
-from .solution import get_merged_ranges, parse_input, solve
+from .solution import get_merged_ranges, parse, parse_input, solve
 
 
 @pytest.fixture
@@ -105,6 +105,18 @@ class TestParseInput:
         assert len(merged_ranges) > 0
         assert len(available_ids) > 0
 
+    def test_file_parse_matches_lines(self, example_file, example_lines):
+        """Test parsing the whole file at once gives the same inventory as line by line."""
+        assert parse(example_file) == parse_input(example_lines)
+
+    def test_repeated_blank_lines(self, tmp_path, example_file, example_lines):
+        """Test sections separated by several blank lines, some with spaces, parse the same."""
+        padded = tmp_path / "input.txt"
+        padded.write_text(example_file.read_text().replace("\n\n", "\n\n  \n\n"))
+        expected = parse_input(example_lines)
+        assert parse(padded) == expected
+        assert parse_input(read_lines(padded, skip_empty=False)) == expected
+
 
 class TestPart1Logic:
     """Test Part 1: Count available fresh ingredients."""
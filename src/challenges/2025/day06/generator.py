@@ -0,0 +1,28 @@
+"""Synthetic inputs for Day 6: a worksheet of column-aligned math problems."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from this many problems
+BASE_SIZE = 100
+ROWS = 4
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """
+    Generate a worksheet of size problems.
+
+    Each problem has four numbers of 1-4 digits, left or right aligned within
+    its column, with the operator below its first character. Problems are
+    separated by a column of spaces and all rows are padded to equal length.
+    """
+    rows: list[list[str]] = [[] for _ in range(ROWS + 1)]
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in range(ROWS)]
+        width = max(map(len, numbers))
+        align = str.rjust if rng.random() < 0.5 else str.ljust
+        for row, number in zip(rows, numbers, strict=False):
+            row.append(align(number, width))
+        rows[ROWS].append(rng.choice("+*").ljust(width))
+    for row in rows:
+        yield " ".join(row)
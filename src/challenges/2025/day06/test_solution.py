@@ -1,6 +1,9 @@
 """Tests for Day 6: Trash Compactor (Cephalopod Math)"""
 
-from .solution import parse_operators, parse_problems, solve
+from random import Random
+
+from .generator import generate
+from .solution import parse_operators, parse_problems, solve, transpose_right_aligned
 
 
 def test_example(example_file):
@@ -28,7 +31,23 @@ def test_parse_problems():
     assert len(problems) == 4
 
     # Each problem preserves the exact spacing from the original input
-    assert problems[0] == ["123", " 45", "  6"]
-    assert problems[1] == ["328", "64 ", "98 "]
-    assert problems[2] == [" 51", "387", "215"]
-    assert problems[3] == ["64 ", "23 ", "314"]
+    assert problems[0].lines() == ["123", " 45", "  6"]
+    assert problems[1].lines() == ["328", "64 ", "98 "]
+    assert problems[2].lines() == [" 51", "387", "215"]
+    assert problems[3].lines() == ["64 ", "23 ", "314"]
+
+
+def test_transpose_reads_digit_columns():
+    """Test transposed problems read each digit column as a row, short rows padded."""
+    lines = ["123 328", " 45 64", "  6 98"]
+    problems = transpose_right_aligned(parse_problems(lines))
+
+    assert problems[0].lines() == ["1  ", "24 ", "356"]
+    assert problems[1].lines() == ["369", "248", "8  "]
+
+
+def test_generated_worksheet_shape():
+    """Test generated worksheets split back into one problem per operator."""
+    *rows, operator_line = generate(50, Random(3))
+    assert len({len(row) for row in [*rows, operator_line]}) == 1
+    assert len(parse_problems(rows)) == len(parse_operators(operator_line)) == 50
@@ -0,0 +1,31 @@
+"""Synthetic inputs for Day 7: a tachyon manifold of splitters (^) below a start (S)."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from a manifold this wide
+BASE_SIZE = 31
+SPLITTER_DENSITY = 0.8
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """
+    Generate a manifold size columns wide and size + 1 rows tall.
+
+    As in the real input, S is centred in the top row and splitters sit on
+    every other row, on the columns a beam from S can reach by that row.
+    """
+    width = size | 1
+    centre = width // 2
+    yield "." * centre + "S" + "." * centre
+    for row in range(1, width + 1):
+        if row % 2:
+            yield "." * width
+            continue
+        # Row 2k can be reached k - 1, k - 3, ... columns either side of the centre
+        reach = row // 2 - 1
+        cells = ["."] * width
+        for col in range(max(0, centre - reach), min(width, centre + reach + 1), 2):
+            if rng.random() < SPLITTER_DENSITY:
+                cells[col] = "^"
+        yield "".join(cells)
@@ -3,42 +3,53 @@ Advent of Code 2025 - Day 7: Teleporter Lab
 Count tachyon splits and paths.
 """
 
-from functools import cache
+from collections import defaultdict
 from pathlib import Path
 
 from challenges.constants import INPUT_FILE
-from utils import Coordinate, get_grid_size, iterate_over_grid, read_lines
+from utils import Grid, read_lines
+from utils.grid import OUTSIDE
+
+SPLITTER = ord("^")
+
+
+def trace_beams(grid: Grid) -> tuple[int, int]:
+    """
+    Follow every tachyon path down the manifold, one row at a time.
+
+    Paths on the same cell are merged into a count, so each row costs one step
+    per occupied cell however many paths pass through it.
+
+    Returns:
+        The number of splitters hit and the number of paths leaving the grid
+    """
+    cells, stride = grid.cells, grid.stride
+    splits: set[int] = set()
+    exited = 0
+
+    beams = {grid.find("S"): 1}
+    while beams:
+        below: defaultdict[int, int] = defaultdict(int)
+        for index, paths in beams.items():
+            # A splitter sends the beam on down from the cells either side of it
+            if cells[index] == SPLITTER:
+                splits.add(index)
+                targets: tuple[int, ...] = (index - 1, index + 1)
+            else:
+                targets = (index,)
+            for target in targets:
+                if cells[target] == OUTSIDE:
+                    exited += paths
+                else:
+                    below[target + stride] += paths
+        beams = below
+
+    return len(splits), exited
 
 
 def solve(filepath: Path) -> tuple[int, int]:
     """Solve both parts given an input file."""
-    grid = read_lines(filepath)
-    height, width = get_grid_size(grid)
-
-    start_coord: Coordinate = next(iterate_over_grid(grid, condition=lambda x: x == "S"))
-    splitters = set(iterate_over_grid(grid, condition=lambda x: x == "^"))
-    splits: set[Coordinate] = set()
-
-    @cache
-    def count_paths(row: int, col: int) -> int:
-        """Recursively count possible tachyon paths."""
-        # Stop recursion if out of bounds (reached bottom or side)
-        if row >= height or col >= width or col < 0:
-            return 1
-
-        # Split found, check both left and right paths
-        if (row, col) in splitters:
-            # Increment split count
-            splits.add(Coordinate((row, col)))
-            return count_paths(row, col - 1) + count_paths(row, col + 1)
-
-        # Move down a row
-        return count_paths(row + 1, col)
-
-    part2 = count_paths(*start_coord)
-    part1 = len(splits)
-
-    return part1, part2
+    return trace_beams(Grid.from_lines(read_lines(filepath)))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 """Tests for Day 7: Teleporter Lab"""
 
-from .solution import solve
+from utils import Grid
+
+from .solution import solve, trace_beams
 
 
 def test_example(example_file):
@@ -8,3 +10,16 @@ def test_example(example_file):
     part1, part2 = solve(example_file)
     assert part1 == 21
     assert part2 == 40
+
+
+def test_split_at_edges():
+    """Test beams split off the side of the manifold leave it straight away."""
+    grid = Grid.from_lines(["S..", "^..", "...", ".^."])
+    # One path leaves on the left, the other splits again further down
+    assert trace_beams(grid) == (2, 3)
+
+
+def test_deep_manifold():
+    """Test a manifold far deeper than the recursion limit."""
+    grid = Grid.from_lines(["S.", *[".^" if row % 2 else ".." for row in range(5000)]])
+    assert trace_beams(grid) == (0, 1)
@@ -0,0 +1,40 @@
+"""Synthetic inputs for Day 9: red tile coordinates tracing a closed rectilinear loop."""
+
+from collections.abc import Iterator
+from random import Random
+
+# Scaling runs start from this many red tiles
+BASE_SIZE = 32
+MIN_RADIUS = 48_000
+MARGIN = 1_000
+
+# Vertical then horizontal direction of each quadrant's staircase, anticlockwise from the east
+QUADRANTS = ((-1, -1), (1, -1), (1, 1), (-1, 1))
+
+
+def _composition(total: int, parts: int, rng: Random) -> list[int]:
+    """Split total into parts random positive steps."""
+    cuts = sorted(rng.sample(range(1, total), parts - 1))
+    return [b - a for a, b in zip([0, *cuts], [*cuts, total], strict=True)]
+
+
+def generate(size: int, rng: Random) -> Iterator[str]:
+    """
+    Generate about size red tiles, at least eight, as x,y lines.
+
+    The loop is four monotone staircases joining the east, north, west and
+    south extremes of a large square, so it is simple and every corner is a
+    red tile connected to the next by a horizontal or vertical run.
+    """
+    steps = max(1, size // 8)
+    radius = max(MIN_RADIUS, 2 * steps)
+    x, y = 2 * radius + MARGIN, radius + MARGIN
+
+    for dy, dx in QUADRANTS:
+        rises = _composition(radius, steps, rng)
+        runs = _composition(radius, steps, rng)
+        for rise, run in zip(rises, runs, strict=True):
+            y += dy * rise
+            yield f"{x},{y}"
+            x += dx * run
+            yield f"{x},{y}"
@@ -7,7 +7,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from challenges.constants import INPUT_FILE
-from utils import read_lines
+from utils import ints, read_input
+from utils.cache import cached_parser
 
 
 @dataclass
@@ -110,12 +111,6 @@ class Rectangle:
         )
 
 
-def map_coordinate(coord_str: str) -> Coordinate:
-    """Map a coordinate specification string 'x,y' to a Coordinate."""
-    x_str, y_str = coord_str.strip().split(",")
-    return Coordinate(int(x_str), int(y_str))
-
-
 def calculate_area(a: Coordinate, b: Coordinate) -> int:
     """Calculate area of rectangle defined by two corner coordinates."""
     return (abs(a.x - b.x) + 1) * (abs(a.y - b.y) + 1)
@@ -141,10 +136,15 @@ def create_border_lines(red_tiles: list[Coordinate]) -> tuple[list[Line], list[L
     return horizontal_lines, vertical_lines
 
 
+@cached_parser
+def parse_red_tiles(filepath: Path) -> list[Coordinate]:
+    """Parse the red tile coordinates from an input file."""
+    return [Coordinate(x, y) for x, y in ints(read_input(filepath), 2).tolist()]
+
+
 def solve(filepath: Path) -> tuple[int, int]:
     """Solve both parts given an input file."""
-    lines = read_lines(filepath)
-    red_tiles = [map_coordinate(line) for line in lines]
+    red_tiles = parse_red_tiles(filepath)
 
     # Generate all rectangles sorted by area (descending)
     rectangles = [
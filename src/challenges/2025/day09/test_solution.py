@@ -1,5 +1,9 @@
 """Tests for Day 9: Movie Theater"""
 
+from itertools import pairwise
+from random import Random
+
+from .generator import generate
 from .solution import solve
 
 
@@ -8,3 +12,13 @@ def test_example(example_file):
     part1, part2 = solve(example_file)
     assert part1 == 50  # Largest rectangle with any tiles
     assert part2 == 24  # Largest rectangle with only red/green tiles
+
+
+def test_generated_loop_is_rectilinear():
+    """Test generated red tiles form a closed loop of alternating straight runs."""
+    tiles = [tuple(map(int, line.split(","))) for line in generate(200, Random(4))]
+    assert len(set(tiles)) == len(tiles) == 200
+    edges = list(zip(tiles, [*tiles[1:], tiles[0]], strict=True))
+    assert all((a[0] == b[0]) != (a[1] == b[1]) for a, b in edges)
+    vertical = [a[0] == b[0] for a, b in edges]
+    assert all(v != w for v, w in pairwise([*vertical, vertical[0]]))
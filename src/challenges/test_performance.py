@@ -0,0 +1,22 @@
+"""Timing regression checks against the committed baselines in perf_baselines.json."""
+
+import pytest
+
+from runner.perf import check_day, load_baselines
+
+BASELINES = load_baselines()
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    ("year", "day"),
+    [pytest.param(int(key[:4]), int(key[-2:]), id=key) for key in BASELINES],
+)
+def test_no_regression(year, day):
+    """Test a day's median runtime stays within tolerance of its baseline."""
+    check = check_day(year, day, BASELINES)
+    assert check.passed, (
+        f"{year} day {day} took {check.median_ns / 1e6:.1f} ms, "
+        f"{check.ratio:.2f}x its baseline of {check.baseline_ns / 1e6:.1f} ms "
+        f"(tolerance {check.tolerance:.0%}); re-bless with run.py --perf-bless if intended"
+    )
@@ -0,0 +1,26 @@
+"""Shared pytest fixtures for utils and runner tests."""
+
+import importlib
+
+import pytest
+
+from utils import fingerprint
+
+
+@pytest.fixture
+def first_party_package(tmp_path, monkeypatch):
+    """A first-party package whose solution imports a helper, relatively and absolutely."""
+    root = tmp_path / "fakeday"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "helper.py").write_text("def double(x):\n    return 2 * x\n")
+    (root / "other.py").write_text("VALUE = 1\n")
+    (root / "solution.py").write_text(
+        "import json\nfrom .helper import double\n\n\ndef solve(path):\n"
+        "    from fakeday import other  # noqa: PLC0415\n    return double(other.VALUE)\n"
+    )
+    (tmp_path / "input.txt").write_text("1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(fingerprint, "FIRST_PARTY", frozenset({"fakeday"}))
+    importlib.invalidate_caches()
+    return tmp_path
@@ -0,0 +1,12 @@
+"""Infrastructure for running Advent of Code solutions."""
+
+from .core import DayResult, load_solver, module_name, run_day
+from .solver import Solver
+
+__all__ = [
+    "DayResult",
+    "Solver",
+    "load_solver",
+    "module_name",
+    "run_day",
+]
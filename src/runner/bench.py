@@ -0,0 +1,159 @@
+"""Benchmark solutions with warmup, repeats and summary statistics."""
+
+import gc
+import json
+import math
+import statistics
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+
+from .core import format_duration, input_path, load_solver, module_name
+from .solver import Solver
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """How each solution is timed."""
+
+    warmup: int = 1
+    repeats: int = 5
+    gc_enabled: bool = False
+
+
+@dataclass(frozen=True)
+class Stats:
+    """Summary statistics over timing samples, in nanoseconds."""
+
+    runs: int
+    min_ns: int
+    median_ns: float
+    p95_ns: int
+    mean_ns: float
+    stdev_ns: float
+
+    @classmethod
+    def from_samples(cls, samples: list[int]) -> "Stats":
+        """Summarise a non-empty list of samples."""
+        ordered = sorted(samples)
+        # Nearest-rank percentile, well defined for any number of samples
+        p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]
+        return cls(
+            runs=len(ordered),
+            min_ns=ordered[0],
+            median_ns=statistics.median(ordered),
+            p95_ns=p95,
+            mean_ns=statistics.fmean(ordered),
+            stdev_ns=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+
+@dataclass
+class BenchResult:
+    """Timing statistics for one day's solution, per stage and in total."""
+
+    year: int
+    day: int
+    stages: dict[str, Stats] = field(default_factory=dict)
+    error: str | None = None
+
+
+def time_solver(
+    solver: Solver, input_file: Path, parts: Sequence[int], config: BenchConfig
+) -> dict[str, list[int]]:
+    """
+    Run a solver warmup + repeats times and collect timing samples in ns.
+
+    Every stage that ran is sampled separately, next to the "total" of each run.
+    """
+    for _ in range(config.warmup):
+        solver.run(input_file, parts)
+
+    samples: dict[str, list[int]] = {}
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    if not config.gc_enabled:
+        gc.disable()
+    try:
+        for _ in range(config.repeats):
+            start = perf_counter_ns()
+            _, timings = solver.run(input_file, parts)
+            timings["total"] = perf_counter_ns() - start
+            for stage, ns in timings.items():
+                samples.setdefault(stage, []).append(ns)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def bench_day(
+    year: int, day: int, config: BenchConfig, parts: Sequence[int] = (1, 2)
+) -> BenchResult:
+    """Time repeated runs of one day's solver on its input."""
+    result = BenchResult(year, day)
+    name = module_name(year, day)
+
+    try:
+        solver = load_solver(year, day)
+    except ModuleNotFoundError as e:
+        result.error = f"Solution not found: {name}\nError: {e}"
+        return result
+
+    if not all(solver.can_solve(part) for part in parts):
+        result.error = f"{name} has nothing to benchmark for parts {list(parts)}"
+        return result
+
+    try:
+        samples = time_solver(solver, input_path(year, day), parts, config)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    else:
+        result.stages = {stage: Stats.from_samples(values) for stage, values in samples.items()}
+    return result
+
+
+def format_table(results: list[BenchResult]) -> str:
+    """Render benchmark results as a fixed-width table, one row per stage."""
+    header = (
+        f"{'Day':<12} {'Stage':<6} {'Runs':>5} {'Min':>10} {'Median':>10} {'p95':>10} {'Stdev':>10}"
+    )
+    rows = [header, "-" * len(header)]
+    for result in results:
+        label = f"{result.year} {result.day:02d}"
+        if result.error:
+            rows.append(f"{label:<12} {'error':<6}  {result.error}")
+            continue
+        # Total first, then the stages in the order they ran
+        for stage in sorted(result.stages, key=lambda stage: stage != "total"):
+            stats = result.stages[stage]
+            rows.append(
+                f"{label:<12} {stage:<6} {stats.runs:>5} {format_duration(stats.min_ns):>10} "
+                f"{format_duration(stats.median_ns):>10} {format_duration(stats.p95_ns):>10} "
+                f"{format_duration(stats.stdev_ns):>10}"
+            )
+            label = ""
+    return "\n".join(rows)
+
+
+def to_json(results: list[BenchResult], config: BenchConfig) -> str:
+    """Serialise benchmark results and the config that produced them as JSON."""
+    return json.dumps(
+        {
+            "config": asdict(config),
+            "results": [
+                {
+                    "year": result.year,
+                    "day": result.day,
+                    **(
+                        {"error": result.error}
+                        if result.error
+                        else {"stages": {k: asdict(v) for k, v in result.stages.items()}}
+                    ),
+                }
+                for result in results
+            ],
+        },
+        indent=2,
+    )
@@ -0,0 +1,59 @@
+"""Content-addressed on-disk cache of solution results."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.fingerprint import evict_lru, file_digest, source_fingerprint
+
+from .core import CACHE_DIR
+
+
+def result_key(name: str, input_file: Path) -> str:
+    """Get the cache key for running a solution module on an input file."""
+    input_hash = file_digest(input_file)
+    return hashlib.sha256(f"{source_fingerprint(name)}:{input_hash}".encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ResultCache:
+    """
+    Directory of JSON result files, evicted least-recently-used first.
+
+    Reading an entry refreshes its modification time, which is what eviction
+    orders by once the directory grows past max_bytes.
+    """
+
+    directory: Path = CACHE_DIR / "results"
+    max_bytes: int = 1 << 20
+
+    def get(self, key: str) -> dict | None:
+        """Get a cached result, or None on a miss."""
+        path = self.directory / f"{key}.json"
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        """Store a result, silently skipping values JSON cannot represent."""
+        try:
+            data = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        # Write then rename, so concurrent workers never see a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(data, encoding="utf-8")
+        tmp.replace(path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        evict_lru(self.directory, "*.json", self.max_bytes)
@@ -0,0 +1,118 @@
+"""Import and execute a single day's solution."""
+
+import os
+from dataclasses import dataclass, field
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .solver import Solver
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .cache import ResultCache
+
+CHALLENGES_DIR = Path(__file__).resolve().parents[1] / "challenges"
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", CHALLENGES_DIR.parents[1] / ".aoc_cache"))
+
+
+@dataclass
+class DayResult:
+    """Outcome of running one day's solution."""
+
+    year: int
+    day: int
+    answers: dict[int, object] = field(default_factory=dict)
+    timings: dict[str, int] = field(default_factory=dict)
+    cached: bool = False
+    error: str | None = None
+
+
+def module_name(year: int, day: int) -> str:
+    """Get the import path of a day's solution module."""
+    return f"challenges.{year}.day{day:02d}.solution"
+
+
+def format_duration(ns: float) -> str:
+    """Format a duration in nanoseconds with a readable unit."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def input_path(year: int, day: int) -> Path | None:
+    """Get a day's input file without importing its solution, or None if it has none."""
+    try:
+        spec = find_spec(module_name(year, day))
+    except ModuleNotFoundError:
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    return Path(spec.origin).parent / "input.txt"
+
+
+def load_solver(year: int, day: int) -> Solver:
+    """
+    Import a day's solution module and collect its stages.
+
+    Raises:
+        ModuleNotFoundError: If the day has no solution module
+    """
+    return Solver.from_module(import_module(module_name(year, day)))
+
+
+def run_day(
+    year: int,
+    day: int,
+    *,
+    parts: "Sequence[int]" = (1, 2),
+    cache: "ResultCache | None" = None,
+    refresh: bool = False,
+) -> DayResult:
+    """
+    Import a day's solution module and solve the requested parts of its input.
+
+    Failures are recorded on the result instead of raised, so one broken day
+    never prevents the others from running. With a cache, answers computed
+    from identical solution source and input are reused unless refresh is set.
+    """
+    result = DayResult(year, day)
+    name = module_name(year, day)
+
+    key = None
+    cached: dict[str, object] = {}
+    input_file = input_path(year, day)
+    if cache is not None and input_file is not None and input_file.exists():
+        from .cache import result_key  # noqa: PLC0415
+
+        key = result_key(name, input_file)
+        if not refresh:
+            cached = cache.get(key) or {}
+        if all(str(part) in cached for part in parts):
+            result.answers = {part: cached[str(part)] for part in parts}
+            result.cached = True
+            return result
+
+    try:
+        solver = load_solver(year, day)
+    except ModuleNotFoundError as e:
+        result.error = f"Solution not found: {name}\nError: {e}"
+        return result
+
+    missing = [part for part in parts if not solver.can_solve(part)]
+    if missing:
+        result.error = f"{name} defines neither part{missing[0]}() nor solve()"
+        return result
+
+    try:
+        result.answers, result.timings = solver.run(input_file, parts)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    if key is not None:
+        cache.put(key, cached | {str(part): answer for part, answer in result.answers.items()})
+    return result
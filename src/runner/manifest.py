@@ -0,0 +1,137 @@
+"""
+Generated index of available solutions.
+
+Scanning the challenges tree and importing every solution just to find out
+what exists gets slower with every year added. The manifest records each
+day's module once, and is only rebuilt when the modification times of the
+directories it was built from change.
+"""
+
+import json
+import os
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+
+from .core import CACHE_DIR, CHALLENGES_DIR, module_name
+
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+MANIFEST_VERSION = 2
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A day that has a solution, and the module it is imported from."""
+
+    year: int
+    day: int
+    module: str
+
+
+class Manifest:
+    """Available solutions, keyed by (year, day)."""
+
+    def __init__(self, entries: list[ManifestEntry], signature: dict[str, int]):
+        self.entries = {(entry.year, entry.day): entry for entry in entries}
+        self.signature = signature
+
+    def years(self) -> list[int]:
+        """Get all available years."""
+        return sorted({year for year, _ in self.entries})
+
+    def days(self, year: int) -> list[int]:
+        """Get all available days for a year."""
+        return sorted(day for entry_year, day in self.entries if entry_year == year)
+
+    def get(self, year: int, day: int) -> ManifestEntry | None:
+        """Get a day's entry, or None if it has no solution."""
+        return self.entries.get((year, day))
+
+
+def _signature(challenges_dir: Path, paths: list[Path]) -> dict[str, int]:
+    """Get modification times of every path whose change invalidates the manifest."""
+    return {str(path.relative_to(challenges_dir)): path.stat().st_mtime_ns for path in paths}
+
+
+def build_manifest(challenges_dir: Path = CHALLENGES_DIR) -> Manifest:
+    """Scan the challenges tree for solution modules."""
+    import re  # noqa: PLC0415
+
+    entries: list[ManifestEntry] = []
+    if not challenges_dir.exists():
+        return Manifest(entries, {})
+
+    # The challenges, year and day directories change when days, or their
+    # solution files, are added or removed
+    watched = [challenges_dir]
+
+    year_dirs = [path for path in challenges_dir.iterdir() if path.is_dir() and path.name.isdigit()]
+    for year_dir in sorted(year_dirs):
+        watched.append(year_dir)
+        for day_dir in sorted(year_dir.iterdir()):
+            match = re.fullmatch(r"day(\d+)", day_dir.name)
+            solution = day_dir / "solution.py"
+            if not match or not day_dir.is_dir():
+                continue
+            watched.append(day_dir)
+            if not solution.exists():
+                continue
+
+            year, day = int(year_dir.name), int(match.group(1))
+            entries.append(ManifestEntry(year, day, module_name(year, day)))
+
+    return Manifest(entries, _signature(challenges_dir, watched))
+
+
+def _read_manifest(path: Path, challenges_dir: Path) -> Manifest | None:
+    """Read a saved manifest, or None if it is missing or no longer up to date."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != MANIFEST_VERSION or data.get("root") != str(challenges_dir):
+        return None
+
+    signature: dict[str, int] = data["signature"]
+    for relative, mtime in signature.items():
+        try:
+            if (challenges_dir / relative).stat().st_mtime_ns != mtime:
+                return None
+        except FileNotFoundError:
+            return None
+
+    entries = [
+        ManifestEntry(entry["year"], entry["day"], entry["module"]) for entry in data["entries"]
+    ]
+    return Manifest(entries, signature)
+
+
+def _write_manifest(manifest: Manifest, path: Path, challenges_dir: Path) -> None:
+    """Save a manifest, replacing any previous one atomically."""
+    data = {
+        "version": MANIFEST_VERSION,
+        "root": str(challenges_dir),
+        "signature": manifest.signature,
+        "entries": [
+            {"year": entry.year, "day": entry.day, "module": entry.module}
+            for entry in manifest.entries.values()
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_manifest(
+    challenges_dir: Path = CHALLENGES_DIR, path: Path = MANIFEST_FILE, *, rebuild: bool = False
+) -> Manifest:
+    """Load the saved manifest, rebuilding it first if the challenges tree changed."""
+    if not rebuild and (manifest := _read_manifest(path, challenges_dir)) is not None:
+        return manifest
+
+    manifest = build_manifest(challenges_dir)
+    # A read-only checkout still works, it just rescans every time
+    with suppress(OSError):
+        _write_manifest(manifest, path, challenges_dir)
+    return manifest
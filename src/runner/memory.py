@@ -0,0 +1,152 @@
+"""Measure how much memory solutions allocate, per day and per stage."""
+
+import sys
+import tracemalloc
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .core import input_path, load_solver
+
+# Allocations made by the measuring itself are not the solution's
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+@dataclass
+class StageMemory:
+    """Memory traced while one stage ran, relative to when it started."""
+
+    stage: str
+    peak_bytes: int
+    net_bytes: int
+
+
+@dataclass
+class AllocationSite:
+    """A source line and the memory still allocated there."""
+
+    location: str
+    size_bytes: int
+    count: int
+
+
+@dataclass
+class MemoryResult:
+    """Memory profile of one day's solution."""
+
+    year: int
+    day: int
+    answers: dict[int, object] = field(default_factory=dict)
+    stages: list[StageMemory] = field(default_factory=list)
+    peak_bytes: int = 0
+    net_bytes: int = 0
+    max_rss_bytes: int | None = None
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+
+def max_rss_bytes() -> int | None:
+    """Get the peak resident set size of this process, if the platform reports it."""
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux and the BSDs kilobytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _top_sites(snapshot: tracemalloc.Snapshot, limit: int) -> list[AllocationSite]:
+    """Group a snapshot's live allocations by line, largest first."""
+    sites = []
+    for stat in snapshot.filter_traces(IGNORED).statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        location = f"{Path(frame.filename).name}:{frame.lineno}"
+        sites.append(AllocationSite(location, stat.size, stat.count))
+    return sites
+
+
+def measure_day(
+    year: int, day: int, *, parts: Sequence[int] = (1, 2), top: int = 10
+) -> MemoryResult:
+    """
+    Run a day's solver with tracemalloc and record its allocations.
+
+    Peaks are measured from the start of the day or stage, so they exclude
+    whatever the interpreter already held. Allocation sites are taken from a
+    snapshot at the end of whichever stage had the most memory live.
+
+    Raises:
+        ModuleNotFoundError: If the day has no solution module
+    """
+    solver = load_solver(year, day)
+    input_file = input_path(year, day)
+    result = MemoryResult(year, day)
+    heaviest = -1
+
+    @contextmanager
+    def traced(stage: str) -> Iterator[None]:
+        nonlocal heaviest
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        yield
+        current, peak = tracemalloc.get_traced_memory()
+        result.stages.append(StageMemory(stage, peak - before, current - before))
+        result.peak_bytes = max(result.peak_bytes, peak - baseline)
+        if current > heaviest:
+            # Summarise straight away, so the snapshot is not held during later stages
+            heaviest = current
+            result.top_sites = _top_sites(tracemalloc.take_snapshot(), top)
+
+    tracemalloc.start()
+    try:
+        # Warm the pattern caches snapshot filtering uses, so they are not counted
+        tracemalloc.take_snapshot().filter_traces(IGNORED)
+        baseline = tracemalloc.get_traced_memory()[0]
+        result.answers, _ = solver.run(input_file, parts, around=traced)
+        result.net_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    result.max_rss_bytes = max_rss_bytes()
+    return result
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a binary unit."""
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if abs(size) >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size:.0f} B"
+
+
+def format_report(result: MemoryResult, budget_bytes: int | None = None) -> str:
+    """Render a day's memory profile, flagging it if it exceeds the budget."""
+    lines = [f"{'Stage':<8} {'Peak':>12} {'Net':>12}"]
+    lines.extend(
+        f"{stage.stage:<8} {format_bytes(stage.peak_bytes):>12} {format_bytes(stage.net_bytes):>12}"
+        for stage in result.stages
+    )
+    lines.append(
+        f"{'day':<8} {format_bytes(result.peak_bytes):>12} {format_bytes(result.net_bytes):>12}"
+    )
+    if result.max_rss_bytes is not None:
+        lines.append(f"Process max RSS: {format_bytes(result.max_rss_bytes)}")
+    if budget_bytes is not None and result.peak_bytes > budget_bytes:
+        lines.append(
+            f"OVER BUDGET: peak {format_bytes(result.peak_bytes)} "
+            f"exceeds {format_bytes(budget_bytes)}"
+        )
+
+    if result.top_sites:
+        lines.append("\nTop allocation sites:")
+        lines.extend(
+            f"  {format_bytes(site.size_bytes):>12} {site.count:>9} blocks  {site.location}"
+            for site in result.top_sites
+        )
+    return "\n".join(lines)
@@ -0,0 +1,73 @@
+"""Run several days' solutions in a pool of worker processes."""
+
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from .core import DayResult, run_day
+
+if TYPE_CHECKING:
+    from .cache import ResultCache
+
+
+def _run_alone(year: int, day: int, **options: object) -> DayResult:
+    """Run a day in a worker process of its own, so a crash fails no other day."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(run_day, year, day, **options).result()
+        except BrokenProcessPool:
+            return DayResult(year, day, error="Worker process died while solving")
+
+
+def _broken(future: Future) -> bool:
+    """Check whether a future failed because its pool lost a worker."""
+    return isinstance(future.exception(), BrokenProcessPool)
+
+
+def _result(year: int, day: int, future: Future) -> DayResult:
+    """Get a day's result from its future, recording an exception as a failed day."""
+    try:
+        return future.result()
+    except Exception as e:
+        return DayResult(year, day, error=f"{type(e).__name__}: {e}")
+
+
+def run_days_parallel(
+    targets: list[tuple[int, int]],
+    jobs: int | None = None,
+    *,
+    parts: Sequence[int] = (1, 2),
+    cache: "ResultCache | None" = None,
+    refresh: bool = False,
+) -> Iterator[DayResult]:
+    """
+    Run (year, day) targets in worker processes, yielding results in target order.
+
+    Every day is submitted up front, so the wall-clock time of the whole batch is
+    bounded by the slowest day rather than the sum of all days. A worker that dies
+    breaks the whole pool, so every day it left unfinished is run again, one at
+    a time in a process of its own, and only a day that crashes again is
+    reported failed.
+
+    Args:
+        targets: (year, day) pairs to run
+        jobs: Number of worker processes; None uses every available CPU
+        parts: Which parts to solve
+        cache: Result cache shared by the workers, or None to always solve
+        refresh: Recompute every day and overwrite its cached result
+    """
+    options = {"parts": parts, "cache": cache, "refresh": refresh}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_day, year, day, **options) for year, day in targets]
+        for index, future in enumerate(futures):
+            if _broken(future):
+                break
+            yield _result(*targets[index], future)
+        else:
+            return
+
+    # Days that finished before the crash keep their results. The retries run
+    # after the broken pool has shut down, so no other threads exist to fork
+    for (year, day), future in zip(targets[index:], futures[index:], strict=True):
+        yield _run_alone(year, day, **options) if _broken(future) else _result(year, day, future)
@@ -0,0 +1,111 @@
+"""
+Performance regression gate against committed timing baselines.
+
+Baselines are medians of repeated runs, stored per day in a JSON file that is
+committed next to the solutions. A day fails the gate when its re-measured
+median is slower than the baseline by more than the tolerance, and by more
+than a small absolute margin so that millisecond days do not fail on
+scheduler noise alone. After an intentional change, re-bless the baselines
+and commit the updated file.
+"""
+
+import json
+import os
+import platform
+import statistics
+from dataclasses import dataclass
+from pathlib import Path
+
+from .bench import BenchConfig, time_solver
+from .core import CHALLENGES_DIR, input_path, load_solver
+
+BASELINE_FILE = CHALLENGES_DIR / "perf_baselines.json"
+DEFAULT_TOLERANCE = float(os.environ.get("AOC_PERF_TOLERANCE", "0.25"))
+DEFAULT_CONFIG = BenchConfig(warmup=1, repeats=5)
+NOISE_FLOOR_NS = 10_000_000
+
+
+@dataclass(frozen=True)
+class PerfCheck:
+    """A day's re-measured median compared with its baseline."""
+
+    year: int
+    day: int
+    baseline_ns: float
+    median_ns: float
+    tolerance: float
+    noise_floor_ns: int = NOISE_FLOOR_NS
+
+    @property
+    def ratio(self) -> float:
+        """How many times slower than the baseline (below 1 is faster)."""
+        return self.median_ns / self.baseline_ns
+
+    @property
+    def passed(self) -> bool:
+        """Check the median is within tolerance, or the noise floor, of the baseline."""
+        slower_by = self.median_ns - self.baseline_ns
+        return self.ratio <= 1 + self.tolerance or slower_by <= self.noise_floor_ns
+
+
+def baseline_key(year: int, day: int) -> str:
+    """Get the key a day's baseline is stored under."""
+    return f"{year}-day{day:02d}"
+
+
+def load_baselines(path: Path = BASELINE_FILE) -> dict[str, dict]:
+    """Load stored baselines, keyed by baseline_key."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))["baselines"]
+
+
+def measure_median(year: int, day: int, config: BenchConfig = DEFAULT_CONFIG) -> float:
+    """Measure the median total runtime of a day's solver in nanoseconds."""
+    solver = load_solver(year, day)
+    samples = time_solver(solver, input_path(year, day), (1, 2), config)
+    return statistics.median(samples["total"])
+
+
+def check_day(
+    year: int,
+    day: int,
+    baselines: dict[str, dict],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+    config: BenchConfig = DEFAULT_CONFIG,
+) -> PerfCheck:
+    """
+    Re-measure a day and compare it with its baseline.
+
+    Raises:
+        KeyError: If the day has no baseline yet
+    """
+    baseline = baselines[baseline_key(year, day)]
+    return PerfCheck(year, day, baseline["median_ns"], measure_median(year, day, config), tolerance)
+
+
+def bless(
+    targets: list[tuple[int, int]],
+    path: Path = BASELINE_FILE,
+    config: BenchConfig = DEFAULT_CONFIG,
+) -> dict[str, dict]:
+    """Re-measure targets and store their medians as the new baselines."""
+    baselines = load_baselines(path)
+    for year, day in targets:
+        baselines[baseline_key(year, day)] = {
+            "median_ns": round(measure_median(year, day, config)),
+            "repeats": config.repeats,
+        }
+
+    data = {
+        # Baselines only compare meaningfully on similar machines
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(terse=True),
+            "processor": platform.machine(),
+        },
+        "baselines": dict(sorted(baselines.items())),
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return baselines
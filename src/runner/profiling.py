@@ -0,0 +1,140 @@
+"""Deterministic profiling of solutions with cProfile."""
+
+import cProfile
+import io
+import pstats
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .core import CACHE_DIR, input_path, load_solver
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+
+# pstats identifies a function by (filename, line number, function name)
+Function = tuple[str, int, str]
+
+
+@dataclass
+class ProfileResult:
+    """Where a day's profile was saved, and what it recorded."""
+
+    year: int
+    day: int
+    answers: dict[int, object]
+    stats: pstats.Stats
+    pstats_file: Path
+    collapsed_file: Path
+
+
+def label(func: Function) -> str:
+    """Format a function as 'name (file:line)' for reports and stack frames."""
+    filename, lineno, name = func
+    if filename == "~":
+        # Built-ins have no source location
+        return name
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+def profile_day(
+    year: int, day: int, *, parts: Sequence[int] = (1, 2), out_dir: Path = PROFILE_DIR
+) -> ProfileResult:
+    """
+    Run a day's solver under cProfile and save the results.
+
+    Writes a .pstats file for pstats/snakeviz and a .folded file of collapsed
+    stacks for flamegraph tools, both named after the year and day.
+
+    Raises:
+        ModuleNotFoundError: If the day has no solution module
+    """
+    solver = load_solver(year, day)
+    input_file = input_path(year, day)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        answers, _ = solver.run(input_file, parts)
+    finally:
+        profiler.disable()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{year}-day{day:02d}"
+    pstats_file = out_dir / f"{stem}.pstats"
+    collapsed_file = out_dir / f"{stem}.folded"
+
+    profiler.dump_stats(pstats_file)
+    stats = pstats.Stats(profiler)
+    collapsed_file.write_text("\n".join(collapsed_stacks(stats)) + "\n", encoding="utf-8")
+
+    return ProfileResult(year, day, answers, stats, pstats_file, collapsed_file)
+
+
+def top_functions(stats: pstats.Stats, sort: str, limit: int) -> str:
+    """Render the top functions by 'cumulative' or 'tottime' in pstats' format."""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(sort).print_stats(limit)
+    stats.stream = None
+    # Drop pstats' preamble up to the column header
+    report = stream.getvalue()
+    start = report.find("   ncalls")
+    return report[start:].rstrip() if start >= 0 else report.rstrip()
+
+
+def collapsed_stacks(stats: pstats.Stats, min_us: int = 1) -> list[str]:
+    """
+    Reconstruct collapsed stacks ('root;caller;callee self_us') from a profile.
+
+    cProfile only records caller/callee edges, not full stacks, so time is
+    attributed down each path in proportion to the cumulative time of the edge
+    taken, as flameprof does. Recursive edges are cut and paths worth less
+    than min_us are pruned to keep the output bounded.
+    """
+    raw: dict[Function, tuple] = stats.stats
+    callees: dict[Function, dict[Function, float]] = {}
+    for func, (*_, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    totals: dict[str, float] = {}
+
+    def walk(func: Function, stack: tuple[str, ...], fraction: float) -> None:
+        _, _, own_time, cumulative, _ = raw[func]
+        if cumulative * fraction * 1e6 < min_us:
+            return
+        stack = (*stack, label(func).replace(";", ":"))
+        key = ";".join(stack)
+        totals[key] = totals.get(key, 0.0) + own_time * fraction
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_total = raw[callee][3]
+            if callee_total > 0 and label(callee) not in stack:
+                walk(callee, stack, fraction * edge_time / callee_total)
+
+    roots = [func for func, (*_, callers) in raw.items() if not callers]
+    for root in roots:
+        walk(root, (), 1.0)
+
+    return [f"{key} {round(seconds * 1e6)}" for key, seconds in totals.items() if seconds > 0]
+
+
+def diff_profiles(old: Path, new: Path, limit: int = 20) -> str:
+    """Compare two saved profiles, listing the functions whose time changed most."""
+    before: dict[Function, tuple] = pstats.Stats(str(old)).stats
+    after: dict[Function, tuple] = pstats.Stats(str(new)).stats
+
+    rows = []
+    for func in before.keys() | after.keys():
+        old_self, old_cum = before[func][2:4] if func in before else (0.0, 0.0)
+        new_self, new_cum = after[func][2:4] if func in after else (0.0, 0.0)
+        rows.append((new_cum - old_cum, new_self - old_self, old_cum, new_cum, func))
+    rows.sort(key=lambda row: abs(row[0]), reverse=True)
+
+    header = f"{'Δcum ms':>10} {'Δself ms':>10} {'old cum':>10} {'new cum':>10}  function"
+    lines = [header, "-" * len(header)]
+    lines.extend(
+        f"{d_cum * 1e3:>+10.2f} {d_self * 1e3:>+10.2f} {old_cum * 1e3:>10.2f} "
+        f"{new_cum * 1e3:>10.2f}  {label(func)}"
+        for d_cum, d_self, old_cum, new_cum, func in rows[:limit]
+    )
+    return "\n".join(lines)
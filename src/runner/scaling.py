@@ -0,0 +1,174 @@
+"""
+Empirical complexity of solutions, from timings across generated input sizes.
+
+Each day runs on a geometric series of synthetic inputs. The slope of a
+least-squares line through log(size) against log(time) estimates the exponent
+k in time ~ size^k, and likewise for peak memory. Sizes are in the units of
+the day's generator, so a grid side doubling means four times the cells.
+"""
+
+import csv
+import io
+import math
+import statistics
+import tracemalloc
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .bench import BenchConfig, time_solver
+from .core import format_duration, load_solver, module_name
+from .memory import format_bytes
+from .solver import Solver
+from .synthetic import base_size, synthetic_input
+
+# Fixed costs distort the smallest sizes, so only the largest few are fitted
+FIT_POINTS = 4
+
+
+@dataclass(frozen=True)
+class ScalingConfig:
+    """Which sizes each day runs on, and how each size is measured."""
+
+    factor: int = 2
+    steps: int = 6
+    repeats: int = 3
+    seed: int = 0
+    max_seconds: float = 10.0
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    """Measurements of one day at one input size."""
+
+    size: int
+    input_bytes: int
+    median_ns: float
+    peak_bytes: int
+
+
+@dataclass
+class ScalingResult:
+    """How one day's runtime and memory grow with its input size."""
+
+    year: int
+    day: int
+    points: list[ScalingPoint] = field(default_factory=list)
+    stopped: str | None = None
+    error: str | None = None
+
+    @property
+    def time_exponent(self) -> float | None:
+        """Fitted exponent of runtime against size, if enough sizes ran."""
+        tail = self.points[-FIT_POINTS:]
+        return loglog_slope([point.size for point in tail], [point.median_ns for point in tail])
+
+    @property
+    def memory_exponent(self) -> float | None:
+        """Fitted exponent of peak memory against size, if enough sizes ran."""
+        tail = self.points[-FIT_POINTS:]
+        return loglog_slope([point.size for point in tail], [point.peak_bytes for point in tail])
+
+
+def loglog_slope(xs: Sequence[float], ys: Sequence[float]) -> float | None:
+    """Least-squares slope of log(y) against log(x), or None if it is undefined."""
+    pairs = [(math.log(x), math.log(y)) for x, y in zip(xs, ys, strict=True) if x > 0 and y > 0]
+    if len({x for x, _ in pairs}) < 2:
+        return None
+    return statistics.linear_regression(*zip(*pairs, strict=True)).slope
+
+
+def peak_memory(solver: Solver, input_file: Path, parts: Sequence[int]) -> int:
+    """Run a solver once under tracemalloc and get its peak traced memory in bytes."""
+    tracemalloc.start()
+    try:
+        solver.run(input_file, parts)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_scaling(
+    year: int, day: int, config: ScalingConfig, parts: Sequence[int] = (1, 2)
+) -> ScalingResult:
+    """
+    Time a day's solver on growing synthetic inputs.
+
+    Memory is measured in a separate run, as tracing slows the solver down.
+    The series stops early at the first size whose median exceeds
+    max_seconds, or that fails, keeping the sizes measured before it.
+    """
+    result = ScalingResult(year, day)
+    try:
+        solver = load_solver(year, day)
+        size = base_size(year, day)
+    except ModuleNotFoundError as e:
+        result.error = f"Solution or generator not found for {module_name(year, day)}\nError: {e}"
+        return result
+
+    timing = BenchConfig(warmup=0, repeats=config.repeats)
+    for _ in range(config.steps):
+        try:
+            input_file = synthetic_input(year, day, size, seed=config.seed)
+            median_ns = statistics.median(time_solver(solver, input_file, parts, timing)["total"])
+            peak_bytes = peak_memory(solver, input_file, parts)
+        except Exception as e:
+            result.stopped = f"size {size}: {type(e).__name__}: {e}"
+            break
+
+        result.points.append(ScalingPoint(size, input_file.stat().st_size, median_ns, peak_bytes))
+        if median_ns > config.max_seconds * 1e9:
+            result.stopped = f"size {size} took over {config.max_seconds:g} s"
+            break
+        size *= config.factor
+
+    return result
+
+
+def _exponent(value: float | None) -> str:
+    """Format a fitted exponent for the table."""
+    return "n/a" if value is None else f"{value:.2f}"
+
+
+def format_table(results: list[ScalingResult]) -> str:
+    """Render scaling curves as a table, with the fitted exponents under each day."""
+    header = f"{'Day':<12} {'Size':>10} {'Input':>12} {'Median':>10} {'Peak mem':>12}"
+    rows = [header, "-" * len(header)]
+    for result in results:
+        label = f"{result.year} {result.day:02d}"
+        if result.error:
+            rows.append(f"{label:<12} error  {result.error}")
+            continue
+        for point in result.points:
+            rows.append(
+                f"{label:<12} {point.size:>10} {format_bytes(point.input_bytes):>12} "
+                f"{format_duration(point.median_ns):>10} {format_bytes(point.peak_bytes):>12}"
+            )
+            label = ""
+        rows.append(
+            f"{'':<12} time ~ n^{_exponent(result.time_exponent)}, "
+            f"memory ~ n^{_exponent(result.memory_exponent)}"
+        )
+        if result.stopped:
+            rows.append(f"{'':<12} stopped at {result.stopped}")
+    return "\n".join(rows)
+
+
+def to_csv(results: list[ScalingResult]) -> str:
+    """Serialise every measured point as CSV, one row per day and size."""
+    stream = io.StringIO()
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(["year", "day", "size", "input_bytes", "median_ns", "peak_bytes"])
+    for result in results:
+        writer.writerows(
+            [
+                result.year,
+                result.day,
+                point.size,
+                point.input_bytes,
+                round(point.median_ns),
+                point.peak_bytes,
+            ]
+            for point in result.points
+        )
+    return stream.getvalue()
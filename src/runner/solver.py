@@ -0,0 +1,82 @@
+"""Discover and run the entry points a solution module exposes."""
+
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from types import ModuleType
+
+STAGES = ("parse", "part1", "part2", "solve")
+
+
+@dataclass(frozen=True)
+class Solver:
+    """
+    A solution module's stages.
+
+    The staged protocol is an optional parse(path) whose return value is passed
+    to part1(data) and part2(data); without parse, the parts receive the input
+    path itself. A module-level solve(path) returning both answers is used for
+    any part that has no stage of its own.
+    """
+
+    parse: Callable | None = None
+    part1: Callable | None = None
+    part2: Callable | None = None
+    solve: Callable | None = None
+
+    @classmethod
+    def from_module(cls, module: ModuleType) -> "Solver":
+        """Collect whichever stages a module defines."""
+        return cls(**{stage: getattr(module, stage, None) for stage in STAGES})
+
+    @property
+    def stages(self) -> tuple[str, ...]:
+        """Names of the stages this solver defines."""
+        return tuple(stage for stage in STAGES if getattr(self, stage) is not None)
+
+    def can_solve(self, part: int) -> bool:
+        """Check whether a part can be computed, by its own stage or by solve."""
+        return self.solve is not None or getattr(self, f"part{part}") is not None
+
+    def run(
+        self,
+        input_file: Path,
+        parts: Iterable[int] = (1, 2),
+        *,
+        around: Callable[[str], AbstractContextManager] | None = None,
+    ) -> tuple[dict[int, object], dict[str, int]]:
+        """
+        Compute the requested parts, running each stage at most once.
+
+        Parsing happens once and is shared by both parts; solve only runs when a
+        requested part has no stage of its own. If given, around(stage) is
+        entered for the duration of each stage, to take extra measurements.
+
+        Returns:
+            Answers keyed by part number and stage timings in nanoseconds
+        """
+        answers: dict[int, object] = {}
+        timings: dict[str, int] = {}
+
+        def timed(stage: str, func: Callable, arg: object) -> object:
+            with around(stage) if around else nullcontext():
+                start = perf_counter_ns()
+                value = func(arg)
+                timings[stage] = perf_counter_ns() - start
+            return value
+
+        staged = [part for part in parts if getattr(self, f"part{part}") is not None]
+        if staged:
+            data = timed("parse", self.parse, input_file) if self.parse else input_file
+            for part in staged:
+                answers[part] = timed(f"part{part}", getattr(self, f"part{part}"), data)
+
+        remaining = [part for part in parts if part not in answers]
+        if remaining and self.solve is not None:
+            both = timed("solve", self.solve, input_file)
+            for part in remaining:
+                answers[part] = both[part - 1]
+
+        return answers, timings
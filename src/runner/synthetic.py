@@ -0,0 +1,78 @@
+"""
+Synthetic inputs at arbitrary scale, from each day's generator module.
+
+A day opts in by defining generate(size, rng) in a generator.py next to its
+solution, yielding the lines of a valid puzzle input. What size counts
+(rotations, ranges, grid side, red tiles) is up to the day and documented on
+its generate(), and an optional BASE_SIZE sets where scaling runs start.
+Generated files are written once per day, size, seed and
+generator source, and reused after that.
+"""
+
+from collections.abc import Callable, Iterable
+from importlib import import_module
+from pathlib import Path
+from random import Random
+
+from utils.fingerprint import source_fingerprint
+
+from .core import CACHE_DIR
+
+SYNTHETIC_DIR = CACHE_DIR / "synthetic"
+DEFAULT_BASE_SIZE = 100
+
+Generator = Callable[[int, Random], Iterable[str]]
+
+
+def generator_name(year: int, day: int) -> str:
+    """Get the import path of a day's input generator module."""
+    return f"challenges.{year}.day{day:02d}.generator"
+
+
+def load_generator(year: int, day: int) -> Generator:
+    """
+    Import a day's generate(size, rng) function.
+
+    Raises:
+        ModuleNotFoundError: If the day has no generator module
+    """
+    return import_module(generator_name(year, day)).generate
+
+
+def base_size(year: int, day: int) -> int:
+    """
+    Get the smallest input size worth timing for a day.
+
+    Raises:
+        ModuleNotFoundError: If the day has no generator module
+    """
+    return getattr(import_module(generator_name(year, day)), "BASE_SIZE", DEFAULT_BASE_SIZE)
+
+
+def write_input(year: int, day: int, size: int, path: Path, *, seed: int = 0) -> Path:
+    """Generate an input of the given size and seed, streaming it to a file."""
+    generate = load_generator(year, day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as file:
+        for line in generate(size, Random(seed)):
+            file.write(line)
+            file.write("\n")
+    return path
+
+
+def synthetic_input(
+    year: int, day: int, size: int, *, seed: int = 0, directory: Path = SYNTHETIC_DIR
+) -> Path:
+    """
+    Get a generated input file, generating it only if it does not exist yet.
+
+    Raises:
+        ModuleNotFoundError: If the day has no generator module
+    """
+    fingerprint = source_fingerprint(generator_name(year, day))[:12]
+    path = directory / f"{year}-day{day:02d}-{size}-{seed}-{fingerprint}.txt"
+    if not path.exists():
+        # Write under a temporary name so an interrupted run never leaves a partial input
+        tmp = write_input(year, day, size, path.with_suffix(".tmp"), seed=seed)
+        tmp.replace(path)
+    return path
@@ -0,0 +1,111 @@
+"""Tests for benchmark statistics and the timing loop."""
+
+import gc
+import statistics
+
+import pytest
+
+from runner.bench import BenchConfig, Stats, time_solver
+from runner.solver import Solver
+
+
+class TestStats:
+    """Test summary statistics over timing samples."""
+
+    def test_summary(self):
+        stats = Stats.from_samples([50, 10, 40, 20, 30])
+        assert (stats.runs, stats.min_ns, stats.median_ns) == (5, 10, 30)
+        assert stats.mean_ns == 30
+        assert stats.stdev_ns == pytest.approx(statistics.stdev([10, 20, 30, 40, 50]))
+
+    def test_even_number_of_samples(self):
+        assert Stats.from_samples([4, 1, 3, 2]).median_ns == 2.5
+
+    @pytest.mark.parametrize(
+        ("runs", "p95"),
+        [(1, 1), (2, 2), (19, 19), (20, 19), (21, 20), (100, 95)],
+    )
+    def test_nearest_rank_p95(self, runs, p95):
+        assert Stats.from_samples(list(range(runs, 0, -1))).p95_ns == p95
+
+    def test_single_sample(self):
+        stats = Stats.from_samples([7])
+        assert (stats.runs, stats.min_ns, stats.median_ns, stats.p95_ns) == (1, 7, 7, 7)
+        assert stats.stdev_ns == 0.0
+
+
+class Recorder:
+    """Stages that count their calls and note whether the GC was enabled."""
+
+    def __init__(self):
+        self.calls = 0
+        self.gc_states = []
+
+    def parse(self, path):
+        self.calls += 1
+        self.gc_states.append(gc.isenabled())
+        return path
+
+    def solver(self):
+        return Solver(parse=self.parse, part1=lambda _: 1, part2=lambda _: 2)
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def gc_enabled():
+    """Start a test with the GC enabled, and leave it enabled afterwards."""
+    was_enabled = gc.isenabled()
+    gc.enable()
+    yield
+    if not was_enabled:
+        gc.disable()
+
+
+@pytest.mark.usefixtures("gc_enabled")
+class TestTimeSolver:
+    """Test warmup, repeats and the GC toggle of the timing loop."""
+
+    def test_samples_only_repeats(self, recorder, tmp_path):
+        config = BenchConfig(warmup=2, repeats=3)
+        samples = time_solver(recorder.solver(), tmp_path, (1, 2), config)
+        assert recorder.calls == 5
+        assert set(samples) == {"parse", "part1", "part2", "total"}
+        assert all(len(values) == 3 for values in samples.values())
+        assert all(
+            total >= parse + part1 + part2
+            for total, parse, part1, part2 in zip(
+                samples["total"], samples["parse"], samples["part1"], samples["part2"], strict=True
+            )
+        )
+
+    def test_only_requested_parts(self, recorder, tmp_path):
+        samples = time_solver(recorder.solver(), tmp_path, (2,), BenchConfig(warmup=0, repeats=1))
+        assert set(samples) == {"parse", "part2", "total"}
+
+    def test_gc_disabled_while_timing(self, recorder, tmp_path):
+        time_solver(recorder.solver(), tmp_path, (1,), BenchConfig(warmup=1, repeats=2))
+        # Warmup runs with the GC as it was, timed repeats without it
+        assert recorder.gc_states == [True, False, False]
+        assert gc.isenabled()
+
+    def test_gc_kept_enabled(self, recorder, tmp_path):
+        config = BenchConfig(warmup=0, repeats=2, gc_enabled=True)
+        time_solver(recorder.solver(), tmp_path, (1,), config)
+        assert recorder.gc_states == [True, True]
+
+    def test_gc_restored_after_failure(self, tmp_path):
+        def fail(_):
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            time_solver(Solver(part1=fail), tmp_path, (1,), BenchConfig(warmup=0))
+        assert gc.isenabled()
+
+    def test_gc_left_disabled(self, recorder, tmp_path):
+        gc.disable()
+        time_solver(recorder.solver(), tmp_path, (1,), BenchConfig(warmup=0, repeats=1))
+        assert not gc.isenabled()
@@ -0,0 +1,48 @@
+"""Tests for the result cache."""
+
+import os
+
+from runner.cache import ResultCache, result_key
+
+
+class TestResultCache:
+    """Test storing, invalidating and evicting cached results."""
+
+    def test_round_trip(self, tmp_path):
+        cache = ResultCache(tmp_path / "results")
+        assert cache.get("key") is None
+        cache.put("key", {"1": 42, "2": "answer"})
+        assert cache.get("key") == {"1": 42, "2": "answer"}
+
+    def test_unserialisable_values_are_skipped(self, tmp_path):
+        cache = ResultCache(tmp_path / "results")
+        cache.put("key", {"1": object()})
+        assert cache.get("key") is None
+
+    def test_key_changes_with_source_and_input(self, first_party_package):
+        input_file = first_party_package / "input.txt"
+        key = result_key("fakeday.solution", input_file)
+        assert result_key("fakeday.solution", input_file) == key
+
+        input_file.write_text("2\n")
+        changed_input = result_key("fakeday.solution", input_file)
+        assert changed_input != key
+
+        helper = first_party_package / "fakeday" / "helper.py"
+        helper.write_text(helper.read_text().replace("2 * x", "x + x"))
+        assert result_key("fakeday.solution", input_file) not in (key, changed_input)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        # Each entry is 8 bytes, so two fit
+        cache = ResultCache(tmp_path / "results", max_bytes=20)
+        cache.put("old", {"1": 1})
+        cache.put("used", {"1": 2})
+        # Make the order unambiguous, then touch "used" by reading it
+        for age, key in enumerate(["used", "old"], 1):
+            path = cache.directory / f"{key}.json"
+            os.utime(path, ns=(path.stat().st_mtime_ns - age * 10**9,) * 2)
+        assert cache.get("used") == {"1": 2}
+        cache.put("new", {"1": 3})
+        assert cache.get("old") is None
+        assert cache.get("used") == {"1": 2}
+        assert cache.get("new") == {"1": 3}
@@ -0,0 +1,88 @@
+"""Tests for the generated index of solutions."""
+
+import os
+
+import pytest
+
+from runner import manifest
+from runner.manifest import load_manifest
+
+
+@pytest.fixture
+def challenges(tmp_path):
+    """A challenges tree with solutions for two days of one year."""
+    root = tmp_path / "challenges"
+    for day in (1, 3):
+        day_dir = root / "2025" / f"day{day:02d}"
+        day_dir.mkdir(parents=True)
+        (day_dir / "solution.py").write_text("def solve(path):\n    return 1, 2\n")
+    # Neither a day without a solution nor a stray directory is listed
+    (root / "2025" / "day02").mkdir()
+    (root / "2025" / "notes").mkdir()
+    return root
+
+
+def age(path):
+    """Set a path's mtime back a minute, so any later change is visible at any resolution."""
+    mtime = path.stat().st_mtime_ns - 60 * 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Count how many times the tree is scanned."""
+    calls = []
+    build = manifest.build_manifest
+
+    def counted(challenges_dir):
+        calls.append(challenges_dir)
+        return build(challenges_dir)
+
+    monkeypatch.setattr(manifest, "build_manifest", counted)
+    return calls
+
+
+class TestManifest:
+    """Test listing days and rebuilding when the tree changes."""
+
+    def test_lists_days_with_solutions(self, challenges, tmp_path):
+        loaded = load_manifest(challenges, tmp_path / "manifest.json")
+        assert loaded.years() == [2025]
+        assert loaded.days(2025) == [1, 3]
+        assert loaded.get(2025, 3).module == "challenges.2025.day03.solution"
+        assert loaded.get(2025, 2) is None
+
+    def test_reused_while_unchanged(self, challenges, tmp_path, builds):
+        path = tmp_path / "manifest.json"
+        first = load_manifest(challenges, path)
+        second = load_manifest(challenges, path)
+        assert len(builds) == 1
+        assert second.entries == first.entries
+
+    def test_rebuilt_when_a_day_is_added(self, challenges, tmp_path, builds):
+        path = tmp_path / "manifest.json"
+        for directory in (challenges, challenges / "2025", challenges / "2025" / "day02"):
+            age(directory)
+        load_manifest(challenges, path)
+        (challenges / "2025" / "day02" / "solution.py").write_text("def solve(path): ...\n")
+        assert load_manifest(challenges, path).days(2025) == [1, 2, 3]
+        assert len(builds) == 2
+
+    def test_rebuilt_when_an_mtime_changes(self, challenges, tmp_path, builds):
+        path = tmp_path / "manifest.json"
+        load_manifest(challenges, path)
+        age(challenges / "2025" / "day01")
+        load_manifest(challenges, path)
+        assert len(builds) == 2
+
+    def test_rebuilt_when_a_day_is_removed(self, challenges, tmp_path):
+        path = tmp_path / "manifest.json"
+        load_manifest(challenges, path)
+        (challenges / "2025" / "day03" / "solution.py").unlink()
+        (challenges / "2025" / "day03").rmdir()
+        assert load_manifest(challenges, path).days(2025) == [1]
+
+    def test_corrupt_manifest_is_rebuilt(self, challenges, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+        assert load_manifest(challenges, path).days(2025) == [1, 3]
@@ -0,0 +1,101 @@
+"""Tests for per-stage memory measurement."""
+
+import pytest
+
+from runner import memory
+from runner.memory import format_bytes, format_report, measure_day
+from runner.solver import Solver
+
+MIB = 1 << 20
+# Allocations part2 leaves behind, held here so they outlive the stage
+kept = []
+
+
+def parse(_path):
+    return list(range(10))
+
+
+def part1(data):
+    # Allocated and freed within the stage: a peak but no net growth
+    scratch = bytearray(8 * MIB)
+    return len(scratch) + len(data)
+
+
+def part2(data):
+    kept.append(bytearray(4 * MIB))
+    return len(data)
+
+
+@pytest.fixture
+def measure(monkeypatch, tmp_path):
+    """Measure a day that runs the stub stages above."""
+    monkeypatch.setattr(memory, "load_solver", lambda *_: Solver(parse, part1, part2))
+    monkeypatch.setattr(memory, "input_path", lambda *_: tmp_path / "input.txt")
+    yield lambda **options: measure_day(2025, 1, **options)
+    kept.clear()
+
+
+@pytest.fixture
+def result(measure):
+    return measure()
+
+
+class TestMeasureDay:
+    """Test what is attributed to each stage and to the day."""
+
+    def test_answers(self, result):
+        assert result.answers == {1: 8 * MIB + 10, 2: 10}
+
+    def test_stages(self, result):
+        stages = {stage.stage: stage for stage in result.stages}
+        assert list(stages) == ["parse", "part1", "part2"]
+        assert stages["parse"].peak_bytes < MIB
+        assert 8 * MIB <= stages["part1"].peak_bytes < 9 * MIB
+        assert abs(stages["part1"].net_bytes) < MIB
+        assert 4 * MIB <= stages["part2"].net_bytes < 5 * MIB
+        assert stages["part2"].peak_bytes < 5 * MIB
+
+    def test_day_totals(self, result):
+        assert 8 * MIB <= result.peak_bytes < 9 * MIB
+        assert 4 * MIB <= result.net_bytes < 5 * MIB
+
+    def test_top_site_is_kept_allocation(self, result):
+        line = part2.__code__.co_firstlineno + 1
+        assert result.top_sites[0].location == f"test_memory.py:{line}"
+        assert result.top_sites[0].size_bytes >= 4 * MIB
+
+    def test_only_requested_parts(self, measure):
+        result = measure(parts=(2,))
+        assert [stage.stage for stage in result.stages] == ["parse", "part2"]
+        assert result.peak_bytes < 5 * MIB
+
+
+class TestFormatReport:
+    """Test the rendered report and the budget flag."""
+
+    def test_rows(self, result):
+        lines = format_report(result).splitlines()
+        assert lines[0].split() == ["Stage", "Peak", "Net"]
+        assert lines[2].split()[:3] == ["part1", "8.0", "MiB"]
+        assert lines[4].startswith("day")
+        assert "Top allocation sites:" in lines
+
+    def test_over_budget(self, result):
+        assert "OVER BUDGET: peak 8.0 MiB exceeds 1.0 MiB" in format_report(result, MIB)
+
+    @pytest.mark.parametrize("budget", [None, 64 * MIB])
+    def test_within_budget(self, result, budget):
+        assert "OVER BUDGET" not in format_report(result, budget)
+
+    @pytest.mark.parametrize(
+        ("size", "text"),
+        [
+            (0, "0 B"),
+            (1023, "1023 B"),
+            (1536, "1.5 KiB"),
+            (-2 * MIB, "-2.0 MiB"),
+            (3 << 30, "3.0 GiB"),
+        ],
+    )
+    def test_format_bytes(self, size, text):
+        assert format_bytes(size) == text
@@ -0,0 +1,40 @@
+"""Tests for running days in worker processes."""
+
+import os
+
+import pytest
+
+from runner import parallel
+from runner.core import DayResult
+
+CRASHING_DAY = 2
+
+
+def fake_run_day(year, day, **_options):
+    """Solve instantly, except for one day that kills its worker process."""
+    if day == CRASHING_DAY:
+        os._exit(1)
+    return DayResult(year, day, answers={1: day})
+
+
+@pytest.fixture
+def fake_days(monkeypatch):
+    monkeypatch.setattr(parallel, "run_day", fake_run_day)
+    return [(2025, day) for day in range(1, 10)]
+
+
+class TestRunDaysParallel:
+    """Test results and failures of a parallel batch."""
+
+    def test_results_in_target_order(self, fake_days):
+        healthy = [target for target in fake_days if target[1] != CRASHING_DAY]
+        results = list(parallel.run_days_parallel(healthy, 2))
+        assert [(result.year, result.day) for result in results] == healthy
+        assert all(result.answers == {1: result.day} for result in results)
+
+    def test_crash_fails_only_its_own_day(self, fake_days):
+        results = list(parallel.run_days_parallel(fake_days, 2))
+        assert [result.day for result in results] == list(range(1, 10))
+        failed = [result.day for result in results if result.error]
+        assert failed == [CRASHING_DAY]
+        assert all(result.answers == {1: result.day} for result in results if not result.error)
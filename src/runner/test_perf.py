@@ -0,0 +1,46 @@
+"""Tests for the timing regression gate's comparison."""
+
+import pytest
+
+from runner.perf import NOISE_FLOOR_NS, PerfCheck, baseline_key, load_baselines
+
+MS = 1_000_000
+
+
+def check(baseline_ns, median_ns, tolerance=0.25, noise_floor_ns=NOISE_FLOOR_NS):
+    return PerfCheck(2025, 1, baseline_ns, median_ns, tolerance, noise_floor_ns)
+
+
+class TestPerfCheck:
+    """Test when a re-measured median passes against its baseline."""
+
+    def test_ratio(self):
+        assert check(200 * MS, 300 * MS).ratio == 1.5
+
+    @pytest.mark.parametrize("median_ms", [50, 200, 250])
+    def test_within_tolerance(self, median_ms):
+        assert check(200 * MS, median_ms * MS).passed
+
+    def test_slower_than_tolerance_and_noise_floor(self):
+        assert not check(200 * MS, 251 * MS).passed
+
+    def test_slower_than_tolerance_within_noise_floor(self):
+        # Four times slower, but by less than the noise floor
+        assert check(1 * MS, 4 * MS, noise_floor_ns=5 * MS).passed
+
+    def test_slower_than_noise_floor_fails_small_days(self):
+        assert not check(1 * MS, 1000 * MS).passed
+
+    def test_zero_tolerance(self):
+        assert not check(200 * MS, 211 * MS, tolerance=0, noise_floor_ns=10 * MS).passed
+        assert check(200 * MS, 210 * MS, tolerance=0, noise_floor_ns=10 * MS).passed
+
+
+class TestBaselines:
+    """Test how baselines are stored."""
+
+    def test_key(self):
+        assert baseline_key(2025, 4) == "2025-day04"
+
+    def test_missing_file(self, tmp_path):
+        assert load_baselines(tmp_path / "missing.json") == {}
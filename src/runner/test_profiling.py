@@ -0,0 +1,140 @@
+"""Tests for collapsed stacks and profile diffs."""
+
+import cProfile
+import pstats
+import re
+
+from runner.profiling import collapsed_stacks, diff_profiles, label
+
+SOLUTION = "/aoc/solution.py"
+MAIN = (SOLUTION, 1, "main")
+PARSE = (SOLUTION, 10, "parse")
+COUNT = (SOLUTION, 20, "count")
+SUM = ("~", 0, "<built-in method builtins.sum>")
+
+
+class FakeProfile:
+    """Recorded stats in pstats' layout, built by hand so times are exact."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+def stats_of(calls):
+    """
+    Build stats from {function: (own seconds, {caller: edge cumulative seconds})}.
+
+    A function's cumulative time is its own time plus that of every edge out of it.
+    """
+    cumulative = {func: own for func, (own, _) in calls.items()}
+    for _, callers in calls.values():
+        for caller, edge in callers.items():
+            cumulative[caller] += edge
+    return pstats.Stats(
+        FakeProfile(
+            {
+                func: (1, 1, own, cumulative[func], {c: (1, 1, 0, e) for c, e in callers.items()})
+                for func, (own, callers) in calls.items()
+            }
+        )
+    )
+
+
+# main spends 1s itself and calls parse for 6s and count for 3s; count takes 7s
+# in all, 4s of it called from parse
+TREE = {
+    MAIN: (1.0, {}),
+    PARSE: (2.0, {MAIN: 6.0}),
+    COUNT: (7.0, {PARSE: 4.0, MAIN: 3.0}),
+}
+
+
+def inner():
+    return sum(range(10_000))
+
+
+def outer():
+    return inner() + inner()
+
+
+class TestCollapsedStacks:
+    """Test folding caller/callee edges into flame graph stacks."""
+
+    def test_own_time_split_along_paths(self):
+        assert sorted(collapsed_stacks(stats_of(TREE))) == [
+            "main (solution.py:1) 1000000",
+            "main (solution.py:1);count (solution.py:20) 3000000",
+            "main (solution.py:1);parse (solution.py:10) 2000000",
+            "main (solution.py:1);parse (solution.py:10);count (solution.py:20) 4000000",
+        ]
+
+    def test_recursion_is_cut(self):
+        stats = stats_of({MAIN: (1.0, {}), COUNT: (2.0, {MAIN: 3.0, COUNT: 1.0})})
+        assert all(line.count("count") <= 1 for line in collapsed_stacks(stats))
+
+    def test_small_paths_pruned(self):
+        stacks = collapsed_stacks(stats_of(TREE), min_us=3_500_000)
+        assert [line.rpartition(" ")[0] for line in stacks] == [
+            "main (solution.py:1)",
+            "main (solution.py:1);parse (solution.py:10)",
+            "main (solution.py:1);parse (solution.py:10);count (solution.py:20)",
+        ]
+
+    def test_builtins_and_separators_in_names(self):
+        odd = (SOLUTION, 30, "a;b")
+        stats = stats_of({MAIN: (1.0, {}), odd: (1.0, {MAIN: 2.0}), SUM: (1.0, {odd: 1.0})})
+        assert label(SUM) == "<built-in method builtins.sum>"
+        assert (
+            "main (solution.py:1);a:b (solution.py:30);<built-in method builtins.sum> 1000000"
+            in collapsed_stacks(stats)
+        )
+
+    def test_folded_format_of_real_profile(self):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        outer()
+        profiler.disable()
+
+        stacks = collapsed_stacks(pstats.Stats(profiler), min_us=0)
+        assert all(re.fullmatch(r"[^;]+(;[^;]+)* \d+", line) for line in stacks)
+        outer_frame = f"outer (test_profiling.py:{outer.__code__.co_firstlineno})"
+        inner_frame = f"inner (test_profiling.py:{inner.__code__.co_firstlineno})"
+        assert any(
+            line.startswith(f"{outer_frame};{inner_frame};<built-in method builtins.sum> ")
+            for line in stacks
+        )
+
+
+class TestDiffProfiles:
+    """Test comparing two saved profiles."""
+
+    def test_largest_changes_first_with_sign(self, tmp_path):
+        old, new = tmp_path / "old.pstats", tmp_path / "new.pstats"
+        stats_of(TREE).dump_stats(old)
+        # parse got 4s faster and count 1s slower; sum is new
+        stats_of(
+            {
+                MAIN: (1.0, {}),
+                PARSE: (1.0, {MAIN: 2.0}),
+                COUNT: (8.0, {PARSE: 1.0, MAIN: 7.0}),
+                SUM: (0.5, {COUNT: 0.5}),
+            }
+        ).dump_stats(new)
+
+        rows = diff_profiles(old, new).splitlines()[2:]
+        changes = [(row.split()[0], row.split("  ")[-1]) for row in rows]
+        assert changes == [
+            ("-4000.00", "parse (solution.py:10)"),
+            ("+1500.00", "count (solution.py:20)"),
+            ("+500.00", "<built-in method builtins.sum>"),
+            ("+0.00", "main (solution.py:1)"),
+        ]
+        assert rows[0].split()[:4] == ["-4000.00", "-1000.00", "6000.00", "2000.00"]
+
+    def test_limit(self, tmp_path):
+        path = tmp_path / "same.pstats"
+        stats_of(TREE).dump_stats(path)
+        assert len(diff_profiles(path, path, limit=2).splitlines()) == 4
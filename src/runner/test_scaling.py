@@ -0,0 +1,52 @@
+"""Tests for fitting how runtime and memory grow with input size."""
+
+import math
+
+import pytest
+
+from runner.scaling import FIT_POINTS, ScalingPoint, ScalingResult, loglog_slope
+
+SIZES = [100, 200, 400, 800, 1600, 3200]
+
+
+class TestLoglogSlope:
+    """Test the fitted exponent of power laws."""
+
+    @pytest.mark.parametrize("exponent", [0, 1, 1.5, 2, 3])
+    def test_power_law(self, exponent):
+        assert loglog_slope(SIZES, [7 * size**exponent for size in SIZES]) == pytest.approx(
+            exponent
+        )
+
+    def test_n_log_n_is_just_above_linear(self):
+        slope = loglog_slope(SIZES, [size * math.log(size) for size in SIZES])
+        assert 1 < slope < 1.3
+
+    @pytest.mark.parametrize(
+        ("xs", "ys"),
+        [([], []), ([100], [5]), ([100, 100], [5, 6]), ([100, 200], [0, 0])],
+    )
+    def test_undefined(self, xs, ys):
+        assert loglog_slope(xs, ys) is None
+
+    def test_ignores_non_positive_values(self):
+        assert loglog_slope([0, 10, 100], [5, 10, 100]) == pytest.approx(1)
+
+
+class TestScalingResult:
+    """Test which points the exponents are fitted to."""
+
+    def test_fits_only_the_largest_sizes(self):
+        # A fixed cost dominates the smallest sizes, then time grows quadratically
+        times = [10**9, 10**9, *(size**2 for size in SIZES[2:])]
+        points = [
+            ScalingPoint(size, size, time, 64 * size)
+            for size, time in zip(SIZES, times, strict=True)
+        ]
+        result = ScalingResult(2025, 1, points)
+        assert len(SIZES) - FIT_POINTS == 2
+        assert result.time_exponent == pytest.approx(2)
+        assert result.memory_exponent == pytest.approx(1)
+
+    def test_no_points(self):
+        assert ScalingResult(2025, 1).time_exponent is None
@@ -1,22 +1,112 @@
-from .io import read_input, read_lines
-from .utils import (
-    Coordinate,
-    Grid,
-    Line,
-    get_grid_size,
-    iterate_over_grid,
-    map_coordinate,
-    map_range,
-)
+"""
+Shared utilities for the solutions.
+
+Names are imported from their submodules on first use, so importing a light
+submodule such as utils.fingerprint does not load the others, or NumPy.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bitgrid import BitGrid
+    from .grid import Grid
+    from .io import (
+        MappedFile,
+        iter_lines,
+        iter_sections,
+        line_ranges,
+        read_input,
+        read_lines,
+        read_sections,
+        split_sections,
+    )
+    from .matrix import CharMatrix
+    from .parsing import ints, parse_records
+    from .utils import (
+        CellCondition,
+        Coordinate,
+        GridLike,
+        Line,
+        equals,
+        find_cells,
+        get_grid_size,
+        iterate_over_grid,
+        map_coordinate,
+        map_range,
+        one_of,
+    )
+
+# The submodule each exported name is defined in
+_SUBMODULES = {
+    "BitGrid": "bitgrid",
+    "Grid": "grid",
+    **dict.fromkeys(
+        [
+            "MappedFile",
+            "iter_lines",
+            "iter_sections",
+            "line_ranges",
+            "read_input",
+            "read_lines",
+            "read_sections",
+            "split_sections",
+        ],
+        "io",
+    ),
+    "CharMatrix": "matrix",
+    "ints": "parsing",
+    "parse_records": "parsing",
+    **dict.fromkeys(
+        [
+            "CellCondition",
+            "Coordinate",
+            "GridLike",
+            "Line",
+            "equals",
+            "find_cells",
+            "get_grid_size",
+            "iterate_over_grid",
+            "map_coordinate",
+            "map_range",
+            "one_of",
+        ],
+        "utils",
+    ),
+}
 
 __all__ = [
+    "BitGrid",
+    "CellCondition",
+    "CharMatrix",
     "Coordinate",
     "Grid",
+    "GridLike",
     "Line",
+    "MappedFile",
+    "equals",
+    "find_cells",
     "get_grid_size",
+    "ints",
+    "iter_lines",
+    "iter_sections",
     "iterate_over_grid",
+    "line_ranges",
     "map_coordinate",
     "map_range",
+    "one_of",
+    "parse_records",
     "read_input",
     "read_lines",
+    "read_sections",
+    "split_sections",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name from its submodule, once."""
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_SUBMODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,171 @@
+"""
+Boolean grids stored as one Python integer per row.
+
+Bit c of a row is the cell in column c, so a whole row is shifted, combined
+or counted with a single big-integer operation, and neighbour counts for
+every cell come from adding shifted rows as bit-sliced binary numbers.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .utils import Coordinate
+
+# A cell has at most 8 neighbours, so counts fit in 4 bit planes
+COUNT_BITS = 4
+
+
+def _full_add(a: int, b: int, c: int) -> tuple[int, int]:
+    """Add three bit planes, giving the sum plane and the carry plane."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (c & partial)
+
+
+def _count_planes(planes: tuple[int, ...]) -> tuple[int, int, int, int]:
+    """
+    Add eight bit planes bitwise, as a carry-save adder tree.
+
+    Returns:
+        Bit planes of the count, least significant first
+    """
+    p0, p1, p2, p3, p4, p5, p6, p7 = planes
+    s0, c0 = _full_add(p0, p1, p2)
+    s1, c1 = _full_add(p3, p4, p5)
+    s2, c2 = p6 ^ p7, p6 & p7
+    ones, c3 = _full_add(s0, s1, s2)
+    # Four carries of weight 2
+    s4, c4 = _full_add(c0, c1, c2)
+    twos, c5 = s4 ^ c3, s4 & c3
+    # Two carries of weight 4
+    return ones, twos, c4 ^ c5, c4 & c5
+
+
+def _at_least(count: tuple[int, ...], k: int, mask: int) -> int:
+    """Compare a bit-sliced count with a constant, giving a plane of where count >= k."""
+    if k <= 0:
+        return mask
+    if k >= 1 << len(count):
+        return 0
+    # Scan from the least significant bit, so the most significant decides last
+    result = mask
+    for position, plane in enumerate(count):
+        result = plane & result if k >> position & 1 else plane | result
+    return result & mask
+
+
+def _neighbour_planes(above: int, row: int, below: int) -> tuple[int, ...]:
+    """Get the eight planes of neighbours of a row, unmasked above the top column."""
+    return (above << 1, above, above >> 1, row << 1, row >> 1, below << 1, below, below >> 1)
+
+
+@dataclass(frozen=True)
+class BitGrid:
+    """A grid of booleans, one integer per row with bit c for column c."""
+
+    rows: tuple[int, ...]
+    width: int
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes], value: str = "#") -> "BitGrid":
+        """Set the cells of lines holding value, a single ASCII character."""
+        set_byte = value.encode()
+        marks = bytes(ord("1") if byte == set_byte[0] else ord("0") for byte in range(256))
+        rows, width = [], 0
+        for line in lines:
+            raw = (line.encode() if isinstance(line, str) else bytes(line)).rstrip(b"\r\n")
+            width = max(width, len(raw))
+            # int() reads the most significant digit first, so reverse to put column 0 last
+            rows.append(int(raw.translate(marks)[::-1] or b"0", 2))
+        return cls(tuple(rows), width)
+
+    @classmethod
+    def from_coordinates(
+        cls, coordinates: Iterable[Coordinate], height: int, width: int
+    ) -> "BitGrid":
+        """Set the cells at the given (row, col) coordinates."""
+        rows = [0] * height
+        for row, col in coordinates:
+            rows[row] |= 1 << col
+        return cls(tuple(rows), width)
+
+    def to_lines(self, value: str = "#", blank: str = ".") -> list[str]:
+        """Render rows as lines, with value in set cells and blank elsewhere."""
+        marks = str.maketrans("10", value + blank)
+        # format() writes the most significant bit first, so reverse to put column 0 first
+        return [format(row, f"0{self.width}b")[::-1].translate(marks) for row in self.rows]
+
+    @property
+    def height(self) -> int:
+        """Number of rows."""
+        return len(self.rows)
+
+    @property
+    def mask(self) -> int:
+        """A row with every column set."""
+        return (1 << self.width) - 1
+
+    def __bool__(self) -> bool:
+        return any(self.rows)
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(tuple(a & b for a, b in zip(self.rows, other.rows, strict=True)), self.width)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(tuple(a | b for a, b in zip(self.rows, other.rows, strict=True)), self.width)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(
+            tuple(a & ~b for a, b in zip(self.rows, other.rows, strict=True)), self.width
+        )
+
+    def popcount(self) -> int:
+        """Count the set cells."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def coordinates(self) -> Iterator[Coordinate]:
+        """Yield the (row, col) of every set cell, in row-major order."""
+        for row_idx, row in enumerate(self.rows):
+            remaining = row
+            while remaining:
+                lowest = remaining & -remaining
+                yield row_idx, lowest.bit_length() - 1
+                remaining ^= lowest
+
+    def shifted(self, rows: int, cols: int) -> "BitGrid":
+        """Move every cell down by rows and right by cols, dropping cells moved off the grid."""
+        mask = self.mask
+        moved = [(row << cols if cols >= 0 else row >> -cols) & mask for row in self.rows]
+        blank = [0] * min(abs(rows), self.height)
+        if rows >= 0:
+            moved = blank + moved[: self.height - len(blank)]
+        else:
+            moved = moved[len(blank) :] + blank
+        return BitGrid(tuple(moved), self.width)
+
+    def neighbour_counts(self) -> tuple["BitGrid", ...]:
+        """
+        Count every cell's set 8-neighbours at once.
+
+        Returns:
+            COUNT_BITS bit planes of the counts, least significant first
+        """
+        mask = self.mask
+        padded = (0, *self.rows, 0)
+        counts = [
+            _count_planes(_neighbour_planes(*padded[index : index + 3]))
+            for index in range(self.height)
+        ]
+        return tuple(
+            BitGrid(tuple(row[bit] & mask for row in counts), self.width)
+            for bit in range(COUNT_BITS)
+        )
+
+    def neighbours_at_least(self, k: int) -> "BitGrid":
+        """Get the cells, set or not, with at least k set 8-neighbours."""
+        mask = self.mask
+        padded = (0, *self.rows, 0)
+        rows = (
+            _at_least(_count_planes(_neighbour_planes(*padded[index : index + 3])), k, mask)
+            for index in range(self.height)
+        )
+        return BitGrid(tuple(rows), self.width)
@@ -0,0 +1,125 @@
+"""
+On-disk cache of parsed inputs, keyed by input bytes and parser source.
+
+Caching is opt-in: parsers decorated with cached_parser only touch the disk
+when AOC_PARSE_CACHE names a directory, so tests and plain runs never do.
+Entries are pickled with protocol 5, with array buffers stored out of band
+after the pickle so they are read back in one block instead of rebuilt
+element by element. The directory is kept under AOC_PARSE_CACHE_MAX_MB
+(default 256) by evicting least recently used entries.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import struct
+from collections.abc import Callable
+from pathlib import Path
+
+from .fingerprint import evict_lru, file_digest, source_fingerprint
+
+CACHE_ENV = "AOC_PARSE_CACHE"
+MAX_BYTES_ENV = "AOC_PARSE_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 256
+
+MAGIC = b"AOCPARSE1\0"
+# Pickle size and buffer count, followed by each buffer's size, all unsigned 64-bit
+HEADER = struct.Struct("<QQ")
+
+
+def dump(value: object, path: Path) -> None:
+    """Pickle a value to a file, with out-of-band buffers after the pickle."""
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    sizes = [raw.nbytes for raw in raws]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so concurrent runs never see a partial file
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC + HEADER.pack(len(data), len(raws)))
+        f.write(struct.pack(f"<{len(sizes)}Q", *sizes))
+        f.writelines([data, *raws])
+    tmp.replace(path)
+
+
+def load(path: Path) -> object:
+    """
+    Unpickle a value written by dump.
+
+    The file is read into one writable block, and out-of-band buffers are
+    handed to pickle as views of it, so arrays are not copied again.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a complete cache entry
+    """
+    with path.open("rb") as f:
+        block = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(block)
+    view = memoryview(block)
+    if view[: len(MAGIC)] != MAGIC or len(view) < len(MAGIC) + HEADER.size:
+        raise ValueError(f"Not a parse cache entry: {path}")
+
+    offset = len(MAGIC)
+    data_size, count = HEADER.unpack_from(view, offset)
+    offset += HEADER.size
+    sizes = struct.unpack_from(f"<{count}Q", view, offset)
+    offset += 8 * count
+    if offset + data_size + sum(sizes) != len(view):
+        raise ValueError(f"Truncated parse cache entry: {path}")
+
+    data = view[offset : offset + data_size]
+    offset += data_size
+    buffers = []
+    for size in sizes:
+        buffers.append(view[offset : offset + size])
+        offset += size
+    return pickle.loads(data, buffers=buffers)
+
+
+def cached_parser[T](func: Callable[[Path], T]) -> Callable[[Path], T]:
+    """
+    Cache a parse(filepath) function's result on disk while AOC_PARSE_CACHE is set.
+
+    The key combines the input file's bytes with the source fingerprint of the
+    parser's module, so editing the parser or anything it imports from utils
+    invalidates its entries.
+    """
+    # Hashing the parser's sources costs more than loading a small entry, so do it once
+    source = Path(func.__code__.co_filename)
+    fingerprint = functools.cache(lambda: source_fingerprint(func.__module__, source))
+
+    @functools.wraps(func)
+    def wrapper(filepath: Path) -> T:
+        directory = os.environ.get(CACHE_ENV)
+        path = Path(filepath)
+        if not directory or not path.is_file():
+            return func(filepath)
+
+        parser = f"{func.__module__}.{func.__qualname__}"
+        key = hashlib.sha256(f"{parser}:{fingerprint()}:{file_digest(path)}".encode()).hexdigest()
+        entry = Path(directory) / f"{key}.pickle"
+
+        try:
+            value = load(entry)
+            os.utime(entry)
+        except Exception:
+            # Missing, corrupt or no longer unpicklable entries are all misses
+            pass
+        else:
+            return value
+
+        value = func(filepath)
+        try:
+            dump(value, entry)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Unpicklable results and read-only directories just go uncached
+            return value
+        max_mb = float(os.environ.get(MAX_BYTES_ENV, DEFAULT_MAX_MB))
+        evict_lru(Path(directory), "*.pickle", int(max_mb * (1 << 20)))
+        return value
+
+    return wrapper
@@ -0,0 +1,128 @@
+"""
+Fingerprints of first-party source files and inputs, for content-addressed caches.
+
+Shared by the parse cache here and the runner's result cache. This module
+imports nothing from the rest of utils or from challenges, and locates their
+modules without importing them, so a cache hit never pays for loading the
+solutions' dependencies, NumPy among them.
+"""
+
+import hashlib
+import re
+from importlib.machinery import PathFinder
+from pathlib import Path
+
+# Only first-party code can change between runs; stdlib imports are not hashed
+FIRST_PARTY = frozenset({"challenges", "utils"})
+
+
+def _module_file(name: str) -> Path | None:
+    """
+    Locate the source file of a first-party module without importing it.
+
+    importlib.util.find_spec imports a dotted name's parent packages, so the
+    path finder is asked for one component at a time instead, searching each
+    package's directories.
+    """
+    top, *rest = name.split(".")
+    spec = PathFinder.find_spec(top)
+    for part in rest:
+        if spec is None or spec.submodule_search_locations is None:
+            return None
+        spec = PathFinder.find_spec(part, spec.submodule_search_locations)
+    if spec is None or not spec.has_location or spec.origin is None:
+        return None
+    return Path(spec.origin)
+
+
+# An import statement at the start of a line, at any depth. Matches inside strings only
+# add modules to hash, never miss one
+_IMPORT = re.compile(
+    r"^[ \t]*(?:from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+(\([^)]*\)|[^\n#;]*)|import[ \t]+([^\n#;]*))",
+    re.MULTILINE,
+)
+
+
+def _names(clause: str) -> list[str]:
+    """Get the imported names of an import clause, without aliases or parentheses."""
+    return [item.split()[0] for item in clause.strip("()").split(",") if item.strip()]
+
+
+def _imported_modules(name: str, source: str, is_package: bool) -> set[str]:
+    """Get the absolute names of all modules a module's source imports."""
+    package = name if is_package else name.rpartition(".")[0]
+    imported: set[str] = set()
+
+    for dotted, names, plain in _IMPORT.findall(source):
+        if plain:
+            imported.update(_names(plain))
+            continue
+        module = dotted.lstrip(".")
+        level = len(dotted) - len(module)
+        if level:
+            parts = package.split(".")
+            base = ".".join(parts[: len(parts) - level + 1])
+            target = f"{base}.{module}" if module else base
+        else:
+            target = module
+        imported.add(target)
+        # "from package import name" may import a submodule
+        imported.update(f"{target}.{alias}" for alias in _names(names))
+
+    return imported
+
+
+def source_fingerprint(name: str, path: Path | None = None) -> str:
+    """
+    Hash a module's source together with all first-party modules it imports.
+
+    Imports are found by scanning the source, so nothing is executed and a
+    change anywhere in the transitive utils imports changes the fingerprint.
+    A module loaded under another name, such as __main__ or a test runner's
+    rootdir-relative name, can be located by its path instead.
+    """
+    digest = hashlib.sha256()
+    pending: list[tuple[str, Path | None]] = [(name, path)]
+    seen: set[str] = set()
+
+    while pending:
+        current, path = pending.pop()
+        if current in seen:
+            continue
+        if path is None and current.partition(".")[0] in FIRST_PARTY:
+            path = _module_file(current)
+        if path is None:
+            continue
+        seen.add(current)
+
+        source = path.read_bytes()
+        digest.update(current.encode() + b"\0" + hashlib.sha256(source).digest())
+        imported = _imported_modules(current, source.decode(), path.name == "__init__.py")
+        # Sorted, so the traversal and thus the digest do not depend on set ordering
+        pending.extend((module, None) for module in sorted(imported))
+
+    return digest.hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """Hash a file's bytes."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def evict_lru(directory: Path, pattern: str, max_bytes: int) -> None:
+    """Remove the least recently modified matching files until the rest fit in max_bytes."""
+    entries = []
+    for path in directory.glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
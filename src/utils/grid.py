@@ -0,0 +1,95 @@
+"""
+Character grids stored in one flat, padded buffer.
+
+Cells are addressed by a single integer index instead of (row, col) tuples,
+and neighbours by adding precomputed offsets, so hot loops over a grid do
+integer arithmetic rather than building and hashing tuples.
+"""
+
+from collections.abc import Iterable
+
+from .utils import Coordinate
+
+# Byte filling the border around a grid, and any gap at the end of a short row
+OUTSIDE = 0
+
+
+class Grid:
+    """
+    A rectangular grid of single-byte characters, in a row-major bytearray.
+
+    The grid is surrounded by a border pad cells wide holding OUTSIDE, so a
+    cell's index is (row + pad) * stride + (col + pad), stepping pad cells
+    in any direction from a cell stays within the buffer, and a bounds check
+    is a comparison with OUTSIDE.
+    """
+
+    def __init__(self, cells: bytearray, height: int, width: int, pad: int = 1):
+        self.cells = cells
+        self.height = height
+        self.width = width
+        self.pad = pad
+        self.stride = width + 2 * pad
+        stride = self.stride
+        # Offsets to orthogonal, then all, neighbours, clockwise from above
+        self.offsets4 = (-stride, 1, stride, -1)
+        self.offsets8 = (-stride, -stride + 1, 1, stride + 1, stride, stride - 1, -1, -stride - 1)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes], *, pad: int = 1) -> "Grid":
+        """
+        Load lines as rows, without their line endings.
+
+        Characters must be single bytes in UTF-8, i.e. ASCII. Short rows are
+        padded with OUTSIDE, like the border.
+
+        Raises:
+            ValueError: If pad is negative
+        """
+        if pad < 0:
+            raise ValueError(f"Padding must not be negative, got {pad}")
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        rows = [row.rstrip(b"\r\n") for row in rows]
+        width = max(map(len, rows), default=0)
+        border = bytes([OUTSIDE])
+        edge = border * (width + 2 * pad) * pad
+        side = border * pad
+        padded = (side + row.ljust(width, border) + side for row in rows)
+        cells = bytearray().join([edge, *padded, edge])
+        return cls(cells, len(rows), width, pad)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Get the size of the grid as (number of rows, number of columns)."""
+        return self.height, self.width
+
+    def index(self, row: int, col: int) -> int:
+        """Get the flat index of a cell."""
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def coordinate(self, index: int) -> Coordinate:
+        """Get the (row, col) of a flat index."""
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def __getitem__(self, coordinate: Coordinate) -> str:
+        return chr(self.cells[self.index(*coordinate)])
+
+    def outside(self, index: int) -> bool:
+        """Check whether a flat index is in the border rather than the grid."""
+        return self.cells[index] == OUTSIDE
+
+    def find(self, value: str) -> int:
+        """Get the flat index of the first cell holding value, or -1 if there is none."""
+        return self.cells.find(value.encode())
+
+    def find_all(self, value: str) -> list[int]:
+        """Get the flat indices of every cell holding value, in row-major order."""
+        find = self.cells.find
+        target = value.encode()
+        indices = []
+        index = find(target)
+        while index >= 0:
+            indices.append(index)
+            index = find(target, index + 1)
+        return indices
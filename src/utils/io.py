@@ -1,7 +1,14 @@
 """Simple, efficient I/O utilities for Advent of Code."""
 
-from collections.abc import Callable
+import mmap
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import pairwise
 from pathlib import Path
+from types import TracebackType
+from typing import TextIO
 
 
 def read_input(filepath: str | Path, *, strip: bool = True) -> str:
@@ -11,6 +18,167 @@ def read_input(filepath: str | Path, *, strip: bool = True) -> str:
     return content.strip() if strip else content
 
 
+@contextmanager
+def _open_text(source: str | Path | TextIO) -> Iterator[TextIO]:
+    """Open a path for reading, or pass stdin ("-") and open streams through unclosed."""
+    if not isinstance(source, str | Path):
+        yield source
+    elif str(source) == "-":
+        yield sys.stdin
+    else:
+        with Path(source).open(encoding="utf-8") as stream:
+            yield stream
+
+
+def _chunked_lines(stream: TextIO, chunk_size: int) -> Iterator[str]:
+    """Split a stream into lines, keeping their endings, reading one chunk at a time."""
+    # Pieces of a line that spans chunks, joined once its end is found
+    pending: list[str] = []
+    # A "\r" ending a chunk may be the first half of "\r\n", so it waits for the next
+    carry = ""
+    while chunk := stream.read(chunk_size):
+        chunk = carry + chunk
+        carry = "\r" if chunk.endswith("\r") else ""
+        if carry:
+            chunk = chunk[:-1]
+            if not chunk:
+                continue
+        *lines, last = chunk.splitlines(keepends=True)
+        if pending and lines:
+            lines[0] = "".join(pending) + lines[0]
+            pending.clear()
+        pending.append(last)
+        if last.splitlines()[0] != last:
+            # The chunk ended on a line break, so its last line is complete
+            lines.append("".join(pending))
+            pending.clear()
+        yield from lines
+
+    if pending or carry:
+        yield "".join(pending) + carry
+
+
+def iter_lines(
+    source: str | Path | TextIO,
+    *,
+    skip_empty: bool = True,
+    strip: bool = True,
+    filter_fn: Callable[[str], bool] | None = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[str]:
+    """
+    Stream lines from a file, stdin ("-") or an open text stream.
+
+    Stripping, skipping empty lines and filter_fn are applied in the same single
+    pass, and input is read chunk_size characters at a time, so memory is
+    bounded by the longest line rather than the whole input.
+    """
+    with _open_text(source) as stream:
+        for line in _chunked_lines(stream, chunk_size):
+            if strip:
+                line = line.strip()  # noqa: PLW2901
+            if skip_empty and not line:
+                continue
+            if filter_fn and not filter_fn(line):
+                continue
+            yield line
+
+
+def iter_chunks(source: str | Path | TextIO, *, chunk_size: int = 1 << 20) -> Iterator[str]:
+    """
+    Stream a file, stdin ("-") or an open text stream in blocks of whole lines.
+
+    Each block is about chunk_size characters and ends with a line break,
+    except possibly the last, so bulk operations such as a regex over a block
+    never see a line cut in two.
+    """
+    with _open_text(source) as stream:
+        # Pieces of a block still waiting for its first line break
+        pending: list[str] = []
+        while chunk := stream.read(chunk_size):
+            cut = chunk.rfind("\n") + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            yield "".join(pending)
+            pending = [chunk[cut:]] if cut < len(chunk) else []
+
+        if pending:
+            yield "".join(pending)
+
+
+def _section(first: str, lines: Iterator[str]) -> Iterator[str]:
+    """Yield lines up to, and consuming, the next blank one."""
+    yield first
+    for line in lines:
+        if not line.strip():
+            return
+        yield line
+
+
+def split_sections(lines: Iterable[str]) -> Iterator[Iterator[str]]:
+    """
+    Split lines into sections separated by one or more blank lines.
+
+    Each section is a lazy iterator over its lines, valid until the next one
+    is requested; whatever of it was not consumed is skipped then. Leading,
+    trailing and repeated blank lines never give empty sections.
+    """
+    lines = iter(lines)
+    for line in lines:
+        if not line.strip():
+            continue
+        section = _section(line, lines)
+        yield section
+        for _ in section:
+            pass
+
+
+def iter_sections(
+    source: str | Path | TextIO, *, strip: bool = True, chunk_size: int = 1 << 16
+) -> Iterator[Iterator[str]]:
+    """
+    Stream a file, stdin ("-") or an open text stream as blank-line separated sections.
+
+    Sections are lazy line iterators, as from split_sections, over lines read
+    as by iter_lines, so each section can be processed before the next is read.
+    """
+    lines = iter_lines(source, skip_empty=False, strip=strip, chunk_size=chunk_size)
+    return split_sections(lines)
+
+
+def read_sections(source: str | Path | TextIO, *, strip: bool = True) -> list[list[str]]:
+    """Read blank-line separated sections as lists of lines."""
+    return [list(section) for section in iter_sections(source, strip=strip)]
+
+
+def line_ranges(filepath: str | Path, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split a file into byte ranges of about chunk_size, each made of whole lines.
+
+    Every range but the last ends just after a line break, so the ranges can
+    be read and parsed independently, for example by separate processes.
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+    with Path(filepath).open("rb") as file:
+        size = file.seek(0, 2)
+        bounds = [0]
+        while bounds[-1] + chunk_size < size:
+            # Finish the line the cut falls in, so the next range starts a line
+            file.seek(bounds[-1] + chunk_size)
+            file.readline()
+            if file.tell() >= size:
+                break
+            bounds.append(file.tell())
+    bounds.append(size)
+    return list(pairwise(bounds))
+
+
 def read_lines(
     filepath: str | Path,
     *,
@@ -19,16 +187,91 @@ def read_lines(
     filter_fn: Callable[[str], bool] | None = None,
 ) -> list[str]:
     """Read input file as list of lines."""
-    path = Path(filepath)
-    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    return list(iter_lines(filepath, skip_empty=skip_empty, strip=strip, filter_fn=filter_fn))
+
+
+# A line break followed by at least one blank line
+_BLANK_LINES = re.compile(rb"\n(?:[ \t\r]*\n)+")
+_CONTENT = re.compile(rb"\S")
+
+
+class MappedFile:
+    """
+    Read-only memory map of an input file, for working on its bytes without copying.
+
+    The whole file is available as a memoryview, and lines as memoryview slices
+    of it; nothing is decoded until asked. Use it as a context manager, and do
+    not keep views past the end of the with block, since the map is closed
+    there. An empty file, which cannot be mapped, gives an empty view.
+    """
+
+    def __init__(self, filepath: str | Path):
+        with Path(filepath).open("rb") as file:
+            size = file.seek(0, 2)
+            # The map stays valid after the file is closed
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.view = memoryview(self._map if self._map is not None else b"")
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def close(self) -> None:
+        """
+        Release the view and unmap the file.
+
+        Raises:
+            BufferError: If line views or other exports of the map are still alive
+        """
+        self.view.release()
+        if self._map is not None:
+            self._map.close()
 
-    if strip:
-        lines = [line.strip() for line in lines]
+    def lines(self, *, keepends: bool = False) -> Iterator[memoryview]:
+        """Iterate over lines as zero-copy views, without their line endings by default."""
+        view = self.view
+        find = self._map.find if self._map is not None else None
+        start, end = 0, len(view)
+        while start < end:
+            newline = find(b"\n", start) if find else -1
+            stop = end if newline < 0 else newline + 1
+            if keepends:
+                yield view[start:stop]
+            else:
+                trim = stop - (newline >= 0)
+                if trim > start and view[trim - 1] == ord("\r"):
+                    trim -= 1
+                yield view[start:trim]
+            start = stop
 
-    if skip_empty:
-        lines = [line for line in lines if line]
+    def sections(self) -> Iterator[memoryview]:
+        """
+        Iterate over blank-line separated sections as zero-copy views.
 
-    if filter_fn:
-        lines = [line for line in lines if filter_fn(line)]
+        Each view keeps the line break ending its last line, if it had one.
+        Leading, trailing and repeated blank lines never give empty sections.
+        """
+        if self._map is None:
+            return
+        view = self.view
+        start = 0
+        for separator in _BLANK_LINES.finditer(self._map):
+            if _CONTENT.search(self._map, start, separator.start() + 1):
+                yield view[start : separator.start() + 1]
+            start = separator.end()
+        if _CONTENT.search(self._map, start):
+            yield view[start:]
 
-    return lines
+    def text(self) -> str:
+        """Decode the whole file."""
+        return str(self.view, "utf-8")
@@ -0,0 +1,109 @@
+"""
+Dense character matrices for fixed-width text inputs.
+
+A matrix holds one byte per character in a single contiguous buffer, a NumPy
+uint8 array when NumPy is installed and a bytearray otherwise, so rows and
+columns can be viewed and tested without building a string per cell.
+"""
+
+from collections.abc import Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SPACE = ord(" ")
+# Translation table marking spaces with 1 and every other byte with 0
+_SPACE_MARKS = bytes(int(byte == SPACE) for byte in range(256))
+
+
+class CharMatrix:
+    """
+    A rectangular block of single-byte characters, stored row by row.
+
+    Rows and columns are zero-copy memoryviews of the buffer. With NumPy,
+    column blocks and transposes are views too; without it they are copies
+    made with one slice per row or column.
+    """
+
+    def __init__(self, cells: "bytearray | np.ndarray", height: int, width: int):
+        if np is not None and not isinstance(cells, np.ndarray):
+            cells = np.frombuffer(cells, np.uint8).reshape(height, width)
+        self.cells = cells
+        self.height = height
+        self.width = width
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str | bytes], *, fill: str = " ") -> "CharMatrix":
+        """
+        Load lines as rows, without their line endings, padding short ones with fill.
+
+        Characters must be single bytes in UTF-8, i.e. ASCII, so that columns line up.
+        """
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        rows = [row.rstrip(b"\r\n") for row in rows]
+        width = max(map(len, rows), default=0)
+        padding = fill.encode()
+        cells = bytearray(b"".join(row.ljust(width, padding) for row in rows))
+        return cls(cells, len(rows), width)
+
+    @classmethod
+    def from_text(cls, text: str | bytes, *, fill: str = " ") -> "CharMatrix":
+        """Load a block of text, one row per line."""
+        return cls.from_lines(text.splitlines(), fill=fill)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Get the size of the matrix as (number of rows, number of columns)."""
+        return self.height, self.width
+
+    def row(self, index: int) -> memoryview:
+        """View a row's bytes without copying."""
+        if np is not None:
+            return memoryview(self.cells[index])
+        start = index * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, index: int) -> memoryview:
+        """View a column's bytes without copying, as a strided memoryview."""
+        if np is not None:
+            return memoryview(self.cells[:, index])
+        return memoryview(self.cells)[index :: self.width] if self.width else memoryview(b"")
+
+    def rows(self) -> Iterator[bytes]:
+        """Iterate over rows as bytes."""
+        for index in range(self.height):
+            yield self.row(index).tobytes()
+
+    def lines(self) -> list[str]:
+        """Decode every row."""
+        return [row.decode() for row in self.rows()]
+
+    def blank_columns(self) -> list[int]:
+        """Find the columns whose every character is a space."""
+        if np is not None:
+            return np.flatnonzero((self.cells == SPACE).all(axis=0)).tolist()
+
+        # AND the rows' space marks together as integers, one byte per column
+        blank = (1 << 8 * self.width) // 255  # A 1 in every byte
+        for row in self.rows():
+            blank &= int.from_bytes(row.translate(_SPACE_MARKS))
+        marks = blank.to_bytes(self.width)
+        return [index for index, mark in enumerate(marks) if mark]
+
+    def columns(self, start: int, stop: int) -> "CharMatrix":
+        """Get the block of columns from start up to stop."""
+        width = max(0, min(stop, self.width) - start)
+        if np is not None:
+            return CharMatrix(self.cells[:, start : start + width], self.height, width)
+        offsets = range(start, start + self.height * self.width, self.width)
+        cells = bytearray(b"".join(self.cells[offset : offset + width] for offset in offsets))
+        return CharMatrix(cells, self.height, width)
+
+    def transpose(self) -> "CharMatrix":
+        """Swap rows and columns, so that each column reads as a row."""
+        if np is not None:
+            return CharMatrix(self.cells.T, self.width, self.height)
+        columns = (self.cells[index :: self.width] for index in range(self.width))
+        return CharMatrix(bytearray(b"".join(columns)), self.width, self.height)
@@ -0,0 +1,223 @@
+"""
+Bulk parsing of numbers and records from whole inputs.
+
+Results are NumPy arrays when NumPy is installed, and compact arrays or
+memoryviews of them otherwise. Both support len(), indexing and tolist().
+"""
+
+import re
+from array import array
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import NoReturn, TextIO
+
+from .io import iter_chunks
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# A minus sign only counts when it does not follow a digit, so "3-5" is 3 and 5
+_INT = re.compile(r"(?<![0-9])-?[0-9]+")
+_INT_BYTES = re.compile(rb"(?<![0-9])-?[0-9]+")
+
+# Longest digit run that can fit in a signed 64-bit integer; its value is checked too
+MAX_DIGITS = 19
+INT64_MAX = (1 << 63) - 1
+
+
+def _ints_numpy(buffer: bytes | bytearray | memoryview) -> "np.ndarray":
+    """Parse digit runs with whole-array operations, without a Python object per number."""
+    data = np.frombuffer(buffer, np.uint8)
+    digit = (data - ord("0")) < 10
+    edges = np.diff(digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return np.empty(0, np.int64)
+    # Only significant digits count towards the limit, as leading zeros add nothing
+    significant = starts
+    if (ends - starts).max() > MAX_DIGITS:
+        nonzero = np.append(np.flatnonzero(digit & (data != ord("0"))), len(data))
+        significant = np.minimum(nonzero[np.searchsorted(nonzero, starts)], ends)
+    lengths = ends - significant
+    if lengths.max() > MAX_DIGITS:
+        raise OverflowError(f"An integer in the buffer has more than {MAX_DIGITS} digits")
+
+    # Horner's rule, one digit place at a time across every run at once, costs a
+    # few passes over the runs rather than arrays as long as the buffer; any 19
+    # digits fit unsigned, so the values are exact before the range check below
+    magnitudes = np.zeros(len(starts), np.uint64)
+    last = len(data) - 1
+    for place in range(lengths.max()):
+        digits = data[np.minimum(significant + place, last)] - ord("0")
+        magnitudes = np.where(lengths > place, magnitudes * 10 + digits, magnitudes)
+
+    # A run is negative after a minus sign that does not itself follow a digit
+    before = np.maximum(starts - 1, 0)
+    negative = (starts >= 1) & (data[before] == ord("-"))
+    negative &= (starts < 2) | ~digit[np.maximum(starts - 2, 0)]
+    # Negative numbers reach one further than positive ones
+    limits = np.where(negative, np.uint64(INT64_MAX + 1), np.uint64(INT64_MAX))
+    if (magnitudes > limits).any():
+        raise OverflowError("An integer in the buffer does not fit in 64 bits")
+
+    # Wrapping -2**63 to int64 and negating it leaves it unchanged, as it should
+    values = magnitudes.astype(np.int64)
+    values[negative] *= -1
+    return values
+
+
+def ints(buffer: str | bytes | bytearray | memoryview, arity: int | None = None):
+    """
+    Extract every signed integer from a buffer in one pass.
+
+    Args:
+        buffer: Text or raw bytes of any length, e.g. a whole input file
+        arity: If given, group the integers into rows of this many
+
+    Returns:
+        A 64-bit integer array, or with arity, a 2-D view of shape (rows, arity)
+
+    Raises:
+        ValueError: If the integer count is not a multiple of arity
+        OverflowError: If an integer does not fit in 64 bits
+    """
+    if np is not None:
+        values = _ints_numpy(buffer.encode() if isinstance(buffer, str) else buffer)
+    else:
+        pattern = _INT if isinstance(buffer, str) else _INT_BYTES
+        values = array("q", map(int, pattern.findall(buffer)))
+
+    if arity is None:
+        return values
+    if len(values) % arity:
+        raise ValueError(f"{len(values)} integers cannot be split into rows of {arity}")
+    if np is not None:
+        return values.reshape(-1, arity)
+    return memoryview(values).cast("B").cast("q", [len(values) // arity, arity])
+
+
+# Record schema fields look like {name:kind}; everything between them is literal
+_FIELD = re.compile(r"\{(\w+):(\w)\}")
+_FIELD_PATTERNS = {
+    "c": r"(.)",
+    "d": r"([-+]?\d+)",
+    "f": r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)",
+    "s": r"(.*?)",
+}
+# Array typecodes and NumPy dtypes of the kinds stored as arrays; strings stay lists
+_TYPECODES = {"c": "w", "d": "q", "f": "d"}
+_DTYPES = {"c": "<U1", "d": "int64", "f": "float64"}
+
+# Lines end at "\n" alone, less any "\r" before it, and blanks are spaces and tabs
+_NON_BLANK_LINE = re.compile(r"^[ \t]*[^ \t\r\n]", re.MULTILINE)
+
+# Small blocks keep few match tuples alive at once, which keeps garbage collection cheap
+RECORD_BLOCK_SIZE = 1 << 14
+
+
+@dataclass(frozen=True)
+class Schema:
+    """A compiled record schema: one pattern matching a whole line, and its fields."""
+
+    source: str
+    line: re.Pattern[str]
+    rows: re.Pattern[str]
+    fields: tuple[tuple[str, str], ...]
+
+
+@cache
+def compile_schema(schema: str) -> Schema:
+    """
+    Compile a record schema like "{dir:c}{dist:d}" or "{x:d},{y:d}".
+
+    Field kinds are c (one character), d (integer), f (float) and s (string,
+    as short as possible). Text outside fields must appear literally.
+
+    Raises:
+        ValueError: If the schema has no fields, an unknown kind or a repeated name
+    """
+    pieces, fields, position = [], [], 0
+    for field in _FIELD.finditer(schema):
+        name, kind = field.groups()
+        if kind not in _FIELD_PATTERNS:
+            raise ValueError(f"Unknown field kind {kind!r} in schema {schema!r}")
+        pieces.extend([re.escape(schema[position : field.start()]), _FIELD_PATTERNS[kind]])
+        fields.append((name, kind))
+        position = field.end()
+    pieces.append(re.escape(schema[position:]))
+
+    names = [name for name, _ in fields]
+    if not fields or len(set(names)) != len(names):
+        raise ValueError(f"Schema {schema!r} needs at least one field and unique field names")
+
+    body = "".join(pieces)
+    # Lines match with surrounding blanks and a "\r" ending, as after _record_line
+    rows = re.compile(f"^[ \t]*{body}[ \t]*\r?$", re.MULTILINE)
+    return Schema(schema, re.compile(body), rows, tuple(fields))
+
+
+def _record_line(line: str) -> str:
+    """Trim a line of a carriage return ending, then of surrounding spaces and tabs."""
+    return line.removesuffix("\r").strip(" \t")
+
+
+def _raise_mismatch(schema: Schema, block: str, first_line: int) -> NoReturn:
+    """Report the first non-blank line of a block that does not match a schema."""
+    for number, line in enumerate(block.split("\n"), first_line + 1):
+        record = _record_line(line)
+        if record and not schema.line.fullmatch(record):
+            raise ValueError(f"Line {number} does not match {schema.source!r}: {line!r}")
+    # The block-wide match and the line-by-line one disagree; never drop the rows silently
+    raise ValueError(f"Lines from {first_line + 1} do not match {schema.source!r}")
+
+
+def parse_records(source: str | Path | TextIO, schema: str | Schema) -> dict[str, object]:
+    """
+    Stream an input into one column per schema field.
+
+    The input is read in blocks of whole lines, each matched with one regex
+    call, and values go straight into typed columns instead of one object per
+    row. Lines end at a line feed, with or without a carriage return before
+    it. Blank lines are skipped and spaces and tabs around a record ignored.
+    Columns are arrays, NumPy arrays when it is installed, or lists for s
+    fields.
+
+    Raises:
+        ValueError: If a line does not match the schema
+    """
+    compiled = schema if isinstance(schema, Schema) else compile_schema(schema)
+    kinds = [kind for _, kind in compiled.fields]
+    columns = [array(_TYPECODES[kind]) if kind in _TYPECODES else [] for kind in kinds]
+
+    line_number = 0
+    for block in iter_chunks(source, chunk_size=RECORD_BLOCK_SIZE):
+        rows = compiled.rows.findall(block)
+        lines = block.count("\n") + (not block.endswith("\n"))
+        # Every line matching is the common case; only count blank lines otherwise
+        if len(rows) != lines and len(rows) != len(_NON_BLANK_LINE.findall(block)):
+            _raise_mismatch(compiled, block, line_number)
+        line_number += lines
+        if not rows:
+            continue
+
+        values_by_field = zip(*rows, strict=True) if len(kinds) > 1 else [rows]
+        for column, kind, values in zip(columns, kinds, values_by_field, strict=True):
+            if kind == "c":
+                column.fromunicode("".join(values))
+            elif kind == "d":
+                column.extend(map(int, values))
+            elif kind == "f":
+                column.extend(map(float, values))
+            else:
+                column.extend(values)
+
+    if np is not None:
+        columns = [
+            np.frombuffer(column, _DTYPES[kind]) if kind in _DTYPES else column
+            for column, kind in zip(columns, kinds, strict=True)
+        ]
+    return {name: column for (name, _), column in zip(compiled.fields, columns, strict=True)}
@@ -0,0 +1,137 @@
+"""Tests for the on-disk cache of parsed inputs."""
+
+import os
+from array import array
+
+import pytest
+
+from utils import cache
+from utils.cache import CACHE_ENV, MAX_BYTES_ENV, cached_parser, dump, load
+
+
+class TestDumpLoad:
+    """Test cache entries, with array buffers stored out of band."""
+
+    def test_round_trip(self, tmp_path):
+        value = {"rows": [1, 2], "column": array("q", range(1000)), "name": "x"}
+        dump(value, tmp_path / "entry.pickle")
+        assert load(tmp_path / "entry.pickle") == value
+
+    def test_numpy_round_trip(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        value = np.arange(12, dtype=np.int64).reshape(3, 4)
+        dump(value, tmp_path / "entry.pickle")
+        loaded = load(tmp_path / "entry.pickle")
+        assert loaded.dtype == value.dtype
+        assert loaded.tolist() == value.tolist()
+        # Loaded arrays are views of one writable block, not read-only copies
+        loaded[0, 0] = 99
+
+    @pytest.mark.parametrize("damage", ["not an entry", "truncated"])
+    def test_rejects_damaged_entries(self, tmp_path, damage):
+        path = tmp_path / "entry.pickle"
+        if damage == "truncated":
+            dump(array("q", range(100)), path)
+            path.write_bytes(path.read_bytes()[:-8])
+        else:
+            path.write_bytes(b"garbage")
+        with pytest.raises(ValueError, match="parse cache entry"):
+            load(path)
+
+
+class Parser:
+    """A parser that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.parse = cached_parser(self._parse)
+
+    def _parse(self, filepath):
+        self.calls += 1
+        return array("q", map(int, filepath.read_text().split()))
+
+
+@pytest.fixture
+def parser():
+    return Parser()
+
+
+@pytest.fixture
+def entries(tmp_path, monkeypatch):
+    """Enable the cache in a fresh directory, and list the entries in it."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_ENV, str(directory))
+    return lambda: sorted(directory.glob("*.pickle"))
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1 2 3\n")
+    return path
+
+
+class TestCachedParser:
+    """Test when parsed inputs are read from and written to disk."""
+
+    @pytest.mark.parametrize("setting", [None, ""])
+    def test_disabled_writes_nothing(self, parser, input_file, monkeypatch, setting):
+        if setting is None:
+            monkeypatch.delenv(CACHE_ENV, raising=False)
+        else:
+            monkeypatch.setenv(CACHE_ENV, setting)
+        touched = []
+        monkeypatch.setattr(cache, "dump", lambda *args: touched.append(args))
+        monkeypatch.setattr(cache, "load", lambda *args: touched.append(args))
+        assert parser.parse(input_file).tolist() == [1, 2, 3]
+        assert parser.parse(input_file).tolist() == [1, 2, 3]
+        assert parser.calls == 2
+        assert touched == []
+
+    def test_hit(self, parser, input_file, entries):
+        assert parser.parse(input_file).tolist() == [1, 2, 3]
+        assert parser.parse(input_file).tolist() == [1, 2, 3]
+        assert parser.calls == 1
+        assert len(entries()) == 1
+
+    def test_input_change_misses(self, parser, input_file, entries):
+        parser.parse(input_file)
+        input_file.write_text("4 5\n")
+        assert parser.parse(input_file).tolist() == [4, 5]
+        assert parser.calls == 2
+        assert len(entries()) == 2
+
+    def test_corrupt_entry_is_reparsed_and_replaced(self, parser, input_file, entries):
+        parser.parse(input_file)
+        (entry,) = entries()
+        entry.write_bytes(b"garbage")
+        assert parser.parse(input_file).tolist() == [1, 2, 3]
+        assert parser.calls == 2
+        assert load(entry).tolist() == [1, 2, 3]
+
+    def test_evicts_least_recently_used(self, parser, tmp_path, entries, monkeypatch):
+        inputs = []
+        for number in range(3):
+            path = tmp_path / f"input{number}.txt"
+            path.write_text(" ".join(["7"] * 1000))
+            inputs.append(path)
+            path.write_text(f"{number} " + path.read_text())
+        parser.parse(inputs[0])
+        (size,) = {entry.stat().st_size for entry in entries()}
+        # Room for two entries, of which the first is the least recently used
+        monkeypatch.setenv(MAX_BYTES_ENV, str(2.5 * size / (1 << 20)))
+        parser.parse(inputs[1])
+        (first,) = [entry for entry in entries() if load(entry)[0] == 0]
+        os.utime(first, ns=(first.stat().st_mtime_ns - 10**9,) * 2)
+
+        parser.parse(inputs[2])
+        assert sorted(load(entry)[0] for entry in entries()) == [1, 2]
+        parser.parse(inputs[0])
+        assert parser.calls == 4
+
+    def test_unpicklable_results_go_uncached(self, tmp_path, entries):
+        parse = cached_parser(lambda _: lambda: None)
+        path = tmp_path / "input.txt"
+        path.write_text("1\n")
+        assert callable(parse(path))
+        assert entries() == []
@@ -0,0 +1,33 @@
+"""Tests for source fingerprints."""
+
+import sys
+
+import pytest
+
+from utils.fingerprint import source_fingerprint
+
+
+class TestSourceFingerprint:
+    """Test which source changes change a module's fingerprint."""
+
+    @pytest.mark.usefixtures("first_party_package")
+    def test_stable(self):
+        assert source_fingerprint("fakeday.solution") == source_fingerprint("fakeday.solution")
+
+    @pytest.mark.parametrize("changed", ["solution.py", "helper.py", "other.py", "__init__.py"])
+    def test_changes_with_imported_sources(self, first_party_package, changed):
+        before = source_fingerprint("fakeday.solution")
+        path = first_party_package / "fakeday" / changed
+        path.write_text(path.read_text() + "\n# edited\n")
+        assert source_fingerprint("fakeday.solution") != before
+
+    @pytest.mark.usefixtures("first_party_package")
+    def test_locates_without_importing(self):
+        source_fingerprint("fakeday.solution")
+        assert "fakeday" not in sys.modules
+
+    def test_by_path(self, first_party_package):
+        path = first_party_package / "fakeday" / "solution.py"
+        assert source_fingerprint("fakeday.solution", path) == source_fingerprint(
+            "fakeday.solution"
+        )
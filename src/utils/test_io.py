@@ -0,0 +1,273 @@
+"""Tests for memory-mapped and chunked input readers."""
+
+import io
+import sys
+from itertools import pairwise
+from pathlib import Path
+from random import Random
+
+import pytest
+
+from utils.io import (
+    MappedFile,
+    iter_chunks,
+    iter_lines,
+    iter_sections,
+    line_ranges,
+    read_lines,
+    read_sections,
+    split_sections,
+)
+
+
+@pytest.fixture
+def write(tmp_path):
+    """Write bytes to a file and return its path."""
+
+    def write(data):
+        path = tmp_path / "input.txt"
+        path.write_bytes(data)
+        return path
+
+    return write
+
+
+def as_bytes(views):
+    return [bytes(view) for view in views]
+
+
+class TestMappedFile:
+    """Test zero-copy views of a mapped file."""
+
+    def test_lines(self, write):
+        with MappedFile(write(b"a\nbb\n\nc")) as mapped:
+            assert as_bytes(mapped.lines()) == [b"a", b"bb", b"", b"c"]
+
+    def test_lines_trim_crlf(self, write):
+        with MappedFile(write(b"a\r\nbb\r\n\r\nc\r")) as mapped:
+            assert as_bytes(mapped.lines()) == [b"a", b"bb", b"", b"c"]
+
+    def test_lines_keepends(self, write):
+        with MappedFile(write(b"a\r\nbb\n\nc")) as mapped:
+            assert as_bytes(mapped.lines(keepends=True)) == [b"a\r\n", b"bb\n", b"\n", b"c"]
+
+    def test_sections(self, write):
+        with MappedFile(write(b"a\nb\n\nc\n")) as mapped:
+            assert as_bytes(mapped.sections()) == [b"a\nb\n", b"c\n"]
+
+    def test_sections_skip_surrounding_and_repeated_blank_lines(self, write):
+        data = b"\n \n1-3\n\n\t\n\r\n\n5\n6\n\n\n"
+        with MappedFile(write(data)) as mapped:
+            assert as_bytes(mapped.sections()) == [b"1-3\n", b"5\n6\n"]
+
+    def test_sections_crlf(self, write):
+        with MappedFile(write(b"a\r\n\r\nb")) as mapped:
+            assert as_bytes(mapped.sections()) == [b"a\r\n", b"b"]
+
+    def test_empty_file(self, write):
+        with MappedFile(write(b"")) as mapped:
+            assert len(mapped) == 0
+            assert list(mapped.lines()) == []
+            assert list(mapped.sections()) == []
+            assert mapped.text() == ""
+
+    def test_text(self, write):
+        with MappedFile(write("héllo\n".encode())) as mapped:
+            assert mapped.text() == "héllo\n"
+            assert len(mapped) == 7
+
+    def test_close_with_live_views(self, write):
+        mapped = MappedFile(write(b"a\nb\n"))
+        lines = list(mapped.lines())
+        with pytest.raises(BufferError):
+            mapped.close()
+        del lines
+        mapped.close()
+
+
+class TestLineRanges:
+    """Test splitting a file into byte ranges of whole lines."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4, 7, 100])
+    def test_ranges_cover_whole_lines(self, write, chunk_size):
+        data = b"L68\nR5\nL130\n\nR1\n"
+        ranges = line_ranges(write(data), chunk_size)
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        assert all(stop == start for (_, stop), (start, _) in pairwise(ranges))
+        assert all(data[stop - 1 : stop] == b"\n" for _, stop in ranges)
+
+    def test_empty_file(self, write):
+        assert line_ranges(write(b""), 10) == [(0, 0)]
+
+    def test_rejects_non_positive_size(self, write):
+        with pytest.raises(ValueError, match="positive"):
+            line_ranges(write(b"a\n"), 0)
+
+
+def reference_read_lines(filepath, *, skip_empty=True, strip=True, filter_fn=None):
+    """read_lines as it was before streaming, reading the whole file at once."""
+    lines = Path(filepath).read_text(encoding="utf-8").splitlines(keepends=True)
+    if strip:
+        lines = [line.strip() for line in lines]
+    if skip_empty:
+        lines = [line for line in lines if line]
+    if filter_fn:
+        lines = [line for line in lines if filter_fn(line)]
+    return lines
+
+
+def random_text(rng):
+    pieces = ["a", "bc", "#x", " ", "\t", "\n", "\n", "\r\n", "\r", "\f", "é"]
+    return "".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+
+
+def streamed(text, chunk_size, **options):
+    return list(iter_lines(io.StringIO(text, newline=""), chunk_size=chunk_size, **options))
+
+
+class TestIterLines:
+    """Test lines that span chunk boundaries, and filtering in the same pass."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 16])
+    @pytest.mark.parametrize("text", ["ab\ncd\nef", "ab\ncd\nef\n", "\n\nab\n\n", "", "abcdef"])
+    def test_lines_across_chunks(self, chunk_size, text):
+        lines = streamed(text, chunk_size, strip=False, skip_empty=False)
+        assert lines == text.splitlines(keepends=True)
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3])
+    def test_crlf_split_across_chunks(self, chunk_size):
+        text = "a\r\nbc\r\n\r\nd\re\r"
+        lines = streamed(text, chunk_size, strip=False, skip_empty=False)
+        assert lines == ["a\r\n", "bc\r\n", "\r\n", "d\r", "e\r"]
+
+    @pytest.mark.parametrize(
+        ("options", "expected"),
+        [
+            ({}, ["a", "#b", "c"]),
+            # Unstripped, a lone line break is not empty
+            ({"strip": False}, [" a\n", "#b \n", "\n", "\t\n", "c"]),
+            ({"skip_empty": False}, ["a", "#b", "", "", "c"]),
+            ({"strip": False, "skip_empty": False}, [" a\n", "#b \n", "\n", "\t\n", "c"]),
+            ({"filter_fn": lambda line: not line.startswith("#")}, ["a", "c"]),
+            ({"skip_empty": False, "filter_fn": lambda line: line != "c"}, ["a", "#b", "", ""]),
+        ],
+    )
+    def test_options(self, options, expected):
+        assert streamed(" a\n#b \n\n\t\nc", 2, **options) == expected
+
+    def test_filter_sees_stripped_non_empty_lines(self):
+        seen = []
+        streamed(" a \n\nb", 1, filter_fn=lambda line: seen.append(line) or True)
+        assert seen == ["a", "b"]
+
+    def test_stdin(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("1\n\n2\n"))
+        assert list(iter_lines("-")) == ["1", "2"]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_read_lines_matches_reading_whole_file(self, tmp_path, seed):
+        rng = Random(seed)
+        path = tmp_path / "input.txt"
+        path.write_bytes(random_text(rng).encode())
+        for options in [
+            {},
+            {"strip": False},
+            {"skip_empty": False},
+            {"strip": False, "skip_empty": False},
+            {"filter_fn": lambda line: "#" not in line},
+        ]:
+            assert read_lines(path, **options) == reference_read_lines(path, **options)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_chunk_size_does_not_matter(self, seed):
+        text = random_text(Random(seed))
+        whole = streamed(text, 1 << 16, strip=False, skip_empty=False)
+        for chunk_size in (1, 2, 3, 5):
+            assert streamed(text, chunk_size, strip=False, skip_empty=False) == whole
+
+
+class TestIterChunks:
+    """Test blocks of whole lines."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+    @pytest.mark.parametrize("text", ["ab\ncd\n\nefg\nh", "ab\ncd\n", "abcdefgh", ""])
+    def test_blocks_end_on_line_breaks(self, chunk_size, text):
+        blocks = list(iter_chunks(io.StringIO(text), chunk_size=chunk_size))
+        assert "".join(blocks) == text
+        assert all(blocks)
+        assert all(block.endswith("\n") for block in blocks[:-1])
+
+    def test_stdin(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("1\n2\n3"))
+        assert "".join(iter_chunks("-", chunk_size=2)) == "1\n2\n3"
+
+
+def as_lists(sections):
+    return [list(section) for section in sections]
+
+
+class TestSplitSections:
+    """Test splitting lines on blank lines into lazy sections."""
+
+    def test_sections(self):
+        assert as_lists(split_sections(["a", "b", "", "c"])) == [["a", "b"], ["c"]]
+
+    def test_leading_trailing_and_repeated_blank_lines(self):
+        lines = ["", "", "a", "", "", "", "b", "c", "", ""]
+        assert as_lists(split_sections(lines)) == [["a"], ["b", "c"]]
+
+    def test_whitespace_only_separators(self):
+        lines = ["a", " \t", "b", "\n", "\r\n", "c"]
+        assert as_lists(split_sections(lines)) == [["a"], ["b"], ["c"]]
+
+    @pytest.mark.parametrize("lines", [[], [""], ["", " ", "\t"]])
+    def test_no_sections(self, lines):
+        assert as_lists(split_sections(lines)) == []
+
+    @pytest.mark.parametrize("taken", [0, 1, 2])
+    def test_partly_consumed_section_is_skipped(self, taken):
+        sections = split_sections(["a", "b", "c", "", "d", "e"])
+        first = next(sections)
+        assert [next(first) for _ in range(taken)] == ["a", "b", "c"][:taken]
+        assert list(next(sections)) == ["d", "e"]
+        assert next(sections, None) is None
+
+    def test_lazy(self):
+        read = []
+
+        def lines():
+            for line in ["a", "", "b", "", "c"]:
+                read.append(line)
+                yield line
+
+        sections = split_sections(lines())
+        assert list(next(sections)) == ["a"]
+        # The separator ending the first section is read, but nothing after it
+        assert read == ["a", ""]
+        assert list(next(sections)) == ["b"]
+        assert read == ["a", "", "b", ""]
+
+
+class TestIterSections:
+    """Test reading sections from a stream."""
+
+    def test_sections(self):
+        text = "\n1-3\n5-8\n \n\n10\n12\n\n"
+        assert read_sections(io.StringIO(text)) == [["1-3", "5-8"], ["10", "12"]]
+
+    def test_unstripped(self):
+        text = " a\n\t\nb \n"
+        assert read_sections(io.StringIO(text), strip=False) == [[" a\n"], ["b \n"]]
+
+    def test_reads_next_section_only_when_requested(self):
+        stream = io.StringIO("a\nb\n\n" + "c\n" * 1000)
+        sections = iter_sections(stream, chunk_size=2)
+        assert list(next(sections)) == ["a", "b"]
+        # Up to the separator, and at most a chunk past it
+        assert stream.tell() <= len("a\nb\n\n") + 2
+        assert len(list(next(sections))) == 1000
+
+    def test_stdin(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("1\n\n2\n3\n"))
+        assert as_lists(iter_sections("-")) == [["1"], ["2", "3"]]
@@ -0,0 +1,113 @@
+"""Tests for dense character matrices."""
+
+from random import Random
+
+import pytest
+
+from utils import matrix
+from utils.matrix import CharMatrix
+
+# A worksheet whose rows were right-trimmed, so they are ragged
+WORKSHEET = ["123 328  51 64", " 45 64  387 23", "  6 98  215 314", "*   +   *   +"]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def backend(request, monkeypatch):
+    """Run a test with a NumPy array, and again with a bytearray."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(matrix, "np", None)
+    return request.param
+
+
+def random_lines(rng):
+    return [
+        "".join(rng.choice(" ab") for _ in range(rng.randint(0, 9)))
+        for _ in range(rng.randint(1, 6))
+    ]
+
+
+def summary(block):
+    """Everything observable about a matrix, as plain values."""
+    return {
+        "shape": block.shape,
+        "lines": block.lines(),
+        "columns": [block.column(index).tobytes() for index in range(block.width)],
+        "blank": block.blank_columns(),
+    }
+
+
+@pytest.mark.usefixtures("backend")
+class TestCharMatrix:
+    """Test both storage backends."""
+
+    def test_ragged_rows_are_padded(self):
+        block = CharMatrix.from_lines(WORKSHEET)
+        assert block.shape == (4, 15)
+        assert block.lines()[3] == "*   +   *   +  "
+        assert block.row(0).tobytes() == b"123 328  51 64 "
+
+    def test_fill_and_line_endings(self):
+        block = CharMatrix.from_lines(["ab\r\n", b"c\n", ""], fill=".")
+        assert block.lines() == ["ab", "c.", ".."]
+
+    def test_from_text(self):
+        assert CharMatrix.from_text("ab\ncde\n").lines() == ["ab ", "cde"]
+
+    def test_column(self):
+        block = CharMatrix.from_lines(WORKSHEET)
+        assert block.column(2).tobytes() == b"356 "
+        assert block.column(14).tobytes() == b"  4 "
+
+    def test_blank_columns(self):
+        block = CharMatrix.from_lines(WORKSHEET)
+        assert block.blank_columns() == [3, 7, 11]
+
+    def test_right_padding_counts_as_blank(self):
+        block = CharMatrix.from_lines(["a ", "b"])
+        assert block.blank_columns() == [1]
+
+    def test_no_blank_columns(self):
+        assert CharMatrix.from_lines(["ab", " c", "d "]).blank_columns() == []
+
+    def test_columns(self):
+        block = CharMatrix.from_lines(WORKSHEET).columns(4, 7)
+        assert block.shape == (4, 3)
+        assert block.lines() == ["328", "64 ", "98 ", "+  "]
+
+    @pytest.mark.parametrize(("start", "stop", "width"), [(12, 99, 3), (15, 20, 0), (3, 3, 0)])
+    def test_columns_clipped(self, start, stop, width):
+        assert CharMatrix.from_lines(WORKSHEET).columns(start, stop).shape == (4, width)
+
+    def test_transpose(self):
+        block = CharMatrix.from_lines(["abc", "de"])
+        assert block.transpose().lines() == ["ad", "be", "c "]
+        assert block.transpose().transpose().lines() == block.lines()
+
+    def test_column_block_transposed(self):
+        block = CharMatrix.from_lines(WORKSHEET).columns(8, 11).transpose()
+        assert block.lines() == [" 32*", "581 ", "175 "]
+        assert block.blank_columns() == []
+
+    def test_empty(self):
+        block = CharMatrix.from_lines([])
+        assert block.shape == (0, 0)
+        assert block.lines() == []
+        assert block.blank_columns() == []
+        assert block.transpose().shape == (0, 0)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_backends_agree(monkeypatch, seed):
+    pytest.importorskip("numpy")
+    lines = random_lines(Random(seed))
+
+    def everything():
+        block = CharMatrix.from_lines(lines)
+        half = block.width // 2
+        return [summary(block), summary(block.columns(1, half)), summary(block.transpose())]
+
+    fast = everything()
+    monkeypatch.setattr(matrix, "np", None)
+    assert fast == everything()
@@ -0,0 +1,109 @@
+"""Tests for bulk integer and record parsing."""
+
+import io
+
+import pytest
+
+from utils import parsing
+from utils.parsing import INT64_MAX, ints, parse_records
+
+ROTATION = "{direction:c}{distance:d}"
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy columns, and again with the array fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(parsing, "np", None)
+    return request.param
+
+
+def columns(text, schema=ROTATION):
+    parsed = parse_records(io.StringIO(text), schema)
+    return {name: list(column) for name, column in parsed.items()}
+
+
+@pytest.mark.usefixtures("backend")
+class TestParseRecords:
+    """Test streaming lines into typed columns."""
+
+    def test_match(self):
+        assert columns("L68\nR5\n") == {"direction": ["L", "R"], "distance": [68, 5]}
+
+    def test_surrounding_blanks(self):
+        assert columns("  L68\t\nR5  ")["distance"] == [68, 5]
+
+    def test_crlf(self):
+        assert columns("L68\r\nR5\r\n") == {"direction": ["L", "R"], "distance": [68, 5]}
+
+    def test_blank_lines(self):
+        assert columns("\nL68\n\r\n \nR5\n\n")["distance"] == [68, 5]
+
+    def test_mismatch(self):
+        with pytest.raises(ValueError, match=r"Line 2 does not match .*'R'"):
+            columns("L68\nR\n")
+
+    @pytest.mark.parametrize("ending", ["\f", "\xa0", "\v"])
+    def test_other_whitespace_is_not_dropped(self, ending):
+        with pytest.raises(ValueError, match="Line 2 does not match"):
+            columns(f"L68\nR5{ending}\n")
+
+    def test_line_numbers_span_blocks(self, monkeypatch):
+        monkeypatch.setattr(parsing, "RECORD_BLOCK_SIZE", 8)
+        with pytest.raises(ValueError, match="Line 5 does not match"):
+            columns("L1\nR2\nL3\nR4\nbad\nL6\n")
+
+    def test_fields(self):
+        parsed = columns("1,-2.5,a b\n3,4e1,c\n", "{x:d},{y:f},{name:s}")
+        assert parsed == {"x": [1, 3], "y": [-2.5, 40.0], "name": ["a b", "c"]}
+
+
+class TestInts:
+    """Test that both integer backends agree."""
+
+    @staticmethod
+    def both(monkeypatch, buffer, arity=None):
+        pytest.importorskip("numpy")
+        fast = ints(buffer, arity).tolist()
+        monkeypatch.setattr(parsing, "np", None)
+        return fast, ints(buffer, arity).tolist()
+
+    @pytest.mark.parametrize(
+        "buffer",
+        [
+            "",
+            "no digits",
+            "1-5,-3 and 007",
+            f"{10**18}-{INT64_MAX} -{INT64_MAX + 1}",
+            b"12 -34\n56",
+        ],
+    )
+    def test_backends_agree(self, monkeypatch, buffer):
+        fast, fallback = self.both(monkeypatch, buffer)
+        assert fast == fallback
+
+    def test_leading_zeros_beyond_nineteen_digits(self, monkeypatch):
+        fast, fallback = self.both(monkeypatch, f"{'0' * 30}42 -{'0' * 5}{INT64_MAX} 000", 3)
+        assert fast == fallback == [[42, -INT64_MAX, 0]]
+
+    def test_nineteen_digits(self, monkeypatch):
+        fast, fallback = self.both(monkeypatch, f"{10**18},{INT64_MAX}", 2)
+        assert fast == fallback == [[10**18, INT64_MAX]]
+
+    @pytest.mark.parametrize(
+        "number", [INT64_MAX + 1, -INT64_MAX - 2, 10**19, 10**25, f"000{INT64_MAX + 1}"]
+    )
+    def test_too_large(self, monkeypatch, number):
+        with pytest.raises(OverflowError):
+            ints(f"1 {number}")
+        monkeypatch.setattr(parsing, "np", None)
+        with pytest.raises(OverflowError):
+            ints(f"1 {number}")
+
+    @pytest.mark.usefixtures("backend")
+    def test_arity(self):
+        assert ints("1-2,3-4", 2).tolist() == [[1, 2], [3, 4]]
+        with pytest.raises(ValueError, match="rows of 2"):
+            ints("1 2 3", 2)
@@ -0,0 +1,80 @@
+"""Tests for grid search helpers."""
+
+import pytest
+
+from utils import utils
+from utils.utils import equals, find_cells, iterate_over_grid, one_of
+
+GRID = ["..@.", "@@..", "...@"]
+ROLLS = [(0, 2), (1, 0), (1, 1), (2, 3)]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy results, and again with memoryviews."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(utils, "np", None)
+    return request.param
+
+
+def coordinates(found):
+    return [tuple(cell) for cell in found.tolist()]
+
+
+@pytest.mark.usefixtures("backend")
+class TestFindCells:
+    """Test locating cells on both result backends."""
+
+    def test_equal_rows(self):
+        assert coordinates(find_cells(GRID, "@")) == ROLLS
+
+    def test_ragged_rows(self):
+        assert coordinates(find_cells(["@", "..@@", "", "@."], "@")) == [
+            (0, 0),
+            (1, 2),
+            (1, 3),
+            (3, 0),
+        ]
+
+    def test_non_string_rows(self):
+        grid = [[0, 1, 1], (1, 0), [2, 1, 0]]
+        assert coordinates(find_cells(grid, {1})) == [(0, 1), (0, 2), (1, 0), (2, 1)]
+
+    def test_non_ascii_rows(self):
+        assert coordinates(find_cells(["é@", "@é"], "@")) == [(0, 1), (1, 0)]
+
+    def test_several_values(self):
+        assert coordinates(find_cells(["ab", "ca"], ["a", "c"])) == [(0, 0), (1, 0), (1, 1)]
+
+    def test_conditions(self):
+        assert coordinates(find_cells(GRID, equals("@"))) == ROLLS
+        assert coordinates(find_cells(["ab", "ca"], one_of("bc"))) == [(0, 1), (1, 0)]
+
+    @pytest.mark.parametrize("grid", [GRID, [], ["", ""], [[1, 2]]])
+    def test_empty_result(self, grid):
+        found = find_cells(grid, "#")
+        assert len(found) == 0
+        assert coordinates(found) == []
+
+    def test_shape(self):
+        assert find_cells(GRID, "@").shape == (len(ROLLS), 2)
+
+
+class TestIterateOverGrid:
+    """Test that conditions searched a row at a time match calling them."""
+
+    @pytest.mark.parametrize(
+        "condition",
+        [equals("@"), one_of("@."), one_of(["@", "x"]), equals(1)],
+    )
+    def test_matches_calling_condition(self, condition):
+        for grid in (GRID, ["@", "..@@", ""], [[1, "@"], [0, 1]]):
+            expected = [
+                (row, col)
+                for row, line in enumerate(grid)
+                for col, cell in enumerate(line)
+                if condition(cell)
+            ]
+            assert list(iterate_over_grid(grid, condition)) == expected
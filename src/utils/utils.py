@@ -1,10 +1,18 @@
-from collections.abc import Callable, Iterable, Sequence
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import chain, compress, repeat
 from typing import TypeVar
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 T = TypeVar("T")
 Coordinate = tuple[int, int]
 Line = tuple[Coordinate, Coordinate]
-Grid = Sequence[Sequence[T]]
+GridLike = Sequence[Sequence[T]]
 
 
 def map_range(range_str: str) -> tuple[int, int]:
@@ -19,10 +27,102 @@ def map_coordinate(coord_str: str) -> Coordinate:
     return int(x_str), int(y_str)
 
 
+@dataclass(frozen=True)
+class CellCondition:
+    """A condition that holds for cells equal to one of a set of values."""
+
+    values: frozenset
+
+    def __call__(self, element: object) -> bool:
+        return element in self.values
+
+
+def equals(value: object) -> CellCondition:
+    """Match cells equal to value, in a form grid searches can run without calling it."""
+    return CellCondition(frozenset((value,)))
+
+
+def one_of(values: Iterable) -> CellCondition:
+    """Match cells equal to any of values, in a form grid searches can run without calling it."""
+    return CellCondition(frozenset(values))
+
+
+def _columns_by_row(grid: GridLike, targets: frozenset) -> Iterator[list[int]]:
+    """Yield, for each row, the columns of cells in targets, searching text rows in C."""
+    codes = {ord(value) for value in targets if isinstance(value, str) and len(value) == 1}
+    # Marks each target byte with 1, so compress() can pick out their columns
+    marks = bytes(code in codes for code in range(256)) if len(codes) == len(targets) else None
+    for row in grid:
+        encoded = row.encode() if marks and isinstance(row, str) else b""
+        if encoded and len(encoded) == len(row):
+            yield list(compress(range(len(encoded)), encoded.translate(marks)))
+        else:
+            yield [col_idx for col_idx, element in enumerate(row) if element in targets]
+
+
+def _numpy_cells(grid: GridLike, targets: frozenset) -> tuple | None:
+    """Find cells in one vectorised pass, if the grid is equally long rows of ASCII text."""
+    if not grid or not all(isinstance(row, str) for row in grid):
+        return None
+    if len({len(row) for row in grid}) != 1:
+        return None
+    if not targets or not all(isinstance(value, str) and value.isascii() for value in targets):
+        return None
+    buffer = "".join(grid).encode()
+    wanted = "".join(targets).encode()
+    if len(buffer) != len(grid) * len(grid[0]) or len(wanted) != len(targets):
+        return None
+    codes = np.frombuffer(buffer, np.uint8).reshape(len(grid), -1)
+    found = np.isin(codes, np.frombuffer(wanted, np.uint8))
+    return tuple(indices.astype(np.int64) for indices in np.nonzero(found))
+
+
+def find_cells(grid: GridLike, values: Iterable | CellCondition):
+    """
+    Locate every cell equal to one of values, without a Python call per cell.
+
+    Values may also be given as a condition made with equals or one_of.
+
+    Rows of text are searched with a byte translation, or all at once with
+    NumPy when they are equally long ASCII; other grids are compared cell by
+    cell.
+
+    Returns:
+        An (n, 2) integer array of (row, col) coordinates in row-major order,
+        a NumPy array when NumPy is installed and a memoryview otherwise
+    """
+    targets = values.values if isinstance(values, CellCondition) else frozenset(values)
+    if np is not None and (cells := _numpy_cells(grid, targets)) is not None:
+        return np.column_stack(cells)
+
+    rows, cols = array("q"), array("q")
+    for row_idx, found in enumerate(_columns_by_row(grid, targets)):
+        cols.extend(found)
+        rows.extend(array("q", [row_idx]) * len(found))
+    if np is not None:
+        return np.column_stack((rows, cols)).astype(np.int64)
+    flat = array("q", [0]) * (2 * len(rows))
+    if not flat:
+        # memoryview cannot take a shape with a zero in it
+        return memoryview(flat)
+    flat[0::2], flat[1::2] = rows, cols
+    return memoryview(flat).cast("B").cast("q", [len(rows), 2])
+
+
 def iterate_over_grid[T](
-    grid: Grid, condition: Callable[[T], bool] | None = None
+    grid: GridLike, condition: Callable[[T], bool] | None = None
 ) -> Iterable[Coordinate]:
-    """Iterate over a 2D grid and yield coordinates of elements satisfying the given condition."""
+    """
+    Iterate over a 2D grid and yield coordinates of elements satisfying the given condition.
+
+    Conditions made with equals or one_of are searched for a row at a time, as
+    find_cells does, instead of being called on every element.
+    """
+    if isinstance(condition, CellCondition):
+        return chain.from_iterable(
+            zip(repeat(row_idx), found)
+            for row_idx, found in enumerate(_columns_by_row(grid, condition.values))
+        )
     return (
         (row_idx, col_idx)
         for row_idx, row in enumerate(grid)
@@ -31,6 +131,6 @@ def iterate_over_grid[T](
     )
 
 
-def get_grid_size(grid: Grid) -> tuple[int, int]:
+def get_grid_size(grid: GridLike) -> tuple[int, int]:
     """Get the size of the grid as (number of rows, number of columns)."""
     return len(grid), len(grid[0])